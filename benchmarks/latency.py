@@ -0,0 +1,86 @@
+"""Measure end-to-end operation latency against the simulated device.
+
+The simulator adds LATENCY plus up to JITTER seconds to every connect, read
+and write, which roughly models a BLE link with a short connection interval.
+"""
+
+import asyncio
+import json
+import statistics
+import time
+from collections.abc import Awaitable
+from typing import Callable
+
+from pyfreshintellivent import FreshIntelliVent
+from pyfreshintellivent.simulator import SimulatedBleakClient, SimulatedSkyDevice
+
+ROUNDS = 50
+LATENCY = 0.0075
+JITTER = 0.005
+SEED = 1
+
+
+def percentiles(samples: list[float]) -> dict[str, float]:
+    """Return latency percentiles in milliseconds."""
+    cuts = statistics.quantiles(samples, n=100, method="inclusive")
+    return {
+        "p50": round(cuts[49] * 1000, 3),
+        "p90": round(cuts[89] * 1000, 3),
+        "p99": round(cuts[98] * 1000, 3),
+        "max": round(max(samples) * 1000, 3),
+    }
+
+
+async def timed(
+    samples: list[float], operation: Callable[[], Awaitable[object]]
+) -> None:
+    start = time.perf_counter()
+    await operation()
+    samples.append(time.perf_counter() - start)
+
+
+async def run() -> dict[str, dict[str, float]]:
+    device = SimulatedSkyDevice(latency=LATENCY, jitter=JITTER, seed=SEED)
+    samples: dict[str, list[float]] = {
+        "connect": [],
+        "authenticate": [],
+        "fetch_all": [],
+        "update": [],
+    }
+
+    for index in range(ROUNDS):
+        sky = FreshIntelliVent(device.ble_device, client_class=SimulatedBleakClient)
+        await timed(samples["connect"], sky.connect)
+        await timed(
+            samples["authenticate"],
+            lambda sky=sky: sky.authenticate(device.authentication_code),
+        )
+        await timed(samples["fetch_all"], sky.fetch_all)
+        await timed(
+            samples["update"],
+            lambda sky=sky, index=index: sky.update_boost(
+                enabled=index % 2 == 0, rpm=2400, seconds=600
+            ),
+        )
+        await sky.disconnect()
+
+    return {name: percentiles(values) for name, values in samples.items()}
+
+
+def main() -> None:
+    results = asyncio.run(run())
+    print(
+        json.dumps(
+            {
+                "rounds": ROUNDS,
+                "latency": LATENCY,
+                "jitter": JITTER,
+                "milliseconds": results,
+            },
+            indent=2,
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""Measure the memory footprint of the state held for one device."""
+
+import json
+import tracemalloc
+from typing import Any, Callable
+
+from bleak.backends.device import BLEDevice
+
+from pyfreshintellivent import FreshIntelliVent
+from pyfreshintellivent.sensors import SkySensors
+
+DEVICES = 1000
+
+FRAMES = {
+    "humidity": "01022003",
+    "light_and_voc": "01010101",
+    "constant_speed": "012003",
+    "timer": "050102E803",
+    "airing": "01001a2003",
+    "pause": "0105",
+    "boost": "0160095802",
+}
+SENSOR_FRAME = "01003702E60Abd01D204040B001c00"
+
+
+def build_device(index: int) -> FreshIntelliVent:
+    device = FreshIntelliVent(BLEDevice(f"00:00:00:00:{index:04X}", None, None))
+    device.sensors = SkySensors.from_bytes(bytes.fromhex(SENSOR_FRAME))
+    for name, value in FRAMES.items():
+        device.state.set(
+            name, getattr(device.parser, f"{name}_read")(bytes.fromhex(value))
+        )
+    return device
+
+
+def build_state(index: int) -> tuple[SkySensors, dict[str, Any]]:
+    device = build_device(index)
+    return device.sensors, device.modes
+
+
+def measure(build: Callable[[int], Any]) -> int:
+    build(0)
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    kept = [build(i) for i in range(DEVICES)]
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+
+    total = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+    del kept
+    return round(total / DEVICES)
+
+
+def main() -> None:
+    print(
+        json.dumps(
+            {
+                "devices": DEVICES,
+                "bytes_per_device": measure(build_device),
+                "state_bytes_per_device": measure(build_state),
+            },
+            indent=2,
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""Measure the throughput of the mode codecs and sensor frame decoding."""
+
+import json
+import timeit
+from typing import Any, Callable
+
+from pyfreshintellivent.parser import SkyModeParser
+from pyfreshintellivent.sensors import SkySensors
+
+NUMBER = 20000
+REPEAT = 5
+
+READS = {
+    "airing": "01001a2003",
+    "boost": "0160095802",
+    "constant_speed": "012003",
+    "humidity": "01022003",
+    "light_and_voc": "01010101",
+    "pause": "0105",
+    "timer": "050102E803",
+}
+WRITES: dict[str, dict[str, Any]] = {
+    "airing": {"enabled": True, "minutes": 30, "rpm": 800},
+    "boost": {"enabled": True, "rpm": 2400, "seconds": 600},
+    "constant_speed": {"enabled": True, "rpm": 1200},
+    "humidity": {"enabled": True, "detection": "Medium", "rpm": 800},
+    "light_and_voc": {
+        "light_enabled": True,
+        "light_detection": "Low",
+        "voc_enabled": True,
+        "voc_detection": "High",
+    },
+    "pause": {"enabled": True, "minutes": 10},
+    "temporary_speed": {"enabled": True, "rpm": 1500},
+    "timer": {"minutes": 5, "delay_enabled": True, "delay_minutes": 2, "rpm": 1000},
+}
+SENSOR_FRAME = "01003702E60Abd01D204040B001c00"
+
+
+def ops_per_second(func: Callable[[], Any]) -> float:
+    """Return the best of REPEAT runs of func, in calls per second."""
+    best = min(timeit.repeat(func, number=NUMBER, repeat=REPEAT))
+    return round(NUMBER / best)
+
+
+def parse_sensors(data: bytes) -> SkySensors:
+    return SkySensors.from_bytes(data)
+
+
+def main() -> None:
+    parser = SkyModeParser()
+    results: dict[str, float] = {}
+
+    for name, value in READS.items():
+        read = getattr(parser, f"{name}_read")
+        data = bytes.fromhex(value)
+        results[f"{name}_read"] = ops_per_second(
+            lambda read=read, data=data: read(data)
+        )
+
+    for name, kwargs in WRITES.items():
+        write = getattr(parser, f"{name}_write")
+        results[f"{name}_write"] = ops_per_second(
+            lambda write=write, kwargs=kwargs: write(**kwargs)
+        )
+
+    frame = bytes.fromhex(SENSOR_FRAME)
+    results["sensors_parse"] = ops_per_second(lambda: parse_sensors(frame))
+
+    print(
+        json.dumps(
+            {"number": NUMBER, "repeat": REPEAT, "ops_per_second": results},
+            indent=2,
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
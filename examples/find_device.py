@@ -5,8 +5,8 @@ from pyfreshintellivent import scanner
 
 async def main():
     print("Scanning, please wait...")
-    device = await scanner.scan()
-    print(f"Found device: {device}")
+    async for advertisement in scanner.discover(timeout=20.0):
+        print(f"Found device: {advertisement.device} (RSSI {advertisement.rssi})")
 
 
 if __name__ == "__main__":
@@ -2,9 +2,7 @@ import asyncio
 import logging
 import sys
 
-from bleak import BleakScanner
-
-from pyfreshintellivent import FreshIntelliVent
+from pyfreshintellivent import FreshIntelliVent, FreshIntelliventError
 
 logging.basicConfig(level=logging.INFO)
 
@@ -18,14 +16,12 @@ async def main():
     if len(sys.argv) == 3:
         authentication_code = sys.argv[2]
 
-    ble_device = await BleakScanner.find_device_by_address(address)
-
-    if ble_device is None:
-        logging.warn("Couldn't find the device")
+    try:
+        client = await FreshIntelliVent.from_address(address)
+    except FreshIntelliventError:
+        logging.warning("Couldn't find the device")
         return
 
-    client = FreshIntelliVent(ble_device)
-
     try:
         await client.connect()
 
@@ -36,26 +32,17 @@ async def main():
         else:
             await client.authenticate(authentication_code=authentication_code)
 
-        sensors = await client.fetch_sensor_data()
-        logging.info(f"Status: {sensors.as_dict()}")
-
-        boost = await client.fetch_boost()
-        logging.info(f"Boost: {boost}")
-
-        constant_speed = await client.fetch_constant_speed()
-        logging.info(f"Constant speed: {constant_speed}")
-
-        humidity = await client.fetch_humidity()
-        logging.info(f"Humidity: {humidity}")
-
-        light_and_voc = await client.fetch_light_and_voc()
-        logging.info(f"Light and VOC: {light_and_voc}")
-
-        pause = await client.fetch_pause()
-        logging.info(f"Pause: {pause}")
-
-        timer = await client.fetch_timer()
-        logging.info(f"Timer: {timer}")
+        snapshot = await client.fetch_all()
+        logging.info(f"Status: {snapshot.sensors.as_dict()}")
+        for name, mode in snapshot.modes.items():
+            logging.info(f"{name}: {mode}")
+        # With a concurrency of 1 the reads do not overlap, so both are
+        # about the same; a higher concurrency lets the BLE stack overlap them.
+        logging.info(
+            f"Read in {snapshot.elapsed:.3f}s with concurrency "
+            f"{client.operations.concurrency} "
+            f"({snapshot.sequential_time:.3f}s of summed read latency)"
+        )
     except Exception as e:
         await client.disconnect()
         logging.error(e)
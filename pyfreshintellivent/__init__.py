@@ -1,21 +1,73 @@
 """Python interface for Fresh Intellivent Sky bathroom ventilation fan."""
 
+# pylint: disable=too-many-lines
+
 from __future__ import annotations
 
 import asyncio
+import functools
+import itertools
 import logging
-from typing import Any, Union
+import time
+from collections.abc import AsyncGenerator, AsyncIterator
+from contextlib import AbstractAsyncContextManager, nullcontext, suppress
+from typing import Any, Callable, Union
 from uuid import UUID
 
 from bleak import BleakClient
+from bleak.backends.characteristic import BleakGATTCharacteristic
 from bleak.backends.device import BLEDevice
-from bleak.exc import BleakError
+from bleak.exc import BleakCharacteristicNotFoundError, BleakError
 from bleak_retry_connector import establish_connection
 
 from . import characteristics
 from . import helpers as h
+from .capture import CaptureWriter
+from .coalescer import WriteCoalescer
+from .codec import CODECS, CharacteristicCodec
+from .device_cache import DeviceCache
+from .device_info import DeviceInfo, DeviceInfoCache
+from .events import ChangeDetector, SensorEvent, detect_changes
+from .history import SensorHistory
+from .metrics import Metrics
+from .modes import (
+    AiringMode,
+    BoostMode,
+    ConstantSpeedMode,
+    HumidityMode,
+    LightAndVocMode,
+    ModeSettings,
+    PauseMode,
+    TimerMode,
+)
+from .operations import PRIORITY_READ, PRIORITY_WRITE, OperationQueue
 from .parser import SkyModeParser
 from .sensors import SkySensors
+from .service_cache import ServiceCache
+from .snapshot import SkySnapshot
+from .state import StateStore
+
+# Delays between reads of the authenticated flag, the last one repeats.
+_AUTH_POLL_DELAYS = (0.05, 0.1, 0.2, 0.4)
+
+# First delay between session reconnect attempts, doubled after each failure.
+_RECONNECT_DELAY = 1.0
+
+# GATT protocol errors meaning the cached services are stale: invalid handle,
+# attribute not found and database out of sync.
+_STALE_GATT_ERROR_CODES = (0x01, 0x0A, 0x12)
+
+# Order in which reconcile() writes modes, overrides that change what the fan
+# is doing right now go last.
+_RECONCILE_ORDER = (
+    "humidity",
+    "light_and_voc",
+    "constant_speed",
+    "timer",
+    "airing",
+    "pause",
+    "boost",
+)
 
 
 # pylint: disable=too-many-instance-attributes,too-many-public-methods
@@ -30,30 +82,282 @@ class FreshIntelliVent:
     sw_version: str | None
     _connected = False
     _client: BleakClient | None
-    modes: dict[str, Any] = {}
-    sensors = SkySensors()
 
-    def __init__(self, ble_device: BLEDevice) -> None:
+    def __init__(  # pylint: disable=too-many-arguments,too-many-positional-arguments
+        self,
+        ble_device: BLEDevice,
+        cache_ttl: float = 0.0,
+        coalesce_window: float | None = None,
+        history: SensorHistory | None = None,
+        capture: CaptureWriter | None = None,
+        client_class: type[BleakClient] = BleakClient,
+        metrics: Metrics | None = None,
+        service_cache: ServiceCache | None = None,
+        device_info_cache: DeviceInfoCache | None = None,
+        concurrency: int = 1,
+    ) -> None:
+        """Create a device handler.
+
+        Mode settings fetched or written within cache_ttl seconds are served
+        from the state store instead of being read from the device again.
+        If coalesce_window is set, mode updates are held back for that many
+        seconds and only the latest value per characteristic is written; the
+        update_* methods return False for the updates superseded this way.
+        Every sensor sample read or streamed is appended to history, and all
+        raw reads, writes and notifications are recorded to capture, if given.
+        Connections are made with client_class, e.g. the SimulatedBleakClient
+        from the simulator module. Operation counts, failures and latencies
+        are recorded to metrics, if given. Reads and writes go through the
+        operations queue, at most concurrency at a time and with writes ahead
+        of waiting reads. The default of 1 sends them one by one, as some BLE
+        stacks handle; raise it to let batched reads overlap.
+        With a service_cache, the BLE stack's cached GATT services are only
+        used while they are known to be good. Device information is kept in
+        device_info_cache, if given.
+        """
         self.parser = SkyModeParser()
+        self.state = StateStore(ttl=cache_ttl)
+        self.sensors = SkySensors()
+        self.history = history
+        self.capture = capture
+        self.metrics = metrics
+        self.operations = OperationQueue(concurrency=concurrency)
+        self.service_cache = service_cache
+        self.device_info_cache = device_info_cache
+        self.coalescer: WriteCoalescer | None = None
+        if coalesce_window is not None:
+            self.coalescer = WriteCoalescer(
+                self._write_characteristic, window=coalesce_window
+            )
 
         self.address = ble_device.address
         self._ble_device = ble_device
+        self._client_class = client_class
 
         self._client: BleakClient | None = None
 
+        self._session = False
+        self._session_code: Union[bytes, bytearray, str, None] = None
+        self._session_timeout = 30.0
+        self._session_backoff = 60.0
+        self._session_ready = asyncio.Event()
+        self._keepalive_task: asyncio.Task[None] | None = None
+        self._reconnect_task: asyncio.Task[None] | None = None
+        self._establishing: asyncio.Task[Any] | None = None
+        self._status_queues: set[asyncio.Queue[bytearray]] = set()
+
+    @classmethod
+    async def from_address(
+        cls,
+        address: str,
+        cache: DeviceCache | None = None,
+        timeout: float = 20.0,
+        **kwargs: Any,
+    ) -> FreshIntelliVent:
+        """Create a device handler from an address.
+
+        The BLEDevice is taken from the cache when possible and only scanned
+        for on a cache miss. Other keyword arguments are passed on to the
+        constructor.
+        """
+        if cache is None:
+            cache = DeviceCache()
+        ble_device = await cache.async_get_device(address, timeout=timeout)
+        if ble_device is None:
+            raise FreshIntelliventError(f"Device {address} not found")
+        return cls(ble_device, **kwargs)
+
+    @property
+    def modes(self) -> dict[str, Any]:
+        """Return the last known mode settings."""
+        return self.state.as_dict()
+
+    @property
+    def is_connected(self) -> bool:
+        """Return True if there is an active connection to the device."""
+        return self._client is not None and self._client.is_connected
+
     async def connect(
         self, timeout: float = 30.0  # pylint: disable=unused-argument
     ) -> None:
         """Connect to the device."""
-        self._client = await establish_connection(
-            BleakClient, self._ble_device, self._ble_device.address
-        )
+        use_cache = True
+        if self.service_cache is not None:
+            use_cache = self.service_cache.use_cache(self.address)
+
+        start = time.monotonic()
+        try:
+            self._client = await establish_connection(
+                self._client_class,
+                self._ble_device,
+                self._ble_device.address,
+                disconnected_callback=self._on_disconnected,
+                use_services_cache=use_cache,
+            )
+        except Exception as exc:
+            self._record("connect", start, error=exc)
+            raise
+        self._record("connect", start)
+
+        if self.service_cache is not None:
+            cached = self.service_cache.get(self.address)
+            if cached is None or not cached.valid:
+                self.service_cache.add(
+                    self.address, firmware=cached.firmware if cached else None
+                )
         self._connected = True
 
         logging.debug("Connected to %s", self._ble_device.address)
 
+    async def start_session(
+        self,
+        authentication_code: Union[bytes, bytearray, str, None] = None,
+        keepalive_interval: float | None = 60.0,
+        reconnect_timeout: float = 30.0,
+        max_backoff: float = 60.0,
+    ) -> None:
+        """Connect and keep the connection up until disconnect() is called.
+
+        Disconnects are detected through the disconnected callback, after
+        which the device is reconnected and re-authenticated in the background
+        with exponential backoff up to max_backoff seconds. Reads and writes
+        issued while reconnecting wait up to reconnect_timeout for the link
+        to be connected and authenticated again, and running sensor streams
+        are subscribed to notifications again. If keepalive_interval is set,
+        sensor data is read at that interval to detect a silently dropped
+        link.
+        """
+        self._session_code = authentication_code
+        self._session_timeout = reconnect_timeout
+        self._session_backoff = max_backoff
+        self._session = True
+
+        try:
+            await self._establish_session()
+        except BaseException:
+            self._session = False
+            raise
+        self._session_ready.set()
+
+        if keepalive_interval:
+            self._keepalive_task = asyncio.create_task(
+                self._keepalive(keepalive_interval)
+            )
+
+    async def _establish_session(self) -> None:
+        """Connect and authenticate with the session settings.
+
+        Other tasks wait in _get_client() until this is done. If it fails
+        after connecting, the half set up connection is closed.
+        """
+        self._establishing = asyncio.current_task()
+        try:
+            await self.connect()
+            try:
+                if self._session_code is not None:
+                    await self.authenticate(self._session_code)
+                if self._status_queues:
+                    await self._resubscribe_status()
+            except BaseException:
+                client, self._client = self._client, None
+                self._connected = False
+                if client is not None:
+                    with suppress(BleakError):
+                        await client.disconnect()
+                raise
+        finally:
+            self._establishing = None
+
+    def _on_disconnected(self, client: BleakClient) -> None:
+        """Handle an unexpected disconnect from the device."""
+        if client is not self._client:
+            return
+
+        logging.debug("Lost connection to %s", self.address)
+        self._client = None
+        self._connected = False
+        if self._session and self._reconnect_task is None:
+            self._session_ready.clear()
+            self._reconnect_task = asyncio.create_task(self._reconnect())
+
+    async def _reconnect(self) -> None:
+        """Reconnect to the device with exponential backoff."""
+        delay = _RECONNECT_DELAY
+        try:
+            while self._session:
+                try:
+                    await self._establish_session()
+                except (BleakError, FreshIntelliventError, TimeoutError) as exc:
+                    logging.info(
+                        "Failed to reconnect to %s, retrying in %.1fs: %s",
+                        self.address,
+                        delay,
+                        exc,
+                    )
+                except Exception:  # pylint: disable=broad-exception-caught
+                    logging.exception(
+                        "Unexpected error reconnecting to %s, retrying in %.1fs",
+                        self.address,
+                        delay,
+                    )
+                else:
+                    logging.debug("Reconnected to %s", self.address)
+                    self._session_ready.set()
+                    return
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, self._session_backoff)
+        finally:
+            self._reconnect_task = None
+
+    async def _keepalive(self, interval: float) -> None:
+        """Periodically read sensor data to detect a dropped link."""
+        while self._session:
+            await asyncio.sleep(interval)
+            client = self._client
+            if client is None or not self._session_ready.is_set():
+                continue
+            try:
+                await self.fetch_sensor_data()
+            except (FreshIntelliventError, TimeoutError):
+                logging.info("Keep-alive failed for %s", self.address)
+                with suppress(BleakError):
+                    await client.disconnect()
+                # Not every backend reports a disconnect it was asked for.
+                self._on_disconnected(client)
+
+    async def _get_client(self) -> BleakClient:
+        """Return the connected client, waiting for a session reconnect.
+
+        While a session is being set up, only the task setting it up gets
+        the client, so no operation runs on an unauthenticated link.
+        """
+        if (
+            self._session
+            and not self._session_ready.is_set()
+            and asyncio.current_task() is not self._establishing
+        ):
+            try:
+                await asyncio.wait_for(
+                    self._session_ready.wait(), self._session_timeout
+                )
+            except asyncio.TimeoutError as exc:
+                raise FreshIntelliventError("Not connected") from exc
+
+        if self._client is None:
+            raise FreshIntelliventError("Not connected")
+        return self._client
+
     async def disconnect(self) -> None:
-        """Disconnect from the device."""
+        """Disconnect from the device and end any managed session."""
+        self._session = False
+        self._session_ready.clear()
+        for task in (self._keepalive_task, self._reconnect_task):
+            if task is not None and task is not asyncio.current_task():
+                task.cancel()
+        self._keepalive_task = None
+        self._reconnect_task = None
+        self.operations.cancel(exc=FreshIntelliventError("Disconnected"))
+
         if self._client is None:
             logging.debug("Already disconnected")
         else:
@@ -63,59 +367,148 @@ class FreshIntelliVent:
         self._connected = False
 
     async def authenticate(
-        self, authentication_code: Union[bytes, bytearray, str]
+        self,
+        authentication_code: Union[bytes, bytearray, str],
+        timeout: float = 5.0,
     ) -> None:
-        """Authenticate with the device."""
+        """Authenticate with the device.
+
+        Completion is confirmed by polling the authenticated flag in the
+        sensor data, backing off between reads until timeout has passed.
+        """
         logging.debug("Authenticating...")
 
+        start = time.monotonic()
+        try:
+            await self._authenticate(authentication_code, timeout)
+        except Exception as exc:
+            self._record("authenticate", start, error=exc)
+            raise
+        self._record("authenticate", start)
+
+    async def _authenticate(
+        self, authentication_code: Union[bytes, bytearray, str], timeout: float
+    ) -> None:
+        """Write the authentication code and wait for the device to accept it."""
         await self._write_characteristic(
             uuid=characteristics.AUTH, data=h.to_bytearray(authentication_code)
         )
-        await asyncio.sleep(1)
-        logging.debug("Authenticated!")
+
+        deadline = time.monotonic() + timeout
+        delays = itertools.chain(
+            _AUTH_POLL_DELAYS, itertools.repeat(_AUTH_POLL_DELAYS[-1])
+        )
+        for delay in delays:
+            sensors = await self.fetch_sensor_data()
+            if sensors.authenticated:
+                logging.debug("Authenticated!")
+                return
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            await asyncio.sleep(min(delay, remaining))
+
+        raise FreshIntelliventAuthenticationError(
+            f"Device did not report authenticated within {timeout}s"
+        )
 
     async def fetch_authentication_code(self) -> Union[bytes, bytearray]:
         """Fetch the authentication code from the device."""
-        if self._client is None:
-            raise FreshIntelliventError("Not connected")
-
-        return await self._client.read_gatt_char(char_specifier=characteristics.AUTH)
+        return await self._read_characteristics(uuid=characteristics.AUTH)
 
     async def _read_characteristics(
-        self, uuid: Union[str, UUID]
+        self,
+        uuid: Union[str, UUID],
+        on_latency: Callable[[float], None] | None = None,
     ) -> Union[bytes, bytearray]:
-        """Read a characteristic from the device."""
-        if self._client is None:
-            raise FreshIntelliventError("Not connected")
+        """Read a characteristic from the device.
 
-        try:
-            value = await self._client.read_gatt_char(char_specifier=uuid)
-            self._log_data(command="R", uuid=uuid, data=value)
-            return value
-        except asyncio.TimeoutError as exc:
-            logging.info("Timeout on read: %s", uuid)
-            raise TimeoutError("Timeout on read") from exc
-        except BleakError as exc:
-            logging.info("Failed to read: %s", uuid)
-            raise FreshIntelliventError("Failed to read") from exc
+        on_latency is called with the time the read took once it got its
+        turn in the operations queue, excluding the time spent waiting.
+        """
+        async with self._slot(PRIORITY_READ):
+            client = await self._get_client()
+            start = time.monotonic()
+            try:
+                value = await client.read_gatt_char(char_specifier=uuid)
+                if on_latency is not None:
+                    on_latency(time.monotonic() - start)
+            except asyncio.TimeoutError as exc:
+                logging.info("Timeout on read: %s", uuid)
+                error: Exception = TimeoutError("Timeout on read")
+                self._record("read", start, uuid, error)
+                raise error from exc
+            except BleakError as exc:
+                logging.info("Failed to read: %s", uuid)
+                error = FreshIntelliventError("Failed to read")
+                self._record("read", start, uuid, error)
+                await self._invalidate_services(client, exc)
+                raise error from exc
+        self._record("read", start, uuid)
+        self._log_data(command="R", uuid=uuid, data=value)
+        return value
 
     async def _write_characteristic(
         self, uuid: Union[str, UUID], data: Union[bytes, bytearray]
     ) -> None:
-        if self._client is None:
-            raise FreshIntelliventError("Not connected")
+        async with self._slot(PRIORITY_WRITE):
+            client = await self._get_client()
+            start = time.monotonic()
+            try:
+                await client.write_gatt_char(
+                    char_specifier=uuid, data=data, response=True
+                )
+            except asyncio.TimeoutError as exc:
+                logging.info("Timeout on write: %s", uuid)
+                error: Exception = TimeoutError("Timeout on write")
+                self._record("write", start, uuid, error)
+                raise error from exc
+            except BleakError as exc:
+                logging.info("Failed to write: %s", uuid)
+                error = FreshIntelliventError("Failed to write")
+                self._record("write", start, uuid, error)
+                await self._invalidate_services(client, exc)
+                raise error from exc
+        self._record("write", start, uuid)
+        self._log_data(command="W", uuid=uuid, data=data)
 
-        try:
-            self._log_data(command="W", uuid=uuid, data=data)
-            await self._client.write_gatt_char(
-                char_specifier=uuid, data=data, response=True
-            )
-        except asyncio.TimeoutError as exc:
-            logging.info("Timeout on write: %s", uuid)
-            raise TimeoutError("Timeout on write") from exc
-        except BleakError as exc:
-            logging.info("Failed to write: %s", uuid)
-            raise FreshIntelliventError("Failed to write") from exc
+    def _slot(self, priority: int) -> AbstractAsyncContextManager[Any]:
+        """Return a turn in the operations queue for an operation.
+
+        Operations take their turn before getting the client, so queued
+        operations wait for a session reconnect in order. The task setting
+        up the session skips the queue, as the operations holding a turn
+        are waiting for it to finish.
+        """
+        if asyncio.current_task() is self._establishing:
+            return nullcontext()
+        return self.operations.slot(priority)
+
+    async def _invalidate_services(self, client: BleakClient, exc: BleakError) -> None:
+        """Drop the cached services if exc points to a stale GATT database.
+
+        Other failures, like a dropped link, say nothing about the services
+        and leave the caches alone.
+        """
+        if self.service_cache is None or not _is_stale_gatt_error(exc):
+            return
+        self.service_cache.invalidate(self.address)
+        clear_cache = getattr(client, "clear_cache", None)
+        if clear_cache is not None:
+            with suppress(BleakError):
+                await clear_cache()
+
+    def _record(
+        self,
+        operation: str,
+        start: float,
+        uuid: Union[UUID, str, None] = None,
+        error: BaseException | None = None,
+    ) -> None:
+        """Record an operation started at start to the metrics, if enabled."""
+        if self.metrics is not None:
+            self.metrics.record(operation, time.monotonic() - start, uuid, error)
 
     def _log_data(
         self,
@@ -123,75 +516,138 @@ class FreshIntelliVent:
         uuid: Union[UUID, str],
         data: Union[bytes, bytearray],
     ) -> None:
-        """Log BLE data operations for debugging."""
-        logging.debug("[%s] %s = %s", command, uuid, data.hex())
-
-    async def fetch_device_information(self) -> None:
-        """Fetch device information from the device."""
-        logging.debug("Fetching device information")
+        """Log BLE data operations for debugging.
 
-        if self._client is None:
-            raise FreshIntelliventError("Not connected")
+        Only operations that succeeded are logged, so the capture holds just
+        the traffic that reached the device.
+        """
+        if logging.root.isEnabledFor(logging.DEBUG):
+            logging.debug("[%s] %s = %s", command, uuid, data.hex())
+        if self.capture is not None:
+            self.capture.record(self.address, command, uuid, data)
 
-        name = await self._client.read_gatt_char(
-            char_specifier=characteristics.DEVICE_NAME
-        )
-        self.name = name.decode("utf-8").replace("\00", "").replace("\0", "")
+    async def fetch_device_information(self) -> DeviceInfo:
+        """Fetch device information from the device.
 
-        fw_version = await self._client.read_gatt_char(
-            char_specifier=characteristics.FIRMWARE_VERSION
-        )
-        self.fw_version = fw_version.decode("utf-8")
+        With a device info cache, only the firmware version is read while the
+        cached entry is fresh and its firmware version still matches.
+        Otherwise the remaining values are read in one batch.
+        """
+        logging.debug("Fetching device information")
 
-        hw_version = await self._client.read_gatt_char(
-            char_specifier=characteristics.HARDWARE_VERSION
+        fw_version = _decode_string(
+            await self._read_characteristics(uuid=characteristics.FIRMWARE_VERSION)
         )
-        self.hw_version = hw_version.decode("utf-8")
+        if self.service_cache is not None:
+            self.service_cache.check_firmware(self.address, fw_version)
 
-        hw_version = await self._client.read_gatt_char(
-            char_specifier=characteristics.SOFTWARE_VERSION
-        )
-        self.hw_version = hw_version.decode("utf-8")
+        info = None
+        if self.device_info_cache is not None:
+            info = self.device_info_cache.get(self.address, fw_version)
+        if info is None:
+            name, hw_version, sw_version, manufacturer = await asyncio.gather(
+                *(
+                    self._read_characteristics(uuid=uuid)
+                    for uuid in (
+                        characteristics.DEVICE_NAME,
+                        characteristics.HARDWARE_VERSION,
+                        characteristics.SOFTWARE_VERSION,
+                        characteristics.MANUFACTURER_NAME,
+                    )
+                )
+            )
+            info = DeviceInfo(
+                name=_decode_string(name),
+                manufacturer=_decode_string(manufacturer),
+                fw_version=fw_version,
+                hw_version=_decode_string(hw_version),
+                sw_version=_decode_string(sw_version),
+                updated=time.time(),
+            )
+            if self.device_info_cache is not None:
+                self.device_info_cache.add(self.address, info)
 
-        manufacturer = await self._client.read_gatt_char(
-            char_specifier=characteristics.MANUFACTURER_NAME
-        )
-        self.manufacturer = manufacturer.decode("utf-8")
+        self.name = info.name
+        self.manufacturer = info.manufacturer
+        self.fw_version = info.fw_version
+        self.hw_version = info.hw_version
+        self.sw_version = info.sw_version
 
         logging.debug(
-            "Device fetched! Manufacturer: %s, name: %s, FW: %s, HW: %s",
+            "Device fetched! Manufacturer: %s, name: %s, FW: %s, HW: %s, SW: %s",
             self.manufacturer,
             self.name,
             self.fw_version,
             self.hw_version,
+            self.sw_version,
         )
+        return info
 
-    async def fetch_humidity(self) -> dict[str, Any]:
+    async def _fetch_mode(
+        self,
+        name: str,
+        uuid: UUID,
+        decode: Callable[[Union[bytes, bytearray]], Any],
+    ) -> Any:
+        """Fetch a mode, served from the state store while it is fresh."""
+        cached = self.state.get(name)
+        if cached is not None:
+            return cached
+
+        value = await self._read_characteristics(uuid=uuid)
+        mode = decode(value)
+        self.state.set(name, mode)
+        return mode
+
+    async def _update_mode(
+        self,
+        name: str,
+        uuid: UUID,
+        data: Union[bytes, bytearray],
+        decode: Callable[[Union[bytes, bytearray]], Any],
+    ) -> bool:
+        """Write a mode and store the settings decoded from the written data.
+
+        Decoding the data, rather than keeping the arguments, stores the
+        values after clamping and encoding, as the device will report them.
+        Returns False if a later update superseded it.
+        """
+        try:
+            written = await self._write_mode(uuid, data)
+        except BaseException:
+            self.state.invalidate(name)
+            raise
+        if written:
+            self.state.set(name, decode(data))
+        return written
+
+    async def _write_mode(self, uuid: UUID, data: Union[bytes, bytearray]) -> bool:
+        """Write a mode, returning False if a later update superseded it."""
+        if self.coalescer is None:
+            await self._write_characteristic(uuid, data)
+            return True
+        return await self.coalescer.write(uuid, data)
+
+    async def fetch_humidity(self) -> HumidityMode:
         """Fetch humidity from the device."""
-        value = await self._read_characteristics(uuid=characteristics.HUMIDITY)
-        humidity = self.parser.humidity_read(value=value)
-        self.modes["humidity"] = humidity
-        return humidity
+        return await self._fetch_mode(
+            "humidity", characteristics.HUMIDITY, self.parser.humidity_read
+        )
 
-    async def update_humidity(self, enabled: bool, detection: str, rpm: int) -> None:
+    async def update_humidity(self, enabled: bool, detection: str, rpm: int) -> bool:
         """Update humidity settings on the device."""
         value = self.parser.humidity_write(
             enabled=enabled, detection=detection, rpm=rpm
         )
-        await self._write_characteristic(characteristics.HUMIDITY, value)
-        self.modes["humidity"] = {
-            "enabled": enabled,
-            "detection": detection,
-            "detection_raw": h.detection_string_as_int(detection),
-            "rpm": rpm,
-        }
+        return await self._update_mode(
+            "humidity", characteristics.HUMIDITY, value, self.parser.humidity_read
+        )
 
-    async def fetch_light_and_voc(self) -> dict[str, Union[bool, int]]:
+    async def fetch_light_and_voc(self) -> LightAndVocMode:
         """Fetch light and VOC levels from the device."""
-        value = await self._read_characteristics(uuid=characteristics.LIGHT_VOC)
-        light_and_voc = self.parser.light_and_voc_read(value=value)
-        self.modes["light_and_voc"] = light_and_voc
-        return light_and_voc
+        return await self._fetch_mode(
+            "light_and_voc", characteristics.LIGHT_VOC, self.parser.light_and_voc_read
+        )
 
     async def update_light_and_voc(
         self,
@@ -199,7 +655,7 @@ class FreshIntelliVent:
         light_detection: str,
         voc_enabled: bool,
         voc_detection: str,
-    ) -> None:
+    ) -> bool:
         """Update light and VOC settings on the device."""
         value = self.parser.light_and_voc_write(
             light_enabled=light_enabled,
@@ -207,46 +663,40 @@ class FreshIntelliVent:
             voc_enabled=voc_enabled,
             voc_detection=voc_detection,
         )
-        await self._write_characteristic(characteristics.LIGHT_VOC, value)
-        self.modes["light_and_voc"] = {
-            "light": {
-                "enabled": light_enabled,
-                "detection": light_detection,
-                "detection_raw": h.detection_string_as_int(light_detection),
-            },
-            "voc": {
-                "enabled": voc_enabled,
-                "detection": voc_detection,
-                "detection_raw": h.detection_string_as_int(voc_detection),
-            },
-        }
+        return await self._update_mode(
+            "light_and_voc",
+            characteristics.LIGHT_VOC,
+            value,
+            self.parser.light_and_voc_read,
+        )
 
-    async def fetch_constant_speed(self) -> dict[str, Union[bool, int]]:
+    async def fetch_constant_speed(self) -> ConstantSpeedMode:
         """Fetch constant speed settings from the device."""
-        value = await self._read_characteristics(uuid=characteristics.CONSTANT_SPEED)
-        constant_speed = self.parser.constant_speed_read(value=value)
-        self.modes["constant_speed"] = constant_speed
-        return constant_speed
+        return await self._fetch_mode(
+            "constant_speed",
+            characteristics.CONSTANT_SPEED,
+            self.parser.constant_speed_read,
+        )
 
-    async def update_constant_speed(self, enabled: bool, rpm: int) -> None:
+    async def update_constant_speed(self, enabled: bool, rpm: int) -> bool:
         """Update constant speed settings on the device."""
         value = self.parser.constant_speed_write(enabled=enabled, rpm=rpm)
-        hex_value = value.hex()
-        await self._write_characteristic(
-            characteristics.CONSTANT_SPEED, bytearray.fromhex(hex_value)
+        return await self._update_mode(
+            "constant_speed",
+            characteristics.CONSTANT_SPEED,
+            value,
+            self.parser.constant_speed_read,
         )
-        self.modes["constant_speed"] = {"enabled": enabled, "rpm": rpm}
 
-    async def fetch_timer(self) -> dict[str, Union[bool, int]]:
+    async def fetch_timer(self) -> TimerMode:
         """Fetch timer settings from the device."""
-        value = await self._read_characteristics(uuid=characteristics.TIMER)
-        timer = self.parser.timer_read(value=value)
-        self.modes["timer"] = timer
-        return timer
+        return await self._fetch_mode(
+            "timer", characteristics.TIMER, self.parser.timer_read
+        )
 
     async def update_timer(
         self, minutes: int, delay_enabled: bool, delay_minutes: int, rpm: int
-    ) -> None:
+    ) -> bool:
         """Update timer settings on the device."""
         value = self.parser.timer_write(
             minutes=minutes,
@@ -254,62 +704,324 @@ class FreshIntelliVent:
             delay_minutes=delay_minutes,
             rpm=rpm,
         )
-        await self._write_characteristic(characteristics.TIMER, value)
-        self.modes["timer"] = {
-            "delay": {"enabled": delay_enabled, "minutes": delay_minutes},
-            "minutes": minutes,
-            "rpm": rpm,
-        }
+        return await self._update_mode(
+            "timer", characteristics.TIMER, value, self.parser.timer_read
+        )
 
-    async def fetch_airing(self) -> dict[str, Union[bool, int]]:
+    async def fetch_airing(self) -> AiringMode:
         """Fetch airing settings from the device."""
-        value = await self._read_characteristics(uuid=characteristics.AIRING)
-        airing = self.parser.airing_read(value=value)
-        self.modes["airing"] = airing
-        return airing
+        return await self._fetch_mode(
+            "airing", characteristics.AIRING, self.parser.airing_read
+        )
 
-    async def update_airing(self, enabled: bool, minutes: int, rpm: int) -> None:
+    async def update_airing(self, enabled: bool, minutes: int, rpm: int) -> bool:
         """Update airing settings on the device."""
         value = self.parser.airing_write(enabled=enabled, minutes=minutes, rpm=rpm)
-        await self._write_characteristic(characteristics.AIRING, value)
-        self.modes["airing"] = {
-            "enabled": enabled,
-            "minutes": minutes,
-            "rpm": rpm,
-        }
+        return await self._update_mode(
+            "airing", characteristics.AIRING, value, self.parser.airing_read
+        )
 
-    async def fetch_pause(self) -> dict[str, Union[bool, int]]:
+    async def fetch_pause(self) -> PauseMode:
         """Fetch pause settings from the device."""
-        value = await self._read_characteristics(uuid=characteristics.PAUSE)
-        return self.parser.pause_read(value=value)
+        return await self._fetch_mode(
+            "pause", characteristics.PAUSE, self.parser.pause_read
+        )
 
-    async def update_pause(self, enabled: bool, minutes: int) -> None:
+    async def update_pause(self, enabled: bool, minutes: int) -> bool:
         """Update pause settings on the device."""
         value = self.parser.pause_write(enabled=enabled, minutes=minutes)
-        await self._write_characteristic(characteristics.PAUSE, value)
-        self.modes["pause"] = {"enabled": enabled, "minutes": minutes}
+        return await self._update_mode(
+            "pause", characteristics.PAUSE, value, self.parser.pause_read
+        )
 
-    async def fetch_boost(self) -> dict[str, Union[bool, int]]:
+    async def fetch_boost(self) -> BoostMode:
         """Fetch boost settings from the device."""
-        value = await self._read_characteristics(uuid=characteristics.BOOST)
-        return self.parser.boost_read(value=value)
+        return await self._fetch_mode(
+            "boost", characteristics.BOOST, self.parser.boost_read
+        )
 
-    async def update_boost(self, enabled: bool, rpm: int, seconds: int) -> None:
+    async def update_boost(self, enabled: bool, rpm: int, seconds: int) -> bool:
         """Update boost settings on the device."""
         value = self.parser.boost_write(enabled=enabled, rpm=rpm, seconds=seconds)
-        await self._write_characteristic(characteristics.BOOST, value)
-        self.modes["boost"] = {"enabled": enabled, "seconds": seconds, "rpm": rpm}
+        return await self._update_mode(
+            "boost", characteristics.BOOST, value, self.parser.boost_read
+        )
 
-    async def update_temporary_speed(self, enabled: bool, rpm: int) -> None:
+    async def update_temporary_speed(self, enabled: bool, rpm: int) -> bool:
         """Update temporary speed settings on the device."""
         value = self.parser.temporary_speed_write(enabled=enabled, rpm=rpm)
-        await self._write_characteristic(characteristics.TEMPORARY_SPEED, value)
+        return await self._write_mode(characteristics.TEMPORARY_SPEED, value)
 
     async def fetch_sensor_data(self) -> SkySensors:
         """Fetch sensor data from the device."""
         data = await self._read_characteristics(uuid=characteristics.DEVICE_STATUS)
-        self.sensors.parse_data(data)
-        return self.sensors
+        return self._parse_sensor_frame(data)
+
+    async def stream_sensors(
+        self,
+        min_interval: float = 1.0,
+        max_interval: float = 30.0,
+    ) -> AsyncGenerator[SkySensors, None]:
+        """Stream sensor data from the device.
+
+        Reads the device status once and then subscribes to notifications
+        on it, yielding a new SkySensors for every frame. The device only
+        notifies on changes, so a read is done if nothing has arrived for
+        max_interval. If the firmware does not support notifications, falls
+        back to polling: the interval drops to min_interval when the data
+        changes and doubles up to max_interval while it is stable. In a
+        session, notifications are subscribed to again after a reconnect.
+        """
+        client = await self._get_client()
+        frames: asyncio.Queue[bytearray] = asyncio.Queue()
+        notifying = bool(self._status_queues) or await self._subscribe_status(client)
+        if notifying:
+            self._status_queues.add(frames)
+        else:
+            logging.debug("Notifications not supported, polling sensor data")
+
+        try:
+            data = await self._read_characteristics(uuid=characteristics.DEVICE_STATUS)
+            yield self._parse_sensor_frame(data)
+
+            while notifying:
+                try:
+                    data = await asyncio.wait_for(frames.get(), max_interval)
+                except asyncio.TimeoutError:
+                    data = await self._read_characteristics(
+                        uuid=characteristics.DEVICE_STATUS
+                    )
+                yield self._parse_sensor_frame(data)
+
+            interval = min_interval
+            previous = data
+            while True:
+                await asyncio.sleep(interval)
+                data = await self._read_characteristics(
+                    uuid=characteristics.DEVICE_STATUS
+                )
+                if data == previous:
+                    interval = min(interval * 2, max_interval)
+                else:
+                    interval = min_interval
+                previous = data
+                yield self._parse_sensor_frame(data)
+        finally:
+            await self._unsubscribe_status(frames)
+
+    def _on_status_notify(self, _: BleakGATTCharacteristic, data: bytearray) -> None:
+        """Hand a device status notification to every running stream."""
+        self._log_data(command="N", uuid=characteristics.DEVICE_STATUS, data=data)
+        for frames in self._status_queues:
+            frames.put_nowait(data)
+
+    async def _subscribe_status(self, client: BleakClient) -> bool:
+        """Subscribe to device status notifications, if supported."""
+        try:
+            await client.start_notify(
+                characteristics.DEVICE_STATUS, self._on_status_notify
+            )
+        except BleakError:
+            return False
+        return True
+
+    async def _unsubscribe_status(self, frames: asyncio.Queue[bytearray]) -> None:
+        """Remove a stream, unsubscribing when it was the last one."""
+        if frames not in self._status_queues:
+            return
+        self._status_queues.discard(frames)
+        client = self._client
+        if not self._status_queues and client is not None and client.is_connected:
+            with suppress(BleakError):
+                await client.stop_notify(characteristics.DEVICE_STATUS)
+
+    async def _resubscribe_status(self) -> None:
+        """Subscribe the running streams again and give them a fresh frame."""
+        if not await self._subscribe_status(await self._get_client()):
+            logging.info("Failed to subscribe again to %s", self.address)
+            return
+        data = await self._read_characteristics(uuid=characteristics.DEVICE_STATUS)
+        for frames in self._status_queues:
+            frames.put_nowait(bytearray(data))
+
+    async def stream_events(
+        self,
+        detector: ChangeDetector | None = None,
+        min_interval: float = 1.0,
+        max_interval: float = 30.0,
+    ) -> AsyncIterator[SensorEvent]:
+        """Stream changes in sensor data instead of every sample.
+
+        Samples come from stream_sensors() and are turned into events by
+        detector, a ChangeDetector with the default deadbands if not given.
+        """
+        samples = self.stream_sensors(min_interval, max_interval)
+        try:
+            async for event in detect_changes(samples, detector):
+                yield event
+        finally:
+            await samples.aclose()
+
+    def _parse_sensor_frame(self, data: Union[bytes, bytearray]) -> SkySensors:
+        """Parse a device status frame into a new SkySensors."""
+        sensors = SkySensors.from_bytes(data)
+        self.sensors = sensors
+        if self.history is not None:
+            self.history.append(sensors)
+        return sensors
+
+    async def fetch_all(self) -> SkySnapshot:
+        """Fetch all mode settings and sensor data in one batch.
+
+        The reads are queued together so they run back to back. With the
+        default concurrency of 1 every read is still a full round trip, so
+        this takes about as long as reading them one by one; with a higher
+        concurrency the BLE stack can overlap them. The timing of each read
+        excludes the time it waited in the operations queue. If a read
+        fails, its error is raised once the other reads are done and no
+        modes are stored.
+        """
+        decoders = {
+            codec.name: (codec.uuid, codec.decode)
+            for codec in CODECS.values()
+            if codec.readable
+        }
+        timings: dict[str, float] = {}
+
+        async def timed_read(name: str, uuid: UUID) -> Union[bytes, bytearray]:
+            return await self._read_characteristics(
+                uuid, on_latency=functools.partial(timings.__setitem__, name)
+            )
+
+        start = time.monotonic()
+        results = await asyncio.gather(
+            timed_read("sensors", characteristics.DEVICE_STATUS),
+            *(timed_read(name, uuid) for name, (uuid, _) in decoders.items()),
+            return_exceptions=True,
+        )
+        elapsed = time.monotonic() - start
+
+        values: list[Union[bytes, bytearray]] = []
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+            values.append(result)
+
+        sensors = self._parse_sensor_frame(values[0])
+        modes = {
+            name: decode(value)
+            for (name, (_, decode)), value in zip(decoders.items(), values[1:])
+        }
+
+        for name, mode in modes.items():
+            self.state.set(name, mode)
+
+        logging.debug(
+            "Fetched all characteristics in %.3fs (%.3fs sequential)",
+            elapsed,
+            sum(timings.values()),
+        )
+        return SkySnapshot(
+            sensors=sensors, modes=modes, timings=timings, elapsed=elapsed
+        )
+
+    async def reconcile(  # pylint: disable=too-many-locals
+        self,
+        desired_state: dict[str, Union[ModeSettings, dict[str, Any]]],
+        max_age: float | None = None,
+        verify: bool = False,
+    ) -> list[str]:
+        """Write only the mode settings that differ from desired_state.
+
+        desired_state maps mode names, as used by fetch_all(), to mode
+        settings or to dictionaries of update_* keyword arguments. The
+        dictionaries may leave out values, which are then kept as they are.
+        Current settings are taken from the state store when at most max_age
+        seconds old, or of any age if max_age is None, and the rest are read
+        in one batch. Changed modes are written in a fixed order with pause
+        and boost last. If verify is set, the written modes are read back in
+        one batch afterwards. Returns the names of the written modes.
+        """
+        codecs = {codec.name: codec for codec in CODECS.values() if codec.readable}
+        if unknown := sorted(set(desired_state) - set(codecs)):
+            raise ValueError(f"Cannot reconcile {', '.join(unknown)}")
+
+        current = await self._current_modes(
+            [codecs[name] for name in desired_state], max_age
+        )
+
+        written: dict[str, bytes] = {}
+        for name in _RECONCILE_ORDER:
+            if name not in desired_state:
+                continue
+            codec = codecs[name]
+            desired = desired_state[name]
+            arguments = codec.arguments(current[name])
+            existing = codec.encode(**arguments)
+            if isinstance(desired, dict):
+                arguments.update(desired)
+            else:
+                arguments = codec.arguments(desired)
+            data = codec.encode(**arguments)
+            if data != existing and await self._update_mode(
+                name, codec.uuid, data, codec.decode
+            ):
+                written[name] = data
+
+        if verify and written:
+            modes = await self._read_modes([codecs[name] for name in written])
+            if failed := [
+                name
+                for name, data in written.items()
+                if codecs[name].encode(**codecs[name].arguments(modes[name])) != data
+            ]:
+                raise FreshIntelliventError(f"Failed to verify {', '.join(failed)}")
+
+        logging.debug("Reconciled %s, wrote %s", list(desired_state), list(written))
+        return list(written)
+
+    async def _current_modes(
+        self, codecs: list[CharacteristicCodec], max_age: float | None
+    ) -> dict[str, ModeSettings]:
+        """Return known modes up to max_age old, reading the others in a batch."""
+        known = self.state.as_dict()
+        modes: dict[str, ModeSettings] = {}
+        missing: list[CharacteristicCodec] = []
+        for codec in codecs:
+            age = self.state.age(codec.name)
+            if age is not None and (max_age is None or age <= max_age):
+                modes[codec.name] = known[codec.name]
+            else:
+                missing.append(codec)
+        if missing:
+            modes.update(await self._read_modes(missing))
+        return modes
+
+    async def _read_modes(
+        self, codecs: list[CharacteristicCodec]
+    ) -> dict[str, ModeSettings]:
+        """Read and store the modes of codecs concurrently."""
+        values = await asyncio.gather(
+            *(self._read_characteristics(uuid=codec.uuid) for codec in codecs)
+        )
+        modes = {
+            codec.name: codec.decode(value) for codec, value in zip(codecs, values)
+        }
+        for name, mode in modes.items():
+            self.state.set(name, mode)
+        return modes
+
+
+def _is_stale_gatt_error(exc: BleakError) -> bool:
+    """Return True if exc means the cached GATT services do not match."""
+    if isinstance(exc, BleakCharacteristicNotFoundError):
+        return True
+    return getattr(exc, "code", None) in _STALE_GATT_ERROR_CODES
+
+
+def _decode_string(value: Union[bytes, bytearray]) -> str:
+    """Decode a string characteristic, dropping NUL padding."""
+    return value.decode("utf-8").replace("\0", "")
 
 
 class FreshIntelliventError(Exception):
@@ -318,3 +1030,7 @@ class FreshIntelliventError(Exception):
 
 class FreshIntelliventTimeoutError(FreshIntelliventError):
     """Timeout exception for Fresh Intellivent errors."""
+
+
+class FreshIntelliventAuthenticationError(FreshIntelliventError):
+    """Authentication exception for Fresh Intellivent errors."""
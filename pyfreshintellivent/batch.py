@@ -0,0 +1,102 @@
+"""Batch decoding of recorded Fresh Intellivent Sky sensor frames.
+
+Requires NumPy, install it with the ``numpy`` extra.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Union
+
+from .sensors import _MODES, MODE_UNKNOWN
+
+if TYPE_CHECKING:
+    import numpy as np
+    import numpy.typing as npt
+
+FRAME_SIZE = 15
+
+# Same layout as "<2B2H2B2H3B" in SkySensors.from_bytes.
+_RAW_FIELDS = [
+    ("status", "u1"),
+    ("mode_raw", "u1"),
+    ("humidity", "<u2"),
+    ("temperature", "<u2"),
+    ("unknown_0", "u1"),
+    ("authenticated", "u1"),
+    ("rpm", "<u2"),
+    ("temperature_avg", "<u2"),
+    ("unknown_1", "u1"),
+    ("unknown_2", "u1"),
+    ("unknown_3", "u1"),
+]
+
+_DECODED_FIELDS = [
+    ("status", "?"),
+    ("mode", "U16"),
+    ("mode_raw", "u1"),
+    ("humidity", "f8"),
+    ("temperature", "f8"),
+    ("temperature_avg", "f8"),
+    ("authenticated", "?"),
+    ("rpm", "u2"),
+    ("unknowns", "u1", (4,)),
+]
+
+
+def _numpy() -> Any:
+    try:
+        import numpy  # pylint: disable=import-outside-toplevel
+    except ImportError as exc:
+        raise ImportError(
+            "Batch decoding requires NumPy, install pyfreshintellivent[numpy]."
+        ) from exc
+    return numpy
+
+
+def decode_device_status_columns(
+    buffer: Union[bytes, bytearray, memoryview],
+) -> dict[str, npt.NDArray[Any]]:
+    """Decode a buffer of device status frames into a dict of columns.
+
+    Decodes the same values as SkySensors.from_bytes, but for every frame at
+    once. Frames with a raw humidity of 0 get NaN as humidity.
+    """
+    numpy = _numpy()
+    if len(buffer) % FRAME_SIZE:
+        raise ValueError(
+            f"Length need to be a multiple of {FRAME_SIZE}, was {len(buffer)}."
+        )
+
+    raw = numpy.frombuffer(buffer, dtype=numpy.dtype(_RAW_FIELDS))
+
+    modes = numpy.full(256, MODE_UNKNOWN, dtype="U16")
+    for mode_raw, mode in _MODES.items():
+        modes[mode_raw] = mode
+
+    with numpy.errstate(divide="ignore"):
+        humidity = numpy.round(numpy.log(raw["humidity"] / 10) * 10, 1)
+    humidity[raw["humidity"] == 0] = numpy.nan
+
+    return {
+        "status": raw["status"].astype(bool),
+        "mode": modes[raw["mode_raw"]],
+        "mode_raw": raw["mode_raw"].copy(),
+        "humidity": humidity,
+        "temperature": raw["temperature"] / 100,
+        "temperature_avg": raw["temperature_avg"] / 100,
+        "authenticated": raw["authenticated"].astype(bool),
+        "rpm": raw["rpm"].astype("u2"),
+        "unknowns": numpy.stack([raw[f"unknown_{i}"] for i in range(4)], axis=-1),
+    }
+
+
+def decode_device_status(
+    buffer: Union[bytes, bytearray, memoryview],
+) -> np.ndarray[Any, Any]:
+    """Decode a buffer of device status frames into a structured array."""
+    numpy = _numpy()
+    columns = decode_device_status_columns(buffer)
+    result = numpy.empty(len(columns["rpm"]), dtype=numpy.dtype(_DECODED_FIELDS))
+    for name, column in columns.items():
+        result[name] = column
+    return result
@@ -0,0 +1,197 @@
+"""Binary capture log of raw GATT traffic."""
+
+from __future__ import annotations
+
+import mmap
+import time
+from collections.abc import Iterator
+from dataclasses import dataclass
+from pathlib import Path
+from struct import Struct
+from types import TracebackType
+from typing import BinaryIO, Union
+from uuid import UUID
+
+from . import characteristics
+
+MAGIC = b"PFIC\x01"
+
+# Characteristics are stored as an index into this tuple. New entries must
+# only be appended, or existing captures will be decoded wrongly.
+UUIDS: tuple[UUID, ...] = (
+    characteristics.DEVICE_STATUS,
+    characteristics.AUTH,
+    characteristics.HUMIDITY,
+    characteristics.LIGHT_VOC,
+    characteristics.CONSTANT_SPEED,
+    characteristics.TIMER,
+    characteristics.AIRING,
+    characteristics.PAUSE,
+    characteristics.BOOST,
+    characteristics.TEMPORARY_SPEED,
+    characteristics.DEVICE_NAME,
+    characteristics.MODEL_NUMBER,
+    characteristics.FIRMWARE_VERSION,
+    characteristics.HARDWARE_VERSION,
+    characteristics.SOFTWARE_VERSION,
+    characteristics.MANUFACTURER_NAME,
+)
+UNKNOWN_UUID = 0xFF
+
+_UUID_INDEX = {uuid: index for index, uuid in enumerate(UUIDS)}
+
+# Timestamp, direction, UUID index, address length and payload length,
+# followed by the address and the payload.
+_HEADER = Struct("<dcBBH")
+
+
+@dataclass(frozen=True, slots=True)
+class CaptureRecord:
+    """A single captured read, write or notification."""
+
+    timestamp: float
+    address: str
+    direction: str
+    uuid: UUID | None
+    payload: memoryview
+
+
+def _pack_address(address: str) -> bytes:
+    """Pack a MAC address into 6 bytes, or keep other addresses as text."""
+    parts = address.split(":")
+    if len(parts) == 6:
+        try:
+            return bytes(int(part, 16) for part in parts)
+        except ValueError:
+            pass
+    return address.encode("utf-8")
+
+
+def _unpack_address(data: Union[bytes, memoryview]) -> str:
+    if len(data) == 6:
+        return ":".join(f"{byte:02X}" for byte in data)
+    return bytes(data).decode("utf-8")
+
+
+class CaptureWriter:
+    """Append-only writer for raw GATT traffic.
+
+    Each record is a fixed header followed by the device address and the
+    payload, so capturing costs one small write per operation. Records are
+    flushed to disk once flush_interval seconds have passed since the last
+    flush, by default after every record. Records written since are
+    flushed by the next record, flush() or close().
+    """
+
+    def __init__(self, path: Union[str, Path], flush_interval: float = 0.0) -> None:
+        self.path = Path(path)
+        self.flush_interval = flush_interval
+        self._file: BinaryIO = open(  # pylint: disable=consider-using-with
+            self.path, "ab"
+        )
+        if self._file.tell() == 0:
+            self._file.write(MAGIC)
+        self._flushed = time.monotonic()
+
+    def record(
+        self,
+        address: str,
+        direction: str,
+        uuid: Union[str, UUID],
+        data: Union[bytes, bytearray],
+        timestamp: float | None = None,
+    ) -> None:
+        """Append a record. direction is R, W or N (notification)."""
+        packed_address = _pack_address(address)
+        index = _UUID_INDEX.get(UUID(str(uuid)), UNKNOWN_UUID)
+        self._file.write(
+            _HEADER.pack(
+                time.time() if timestamp is None else timestamp,
+                direction.encode("ascii"),
+                index,
+                len(packed_address),
+                len(data),
+            )
+            + packed_address
+            + bytes(data)
+        )
+        if time.monotonic() - self._flushed >= self.flush_interval:
+            self.flush()
+
+    def flush(self) -> None:
+        """Flush buffered records to disk."""
+        self._file.flush()
+        self._flushed = time.monotonic()
+
+    def close(self) -> None:
+        """Close the capture file."""
+        self._file.close()
+
+    def __enter__(self) -> CaptureWriter:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        self.close()
+
+
+class CaptureReader:
+    """Memory-mapped reader for capture files.
+
+    Payloads are memoryviews into the mapped file, so iterating copies no
+    payload data. Release the records before closing the reader.
+    """
+
+    def __init__(self, path: Union[str, Path]) -> None:
+        self.path = Path(path)
+        self._mmap: mmap.mmap | None = None
+        with open(self.path, "rb") as file:
+            if len(magic := file.read(len(MAGIC))) and magic != MAGIC:
+                raise ValueError(f"{self.path} is not a capture file.")
+            if file.seek(0, 2) > len(MAGIC):
+                self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def __iter__(self) -> Iterator[CaptureRecord]:
+        if self._mmap is None:
+            return
+
+        view = memoryview(self._mmap)
+        offset = len(MAGIC)
+        end = len(view)
+        while offset + _HEADER.size <= end:
+            timestamp, direction, index, address_length, payload_length = (
+                _HEADER.unpack_from(view, offset)
+            )
+            start = offset + _HEADER.size
+            offset = start + address_length + payload_length
+            if offset > end:
+                # A partially written record at the end of the file.
+                return
+            yield CaptureRecord(
+                timestamp=timestamp,
+                address=_unpack_address(view[start : start + address_length]),
+                direction=direction.decode("ascii"),
+                uuid=UUIDS[index] if index < len(UUIDS) else None,
+                payload=view[start + address_length : offset],
+            )
+
+    def close(self) -> None:
+        """Unmap the capture file."""
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+
+    def __enter__(self) -> CaptureReader:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        self.close()
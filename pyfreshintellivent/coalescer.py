@@ -0,0 +1,71 @@
+"""Write coalescing for Fresh Intellivent Sky devices."""
+
+import asyncio
+import logging
+from collections.abc import Awaitable
+from dataclasses import dataclass
+from typing import Callable, Union
+from uuid import UUID
+
+
+@dataclass
+class _PendingWrite:
+    data: Union[bytes, bytearray]
+    future: "asyncio.Future[bool]"
+
+
+class WriteCoalescer:  # pylint: disable=too-few-public-methods
+    """Coalesce bursts of writes to the same characteristic.
+
+    A write is held back for window seconds. If another write to the same
+    characteristic arrives meanwhile, it replaces the pending data and the
+    earlier write resolves as coalesced. Writes to one characteristic are
+    always sent in the order they were made.
+    """
+
+    def __init__(
+        self,
+        write: Callable[[UUID, Union[bytes, bytearray]], Awaitable[None]],
+        window: float = 0.1,
+    ) -> None:
+        self.window = window
+        self.written = 0
+        self.coalesced = 0
+        self._write = write
+        self._pending: dict[UUID, _PendingWrite] = {}
+        self._locks: dict[UUID, asyncio.Lock] = {}
+        self._tasks: set[asyncio.Task[None]] = set()
+
+    async def write(self, uuid: UUID, data: Union[bytes, bytearray]) -> bool:
+        """Queue a write, returning False if a later write superseded it."""
+        future: asyncio.Future[bool] = asyncio.get_running_loop().create_future()
+        pending = self._pending.get(uuid)
+        if pending is None:
+            pending = _PendingWrite(data=data, future=future)
+            self._pending[uuid] = pending
+            task = asyncio.create_task(self._flush(uuid, pending))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+        else:
+            logging.debug("Coalesced write to %s", uuid)
+            self.coalesced += 1
+            if not pending.future.done():
+                pending.future.set_result(False)
+            pending.data = data
+            pending.future = future
+        return await future
+
+    async def _flush(self, uuid: UUID, pending: _PendingWrite) -> None:
+        await asyncio.sleep(self.window)
+        async with self._locks.setdefault(uuid, asyncio.Lock()):
+            self._pending.pop(uuid, None)
+            future = pending.future
+            try:
+                await self._write(uuid, pending.data)
+            except Exception as exc:  # pylint: disable=broad-exception-caught
+                if not future.done():
+                    future.set_exception(exc)
+            else:
+                self.written += 1
+                if not future.done():
+                    future.set_result(True)
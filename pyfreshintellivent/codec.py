@@ -0,0 +1,577 @@
+"""Table driven codecs for Fresh Intellivent Sky characteristics."""
+
+from __future__ import annotations
+
+import operator
+from dataclasses import dataclass, field
+from struct import Struct
+from typing import Any, Callable, Sequence, Union
+from uuid import UUID
+
+from . import characteristics
+from . import helpers as h
+from .modes import (
+    AiringMode,
+    BoostMode,
+    ConstantSpeedMode,
+    DetectionSettings,
+    HumidityMode,
+    LightAndVocMode,
+    ModeSettings,
+    PauseMode,
+    TimerDelay,
+    TimerMode,
+)
+
+_RESULT_CACHE_SIZE = 1024
+
+
+@dataclass(frozen=True)
+class CodecField:
+    """A single value in a characteristic.
+
+    name is the keyword used when encoding and path is where the decoded
+    value ends up, e.g. ("light", "enabled"). Fields with a constant are
+    written as that constant and skipped when decoding.
+    """
+
+    name: str
+    path: tuple[str, ...] = ()
+    decode: Callable[[Any], Any] | None = None
+    encode: Callable[[Any], Any] | None = None
+    constant: Any = None
+    raw_path: tuple[str, ...] = ()
+
+
+@dataclass(frozen=True)
+class CharacteristicCodec:  # pylint: disable=too-many-instance-attributes
+    """Encoder and decoder for a characteristic, generated from its fields.
+
+    encode takes the values by field name, encode_values takes the same
+    values positionally, in field order, for callers that already have them
+    in that order.
+    """
+
+    name: str
+    uuid: UUID
+    struct: Struct
+    fields: tuple[CodecField, ...]
+    result: type[ModeSettings] | None = None
+    parts: dict[str, type[ModeSettings]] = field(default_factory=dict)
+    readable: bool = True
+    decode: Callable[[Union[bytes, bytearray, memoryview]], Any] = field(
+        init=False, repr=False, compare=False
+    )
+    encode: Callable[..., bytes] = field(init=False, repr=False, compare=False)
+    encode_values: Callable[..., bytes] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "decode", _build_decoder(self))
+        object.__setattr__(self, "encode_values", _build_value_encoder(self))
+        object.__setattr__(self, "encode", _build_encoder(self, self.encode_values))
+
+    def arguments(self, value: Any) -> dict[str, Any]:
+        """Return the encode keyword arguments for a decoded value.
+
+        Fields with a raw value, like detection levels, are given as that
+        value, so encoding the arguments gives back the decoded bytes even
+        where the decoded string does not map back to them.
+        """
+        arguments = {}
+        for codec_field in self.fields:
+            if codec_field.constant is not None:
+                continue
+            item = value
+            for key in codec_field.raw_path or codec_field.path:
+                item = item[key]
+            arguments[codec_field.name] = item
+        return arguments
+
+
+def _build_decoder(
+    codec: CharacteristicCodec,
+) -> Callable[[Union[bytes, bytearray, memoryview]], Any]:
+    """Return a decoder that unpacks straight into the result type.
+
+    Where every value of the result comes from is worked out once here, as
+    positions in the unpacked values followed by the decoded values and the
+    parts. Decoding is then a single unpack_from, the field decoders and the
+    result built positionally, using the simplest decoder that fits the
+    codec. Codecs without a result type decode into a dict.
+    """
+    size = codec.struct.size
+    unpack_from = codec.struct.unpack_from
+    decoders, result, parts = _layout(codec)
+    make, kind, indexes = result
+    pick = _picker(indexes)
+
+    if parts:
+        decode = _parts_decoder(codec, decoders, result, parts)
+
+    elif len(decoders) == 1:
+        decoded, field_decode = decoders[0]
+
+        def decode(value: Union[bytes, bytearray, memoryview]) -> Any:
+            if len(value) != size:
+                raise _length_error(size, value)
+            values = unpack_from(value)
+            return make(kind, pick((*values, field_decode(values[decoded]))))
+
+    elif decoders:
+        steps = tuple(decoders)
+
+        def decode(value: Union[bytes, bytearray, memoryview]) -> Any:
+            if len(value) != size:
+                raise _length_error(size, value)
+            values = [*unpack_from(value)]
+            for index, field_decode in steps:
+                values.append(field_decode(values[index]))
+            return make(kind, pick(values))
+
+    elif indexes == list(range(len(codec.fields))):
+
+        def decode(value: Union[bytes, bytearray, memoryview]) -> Any:
+            if len(value) != size:
+                raise _length_error(size, value)
+            return make(kind, unpack_from(value))
+
+    else:
+
+        def decode(value: Union[bytes, bytearray, memoryview]) -> Any:
+            if len(value) != size:
+                raise _length_error(size, value)
+            return make(kind, pick(unpack_from(value)))
+
+    decode.__qualname__ = f"{codec.name}_decode"
+    return decode
+
+
+_Decoders = list[tuple[int, Callable[[Any], Any]]]
+_Builder = tuple[Callable[[Any, Any], Any], Any, list[int]]
+
+
+def _layout(codec: CharacteristicCodec) -> tuple[_Decoders, _Builder, list[_Builder]]:
+    """Return the field decoders, and the builders of the result and its parts.
+
+    A builder is a function making a result from its kind and values, that
+    kind and the positions of the values, in the unpacked values followed by
+    the decoded values and then the parts, in the order they are returned.
+    """
+    count = len(codec.fields)
+    positions: dict[tuple[str, ...], int] = {}
+    decoders: _Decoders = []
+    for index, codec_field in enumerate(codec.fields):
+        if codec_field.constant is not None:
+            continue
+        if codec_field.decode is None:
+            positions[codec_field.path] = index
+        else:
+            positions[codec_field.path] = count + len(decoders)
+            decoders.append((index, codec_field.decode))
+        if codec_field.raw_path:
+            positions[codec_field.raw_path] = index
+
+    builders: list[_Builder] = []
+
+    def layout(prefix: tuple[str, ...], result: type[ModeSettings] | None) -> int:
+        depth = len(prefix)
+        names = (
+            result.fields()
+            if result is not None
+            else tuple(
+                dict.fromkeys(
+                    path[depth]
+                    for path in positions
+                    if len(path) > depth and path[:depth] == prefix
+                )
+            )
+        )
+        if not names:
+            raise ValueError(f"No fields for {codec.name} {'.'.join(prefix)}")
+        indexes = []
+        for name in names:
+            path = (*prefix, name)
+            if path not in positions:
+                part = codec.parts.get(name) if result is not None else None
+                positions[path] = layout(path, part)
+            indexes.append(positions[path])
+        builders.append((*_maker(result, names), indexes))
+        return count + len(decoders) + len(builders) - 1
+
+    layout((), codec.result)
+    result = builders.pop()
+    return decoders, result, builders
+
+
+def _parts_decoder(
+    codec: CharacteristicCodec,
+    decoders: _Decoders,
+    result: _Builder,
+    parts: list[_Builder],
+) -> Callable[[Union[bytes, bytearray, memoryview]], Any]:
+    """Return a decoder for a result made of parts, like the timer delay.
+
+    Results are immutable and settings seldom change, so each result is
+    built once for every distinct set of unpacked values and then reused, up
+    to _RESULT_CACHE_SIZE of them.
+    """
+    size = codec.struct.size
+    unpack_from = codec.struct.unpack_from
+    steps = tuple(decoders)
+    builders = tuple((make, kind, _picker(indexes)) for make, kind, indexes in parts)
+    make, kind, indexes = result
+    pick = _picker(indexes)
+    cache: dict[tuple[Any, ...], Any] = {}
+
+    def build(raw: tuple[Any, ...]) -> Any:
+        values = [*raw]
+        for index, field_decode in steps:
+            values.append(field_decode(values[index]))
+        for make_part, part_kind, pick_part in builders:
+            values.append(make_part(part_kind, pick_part(values)))
+        decoded = make(kind, pick(values))
+        if len(cache) < _RESULT_CACHE_SIZE:
+            cache[raw] = decoded
+        return decoded
+
+    def decode(value: Union[bytes, bytearray, memoryview]) -> Any:
+        if len(value) != size:
+            raise _length_error(size, value)
+        raw = unpack_from(value)
+        decoded = cache.get(raw)
+        if decoded is None:
+            decoded = build(raw)
+        return decoded
+
+    return decode
+
+
+def _length_error(size: int, value: Union[bytes, bytearray, memoryview]) -> ValueError:
+    return ValueError(f"Length need to be exactly {size}, was {len(value)}.")
+
+
+def _maker(
+    result: type[ModeSettings] | None, names: tuple[str, ...]
+) -> tuple[Callable[[Any, Any], Any], Any]:
+    """Return a function building a result from its kind and values, and the kind.
+
+    Mode settings are built with tuple.__new__, which is what their _make
+    does without checking the length again. Without a result type the kind
+    is the field names and the result a dict.
+    """
+    if result is not None:
+        return tuple.__new__, result
+    return _make_dict, names
+
+
+def _make_dict(names: tuple[str, ...], values: tuple[Any, ...]) -> dict[str, Any]:
+    return dict(zip(names, values))
+
+
+def _picker(indexes: list[int]) -> Callable[[Sequence[Any]], tuple[Any, ...]]:
+    """Return a function taking the values at indexes as a tuple."""
+    if len(indexes) > 1:
+        return operator.itemgetter(*indexes)
+    (index,) = indexes
+
+    def pick(values: Sequence[Any]) -> tuple[Any, ...]:
+        return (values[index],)
+
+    return pick
+
+
+def _build_value_encoder(codec: CharacteristicCodec) -> Callable[..., bytes]:
+    """Return an encoder taking the values of the fields in order.
+
+    Fields with a constant are left out of the values and put in place
+    before packing. Every packed value goes through its field encoder, or
+    through the conversion pack would do anyway, so codecs of up to four
+    values use an encoder with one fixed parameter per value.
+    """
+    pack = codec.struct.pack
+    codes = _format_codes(codec.struct)
+    encoders = tuple(
+        codec_field.encode or _PASS_THROUGH.get(code, _same)
+        for codec_field, code in zip(codec.fields, codes)
+    )
+    constants = tuple(
+        codec_field.constant
+        for codec_field in codec.fields
+        if codec_field.constant is not None
+    )
+    encode_packed = _fixed_encoder(pack, encoders)
+
+    if encode_packed is None:
+
+        def encode_packed(*values: Any) -> bytes:
+            return pack(*map(operator.call, encoders, values))
+
+    if constants:
+        # The values are followed by the constants, then put in field order.
+        order = [
+            index
+            for index, codec_field in enumerate(codec.fields)
+            if codec_field.constant is None
+        ]
+        order += [
+            index
+            for index, codec_field in enumerate(codec.fields)
+            if codec_field.constant is not None
+        ]
+        pick = _picker([order.index(index) for index in range(len(order))])
+        encode_fields = encode_packed
+
+        def encode_values(*args: Any) -> bytes:
+            return encode_fields(*pick(args + constants))
+
+    else:
+        encode_values = encode_packed
+
+    return encode_values
+
+
+def _fixed_encoder(
+    pack: Callable[..., bytes], encoders: tuple[Callable[[Any], Any], ...]
+) -> Callable[..., bytes] | None:
+    """Return an encoder with one parameter per value, for up to four values."""
+    if len(encoders) == 1:
+        (encode_a,) = encoders
+
+        def encode(a: Any) -> bytes:
+            return pack(encode_a(a))
+
+    elif len(encoders) == 2:
+        encode_a, encode_b = encoders
+
+        def encode(a: Any, b: Any) -> bytes:  # type: ignore[misc]
+            return pack(encode_a(a), encode_b(b))
+
+    elif len(encoders) == 3:
+        encode_a, encode_b, encode_c = encoders
+
+        def encode(a: Any, b: Any, c: Any) -> bytes:  # type: ignore[misc]
+            return pack(encode_a(a), encode_b(b), encode_c(c))
+
+    elif len(encoders) == 4:
+        encode_a, encode_b, encode_c, encode_d = encoders
+
+        def encode(a: Any, b: Any, c: Any, d: Any) -> bytes:  # type: ignore[misc]
+            return pack(encode_a(a), encode_b(b), encode_c(c), encode_d(d))
+
+    else:
+        return None
+    return encode
+
+
+def _format_codes(packer: Struct) -> list[str]:
+    """Return the format code of every value packed by packer."""
+    codes: list[str] = []
+    count = ""
+    for char in packer.format.lstrip("@=<>!"):
+        if char.isdigit():
+            count += char
+        elif char in "sp":
+            codes.append(char)
+            count = ""
+        else:
+            codes.extend(char * int(count or 1))
+            count = ""
+    return codes
+
+
+def _same(value: Any) -> Any:
+    return value
+
+
+# What pack does with a value anyway, so fields without an encoder can go
+# through a builtin instead of a Python function.
+_PASS_THROUGH: dict[str, Callable[[Any], Any]] = {
+    "?": bool,
+    **dict.fromkeys("bBhHiIlLqQnN", operator.index),
+}
+
+
+def _build_encoder(
+    codec: CharacteristicCodec, encode_values: Callable[..., bytes]
+) -> Callable[..., bytes]:
+    """Return an encoder taking the field names as keyword arguments."""
+    names = tuple(
+        codec_field.name for codec_field in codec.fields if codec_field.constant is None
+    )
+    pick = _picker_by_name(names)
+
+    def encode(**kwargs: Any) -> bytes:
+        if len(kwargs) != len(names):
+            raise _arguments_error(codec.name, names, kwargs)
+        try:
+            values = pick(kwargs)
+        except KeyError:
+            raise _arguments_error(codec.name, names, kwargs) from None
+        return encode_values(*values)
+
+    encode.__qualname__ = f"{codec.name}_encode"
+    return encode
+
+
+def _arguments_error(
+    name: str, names: tuple[str, ...], kwargs: dict[str, Any]
+) -> TypeError:
+    missing = sorted(set(names) - kwargs.keys())
+    unexpected = sorted(kwargs.keys() - set(names))
+    return TypeError(
+        f"{name} encode() missing arguments {missing}, "
+        f"unexpected arguments {unexpected}"
+    )
+
+
+def _picker_by_name(names: tuple[str, ...]) -> Callable[[dict[str, Any]], Any]:
+    """Return a function taking the values of names from a dict as a tuple."""
+    if len(names) > 1:
+        return operator.itemgetter(*names)
+    (name,) = names
+
+    def pick(kwargs: dict[str, Any]) -> tuple[Any, ...]:
+        return (kwargs[name],)
+
+    return pick
+
+
+def _detection_decoder(
+    regular_order: bool = True, disable_low: bool = False
+) -> Callable[[int], str]:
+    """Return a detection decoder looking up every byte value in a table."""
+    table = tuple(
+        h.detection_int_as_string(
+            value, regular_order=regular_order, disable_low=disable_low
+        )
+        for value in range(256)
+    )
+    return table.__getitem__
+
+
+def _encode_detection(value: Union[int, str]) -> int:
+    """Encode a detection level given as a string or as its raw value."""
+    if isinstance(value, int):
+        return h.validated_detection(value)
+    return h.detection_string_as_int(value)
+
+
+def _enabled(name: str, *parent: str) -> CodecField:
+    return CodecField(name=name, path=(*parent, "enabled"))
+
+
+def _rpm() -> CodecField:
+    return CodecField(name="rpm", path=("rpm",), encode=h.validated_rpm)
+
+
+def _detection(name: str, *parent: str, **quirks: bool) -> CodecField:
+    return CodecField(
+        name=name,
+        path=(*parent, "detection"),
+        decode=_detection_decoder(**quirks),
+        encode=_encode_detection,
+        raw_path=(*parent, "detection_raw"),
+    )
+
+
+AIRING = CharacteristicCodec(
+    name="airing",
+    uuid=characteristics.AIRING,
+    result=AiringMode,
+    struct=Struct("<?2BH"),
+    fields=(
+        _enabled("enabled"),
+        CodecField(name="mode", constant=26),
+        CodecField(name="minutes", path=("minutes",), encode=h.validated_time),
+        _rpm(),
+    ),
+)
+
+BOOST = CharacteristicCodec(
+    name="boost",
+    uuid=characteristics.BOOST,
+    result=BoostMode,
+    struct=Struct("<?2H"),
+    fields=(
+        _enabled("enabled"),
+        _rpm(),
+        CodecField(name="seconds", path=("seconds",), encode=h.validated_time),
+    ),
+)
+
+CONSTANT_SPEED = CharacteristicCodec(
+    name="constant_speed",
+    uuid=characteristics.CONSTANT_SPEED,
+    result=ConstantSpeedMode,
+    struct=Struct("<?H"),
+    fields=(_enabled("enabled"), _rpm()),
+)
+
+HUMIDITY = CharacteristicCodec(
+    name="humidity",
+    uuid=characteristics.HUMIDITY,
+    result=HumidityMode,
+    struct=Struct("<?BH"),
+    fields=(_enabled("enabled"), _detection("detection"), _rpm()),
+)
+
+LIGHT_VOC = CharacteristicCodec(
+    name="light_and_voc",
+    uuid=characteristics.LIGHT_VOC,
+    result=LightAndVocMode,
+    parts={"light": DetectionSettings, "voc": DetectionSettings},
+    struct=Struct("<?B?B"),
+    fields=(
+        _enabled("light_enabled", "light"),
+        _detection("light_detection", "light", disable_low=True),
+        _enabled("voc_enabled", "voc"),
+        _detection("voc_detection", "voc", regular_order=False),
+    ),
+)
+
+PAUSE = CharacteristicCodec(
+    name="pause",
+    uuid=characteristics.PAUSE,
+    result=PauseMode,
+    struct=Struct("<?B"),
+    fields=(
+        _enabled("enabled"),
+        CodecField(name="minutes", path=("minutes",), encode=h.validated_time),
+    ),
+)
+
+TEMPORARY_SPEED = CharacteristicCodec(
+    name="temporary_speed",
+    uuid=characteristics.TEMPORARY_SPEED,
+    struct=Struct("<?H"),
+    fields=(_enabled("enabled"), _rpm()),
+    readable=False,
+)
+
+TIMER = CharacteristicCodec(
+    name="timer",
+    uuid=characteristics.TIMER,
+    result=TimerMode,
+    parts={"delay": TimerDelay},
+    struct=Struct("<B?BH"),
+    fields=(
+        CodecField(name="minutes", path=("minutes",)),
+        _enabled("delay_enabled", "delay"),
+        CodecField(name="delay_minutes", path=("delay", "minutes")),
+        _rpm(),
+    ),
+)
+
+CODECS: dict[UUID, CharacteristicCodec] = {
+    codec.uuid: codec
+    for codec in (
+        HUMIDITY,
+        LIGHT_VOC,
+        CONSTANT_SPEED,
+        TIMER,
+        AIRING,
+        PAUSE,
+        BOOST,
+        TEMPORARY_SPEED,
+    )
+}
@@ -0,0 +1,141 @@
+"""Cache of recently seen Fresh Intellivent Sky devices."""
+
+from __future__ import annotations
+
+import json
+import logging
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Union
+
+from bleak import BleakScanner
+from bleak.backends.device import BLEDevice
+from bleak_retry_connector import get_device
+
+if TYPE_CHECKING:
+    from .scanner import SkyAdvertisement
+
+
+@dataclass
+class CachedDevice:
+    """A cached device with its last known RSSI."""
+
+    address: str
+    name: str | None
+    rssi: int | None
+    last_seen: float
+    device: BLEDevice | None = None
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the persistable metadata as a dictionary."""
+        return {
+            "address": self.address,
+            "name": self.name,
+            "rssi": self.rssi,
+            "last_seen": self.last_seen,
+        }
+
+
+class DeviceCache:
+    """Cache of BLEDevice objects so reconnects can skip scanning.
+
+    Entries older than ttl seconds are evicted. If a path is given, the
+    addresses and metadata are persisted there as JSON. BLEDevice objects are
+    platform specific and only live in memory, so after a restart a known
+    address is resolved through BlueZ or, failing that, a scan.
+    """
+
+    def __init__(self, ttl: float = 300.0, path: Union[str, Path, None] = None) -> None:
+        self.ttl = ttl
+        self.path = Path(path) if path is not None else None
+        self._entries: dict[str, CachedDevice] = {}
+        if self.path is not None and self.path.exists():
+            self.load()
+
+    @property
+    def addresses(self) -> list[str]:
+        """Return every known address, including ones without a device."""
+        return list(self._entries)
+
+    def add(self, device: BLEDevice, rssi: int | None = None) -> None:
+        """Add or refresh a device in the cache."""
+        self._entries[device.address.upper()] = CachedDevice(
+            address=device.address,
+            name=device.name,
+            rssi=rssi,
+            last_seen=time.time(),
+            device=device,
+        )
+
+    def add_advertisement(self, advertisement: SkyAdvertisement) -> None:
+        """Add a device from an advertisement, usable as a SkyMonitor callback."""
+        self.add(advertisement.device, advertisement.rssi)
+
+    def get(self, address: str) -> CachedDevice | None:
+        """Return the cached entry for an address, if it is known.
+
+        Entries not seen within the TTL are returned without their device,
+        so their metadata stays available.
+        """
+        self.evict_stale()
+        return self._entries.get(address.upper())
+
+    def remove(self, address: str) -> None:
+        """Remove an address from the cache."""
+        self._entries.pop(address.upper(), None)
+
+    def evict_stale(self) -> None:
+        """Drop the devices that have not been seen within the TTL."""
+        cutoff = time.time() - self.ttl
+        for entry in self._entries.values():
+            if entry.device is not None and entry.last_seen < cutoff:
+                entry.device = None
+                logging.debug("Evicted stale device %s", entry.address)
+
+    async def async_get_device(
+        self, address: str, timeout: float = 20.0
+    ) -> BLEDevice | None:
+        """Return a BLEDevice for the address, scanning only on a cache miss."""
+        entry = self.get(address)
+        if entry is not None and entry.device is not None:
+            return entry.device
+
+        device = await get_device(address)
+        if device is None:
+            logging.debug("Cache miss for %s, scanning", address)
+            device = await BleakScanner.find_device_by_address(address, timeout=timeout)
+        if device is not None:
+            self.add(device, entry.rssi if entry is not None else None)
+            if self.path is not None:
+                self.save()
+        return device
+
+    def load(self) -> None:
+        """Load persisted addresses and metadata."""
+        if self.path is None:
+            return
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+            loaded = [
+                CachedDevice(
+                    address=item["address"],
+                    name=item.get("name"),
+                    rssi=item.get("rssi"),
+                    last_seen=item.get("last_seen", 0.0),
+                )
+                for item in data
+            ]
+        except (OSError, ValueError, TypeError, AttributeError, KeyError) as exc:
+            logging.info("Failed to load device cache %s: %s", self.path, exc)
+            return
+
+        for entry in loaded:
+            self._entries.setdefault(entry.address.upper(), entry)
+
+    def save(self) -> None:
+        """Persist addresses and metadata."""
+        if self.path is None:
+            return
+        data = [entry.as_dict() for entry in self._entries.values()]
+        self.path.write_text(json.dumps(data, indent=2), encoding="utf-8")
@@ -0,0 +1,79 @@
+"""Cache of device information of Fresh Intellivent Sky devices."""
+
+from __future__ import annotations
+
+import json
+import logging
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Union
+
+
+@dataclass
+class DeviceInfo:
+    """Device information strings, and when they were read."""
+
+    name: str
+    manufacturer: str
+    fw_version: str
+    hw_version: str
+    sw_version: str
+    updated: float = 0.0
+
+
+class DeviceInfoCache:
+    """Device information by address, which rarely changes.
+
+    Entries are trusted for ttl seconds as long as the firmware version read
+    from the device still matches. If a path is given, the entries are
+    persisted there as JSON.
+    """
+
+    def __init__(
+        self, ttl: float = 7 * 86400.0, path: Union[str, Path, None] = None
+    ) -> None:
+        self.ttl = ttl
+        self.path = Path(path) if path is not None else None
+        self._entries: dict[str, DeviceInfo] = {}
+        if self.path is not None and self.path.exists():
+            self.load()
+
+    def get(self, address: str, fw_version: str | None = None) -> DeviceInfo | None:
+        """Return the info of an address if it is fresh and matches fw_version."""
+        info = self._entries.get(address.upper())
+        if info is None or time.time() - info.updated >= self.ttl:
+            return None
+        if fw_version is not None and info.fw_version != fw_version:
+            return None
+        return info
+
+    def add(self, address: str, info: DeviceInfo) -> None:
+        """Store the info of an address."""
+        self._entries[address.upper()] = info
+        if self.path is not None:
+            self.save()
+
+    def remove(self, address: str) -> None:
+        """Remove an address from the cache."""
+        self._entries.pop(address.upper(), None)
+
+    def load(self) -> None:
+        """Load persisted entries."""
+        if self.path is None:
+            return
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+            entries = {address: DeviceInfo(**item) for address, item in data.items()}
+        except (OSError, ValueError, TypeError, AttributeError) as exc:
+            logging.info("Failed to load device info cache %s: %s", self.path, exc)
+            return
+        for address, info in entries.items():
+            self._entries.setdefault(address, info)
+
+    def save(self) -> None:
+        """Persist the entries."""
+        if self.path is None:
+            return
+        data = {address: asdict(info) for address, info in self._entries.items()}
+        self.path.write_text(json.dumps(data, indent=2), encoding="utf-8")
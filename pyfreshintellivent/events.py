@@ -0,0 +1,159 @@
+"""Change detection for Fresh Intellivent Sky sensor data."""
+
+from __future__ import annotations
+
+import time
+from collections.abc import AsyncIterable, AsyncIterator, Iterable
+from dataclasses import dataclass
+from typing import Union
+
+from .sensors import SkySensors
+
+# Smallest change of a measurement that is reported, per field.
+DEFAULT_DEADBANDS = {"rpm": 50.0, "humidity": 1.0, "temperature": 0.5}
+
+
+@dataclass(frozen=True, slots=True)
+class SensorEvent:
+    """Base class for changes detected in sensor data."""
+
+    timestamp: float
+
+
+@dataclass(frozen=True, slots=True)
+class ModeChanged(SensorEvent):
+    """The active mode changed."""
+
+    previous: Union[str, None]
+    mode: str
+
+
+@dataclass(frozen=True, slots=True)
+class RpmChanged(SensorEvent):
+    """The fan speed changed by at least the rpm deadband."""
+
+    previous: Union[int, None]
+    rpm: int
+
+
+@dataclass(frozen=True, slots=True)
+class MeasurementChanged(SensorEvent):
+    """Humidity or temperature changed by at least its deadband."""
+
+    field: str
+    previous: Union[float, None]
+    value: float
+
+
+@dataclass(frozen=True, slots=True)
+class HumidityThresholdCrossed(SensorEvent):
+    """Humidity rose to a threshold, or fell below it minus the hysteresis."""
+
+    threshold: float
+    humidity: float
+    rising: bool
+
+
+class ChangeDetector:
+    """Turn sensor samples into change events, suppressing unchanged samples.
+
+    rpm, humidity and temperature are reported when they moved at least
+    their deadband away from the last reported value, so slow drift is
+    still reported once it adds up. Each humidity threshold fires once when
+    humidity reaches it and is re-armed only when humidity falls below the
+    threshold minus hysteresis, so noise around a threshold is ignored.
+    The first sample is reported in full.
+    """
+
+    def __init__(
+        self,
+        deadbands: dict[str, float] | None = None,
+        humidity_thresholds: Iterable[float] = (),
+        hysteresis: float = 2.0,
+    ) -> None:
+        self.deadbands = {**DEFAULT_DEADBANDS, **(deadbands or {})}
+        self.humidity_thresholds = sorted(humidity_thresholds)
+        self.hysteresis = hysteresis
+        self.suppressed = 0
+        self._mode: Union[str, None] = None
+        self._reported: dict[str, float] = {}
+        self._above: dict[float, bool] = {}
+
+    def process(
+        self, sensors: SkySensors, timestamp: float | None = None
+    ) -> list[SensorEvent]:
+        """Return the changes in a sample, empty if there were none."""
+        if timestamp is None:
+            timestamp = time.time()
+        events: list[SensorEvent] = []
+
+        if sensors.mode is not None and sensors.mode != self._mode:
+            events.append(ModeChanged(timestamp, self._mode, sensors.mode))
+            self._mode = sensors.mode
+
+        if sensors.rpm is not None and self._moved("rpm", sensors.rpm):
+            previous = self._reported.get("rpm")
+            events.append(
+                RpmChanged(
+                    timestamp,
+                    int(previous) if previous is not None else None,
+                    sensors.rpm,
+                )
+            )
+            self._reported["rpm"] = sensors.rpm
+
+        for field in ("humidity", "temperature"):
+            value = getattr(sensors, field)
+            if value is not None and self._moved(field, value):
+                events.append(
+                    MeasurementChanged(
+                        timestamp, field, self._reported.get(field), value
+                    )
+                )
+                self._reported[field] = value
+
+        if sensors.humidity is not None:
+            events.extend(self._crossings(sensors.humidity, timestamp))
+
+        if not events:
+            self.suppressed += 1
+        return events
+
+    def reset(self) -> None:
+        """Forget the reported state, so the next sample is reported in full."""
+        self._mode = None
+        self._reported.clear()
+        self._above.clear()
+
+    def _moved(self, field: str, value: float) -> bool:
+        reported = self._reported.get(field)
+        return reported is None or abs(value - reported) >= self.deadbands[field]
+
+    def _crossings(self, humidity: float, timestamp: float) -> list[SensorEvent]:
+        events: list[SensorEvent] = []
+        for threshold in self.humidity_thresholds:
+            above = self._above.get(threshold)
+            if above is None:
+                self._above[threshold] = humidity >= threshold
+            elif not above and humidity >= threshold:
+                self._above[threshold] = True
+                events.append(
+                    HumidityThresholdCrossed(timestamp, threshold, humidity, True)
+                )
+            elif above and humidity < threshold - self.hysteresis:
+                self._above[threshold] = False
+                events.append(
+                    HumidityThresholdCrossed(timestamp, threshold, humidity, False)
+                )
+        return events
+
+
+async def detect_changes(
+    samples: AsyncIterable[SkySensors], detector: ChangeDetector | None = None
+) -> AsyncIterator[SensorEvent]:
+    """Yield the change events of a stream of samples."""
+    if detector is None:
+        detector = ChangeDetector()
+    async for sensors in samples:
+        for event in detector.process(sensors):
+            yield event
@@ -0,0 +1,253 @@
+"""Prometheus exporter for Fresh Intellivent Sky devices."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from contextlib import suppress
+from typing import Any, Union
+
+from .fleet import FreshIntelliventFleet
+from .snapshot import SkySnapshot
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+_SENSORS = (
+    ("temperature", "temperature_celsius", "Temperature in degrees Celsius."),
+    (
+        "temperature_avg",
+        "temperature_average_celsius",
+        "Average temperature in degrees Celsius.",
+    ),
+    ("humidity", "humidity_percent", "Relative humidity in percent."),
+    ("rpm", "fan_rpm", "Fan speed in revolutions per minute."),
+    ("mode_raw", "mode", "Active mode as reported by the device."),
+)
+
+_OPERATIONS = (
+    ("count", "operations_total", "BLE operations done."),
+    ("errors", "operation_errors_total", "BLE operations that failed."),
+    ("timeouts", "operation_timeouts_total", "BLE operations that timed out."),
+    ("total", "operation_seconds_total", "Time spent in BLE operations."),
+)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _flatten(values: dict[str, Any], prefix: str = "") -> dict[str, float]:
+    """Return the numeric settings of a mode, with nested keys joined by _."""
+    result: dict[str, float] = {}
+    for key, value in values.items():
+        if isinstance(value, dict):
+            result.update(_flatten(value, f"{prefix}{key}_"))
+        elif isinstance(value, (bool, int, float)):
+            result[f"{prefix}{key}"] = float(value)
+    return result
+
+
+class PrometheusExporter:  # pylint: disable=too-many-instance-attributes
+    """Serve the state of a fleet in the Prometheus text format.
+
+    The fleet is refreshed every interval seconds in the background, and
+    each refresh renders the page that is served to scrapers, so scrapes
+    never cause BLE traffic and cost the same however slow the fans are.
+    Devices with metrics enabled also export their operation counters.
+    """
+
+    def __init__(
+        self,
+        fleet: FreshIntelliventFleet,
+        host: str = "127.0.0.1",
+        port: int = 9842,
+        interval: float = 60.0,
+        prefix: str = "fresh_intellivent",
+    ) -> None:
+        self.fleet = fleet
+        self.host = host
+        self.port = port
+        self.interval = interval
+        self.prefix = prefix
+        self.updated: dict[str, float] = {}
+        self._page = b""
+        self._server: asyncio.Server | None = None
+        self._poller: asyncio.Task[None] | None = None
+
+    @property
+    def page(self) -> bytes:
+        """Return the page served to scrapers."""
+        return self._page
+
+    async def start(self) -> None:
+        """Start the HTTP server and the background poller."""
+        self._server = await asyncio.start_server(self._handle, self.host, self.port)
+        if self.port == 0:
+            self.port = self._server.sockets[0].getsockname()[1]
+        self._poller = asyncio.create_task(self._poll())
+        logging.debug("Serving metrics on %s:%d", self.host, self.port)
+
+    async def stop(self) -> None:
+        """Stop the HTTP server and the background poller."""
+        if self._poller is not None:
+            self._poller.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._poller
+            self._poller = None
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    async def __aenter__(self) -> PrometheusExporter:
+        await self.start()
+        return self
+
+    async def __aexit__(self, *args: object) -> None:
+        await self.stop()
+
+    async def refresh(self) -> None:
+        """Refresh the fleet and render a new page."""
+        result = await self.fleet.refresh()
+        now = time.time()
+        for address in result.snapshots:
+            self.updated[address] = now
+        self._page = self.render(result.errors).encode()
+
+    def render(self, errors: Union[dict[str, Exception], None] = None) -> str:
+        """Render the cached state of every device in the fleet."""
+        errors = errors or {}
+        devices = self.fleet.devices
+        snapshots = self.fleet.snapshots
+        lines: list[str] = []
+
+        def metric(
+            name: str,
+            help_text: str,
+            samples: list[tuple[str, Any]],
+            kind: str = "gauge",
+        ) -> None:
+            if not samples:
+                return
+            name = f"{self.prefix}_{name}"
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+            lines.extend(f"{name}{{{label}}} {value}" for label, value in samples)
+
+        def labels(address: str, **extra: str) -> str:
+            pairs = {"address": address, **extra}
+            return ",".join(f'{key}="{_escape(value)}"' for key, value in pairs.items())
+
+        metric(
+            "up",
+            "Whether the last refresh of the device succeeded.",
+            [(labels(address), int(address not in errors)) for address in devices],
+        )
+        metric(
+            "last_refresh_timestamp_seconds",
+            "Time of the last successful refresh.",
+            [(labels(address), value) for address, value in self.updated.items()],
+        )
+
+        cached: dict[str, SkySnapshot] = {
+            address: snapshot
+            for address, snapshot in snapshots.items()
+            if address in devices
+        }
+        for attribute, name, help_text in _SENSORS:
+            metric(
+                name,
+                help_text,
+                [
+                    (labels(address), value)
+                    for address, snapshot in cached.items()
+                    if (value := getattr(snapshot.sensors, attribute)) is not None
+                ],
+            )
+        metric(
+            "mode_info",
+            "Name of the active mode.",
+            [
+                (labels(address, mode=snapshot.sensors.mode), 1)
+                for address, snapshot in cached.items()
+                if snapshot.sensors.mode is not None
+            ],
+        )
+        metric(
+            "setting",
+            "Mode settings, booleans are 0 or 1.",
+            [
+                (labels(address, mode=mode_name, setting=setting), value)
+                for address, snapshot in cached.items()
+                for mode_name, mode in snapshot.modes.items()
+                for setting, value in _flatten(mode.as_dict()).items()
+            ],
+        )
+
+        operations = [
+            (address, operation, stats)
+            for address, device in devices.items()
+            if device.metrics is not None
+            for operation, stats in device.metrics.operations.items()
+        ]
+        metric(
+            "queue_max_depth",
+            "Most GATT operations that waited for their turn at once.",
+            [
+                (labels(address), device.operations.max_depth)
+                for address, device in devices.items()
+            ],
+        )
+        metric(
+            "queue_wait_seconds_total",
+            "Time GATT operations spent waiting for their turn.",
+            [
+                (labels(address), device.operations.wait_time)
+                for address, device in devices.items()
+            ],
+            kind="counter",
+        )
+        for attribute, name, help_text in _OPERATIONS:
+            metric(
+                name,
+                help_text,
+                [
+                    (labels(address, operation=operation), getattr(stats, attribute))
+                    for address, operation, stats in operations
+                ],
+                kind="counter",
+            )
+        return "\n".join(lines) + "\n"
+
+    async def _poll(self) -> None:
+        while True:
+            try:
+                await self.refresh()
+            except Exception:  # pylint: disable=broad-exception-caught
+                logging.exception("Failed to refresh the fleet")
+            await asyncio.sleep(self.interval)
+
+    async def _handle(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        try:
+            request = await reader.readline()
+            while (await reader.readline()).strip():
+                pass
+            parts = request.decode("latin-1").split()
+            if len(parts) >= 2 and parts[0] == "GET" and parts[1] == "/metrics":
+                status, body = "200 OK", self._page
+            else:
+                status, body = "404 Not Found", b"Not found\n"
+            writer.write(
+                f"HTTP/1.1 {status}\r\n"
+                f"Content-Type: {CONTENT_TYPE}\r\n"
+                f"Content-Length: {len(body)}\r\n"
+                "Connection: close\r\n\r\n".encode() + body
+            )
+            await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            logging.debug("Scrape connection closed early")
+        finally:
+            writer.close()
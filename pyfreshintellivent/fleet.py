@@ -0,0 +1,179 @@
+"""Manage many Fresh Intellivent Sky devices from one gateway."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from typing import Union
+
+from . import FreshIntelliVent
+from .snapshot import SkySnapshot
+
+DEFAULT_ADAPTER = "default"
+
+
+@dataclass
+class FleetResult:
+    """Result of refreshing every device in a fleet."""
+
+    snapshots: dict[str, SkySnapshot] = field(default_factory=dict)
+    errors: dict[str, Exception] = field(default_factory=dict)
+    elapsed: float = 0.0
+
+    @property
+    def fans_per_minute(self) -> float:
+        """Return the number of devices successfully refreshed per minute."""
+        if self.elapsed <= 0:
+            return 0.0
+        return len(self.snapshots) / self.elapsed * 60
+
+
+@dataclass
+class _FleetMember:
+    device: FreshIntelliVent
+    adapter: str
+    authentication_code: Union[bytes, bytearray, str, None]
+
+
+# pylint: disable=too-many-instance-attributes
+class FreshIntelliventFleet:
+    """Poll many Fresh Intellivent Sky devices with bounded concurrency."""
+
+    def __init__(
+        self,
+        concurrency: int = 3,
+        timeout: float = 30.0,
+        keep_connected: bool = False,
+    ) -> None:
+        """Create a fleet.
+
+        concurrency limits the number of devices polled at once per BLE
+        adapter, and timeout bounds the time a single device may take.
+        """
+        self.concurrency = concurrency
+        self.timeout = timeout
+        self.keep_connected = keep_connected
+        self.snapshots: dict[str, SkySnapshot] = {}
+        self.last_result: FleetResult | None = None
+        self._members: dict[str, _FleetMember] = {}
+        self._semaphores: dict[str, asyncio.Semaphore] = {}
+        self._rotation = 0
+
+    @property
+    def devices(self) -> dict[str, FreshIntelliVent]:
+        """Return the managed devices by address."""
+        return {address: m.device for address, m in self._members.items()}
+
+    @property
+    def fans_per_minute(self) -> float:
+        """Return the throughput of the last refresh."""
+        if self.last_result is None:
+            return 0.0
+        return self.last_result.fans_per_minute
+
+    def add(
+        self,
+        device: FreshIntelliVent,
+        authentication_code: Union[bytes, bytearray, str, None] = None,
+        adapter: str = DEFAULT_ADAPTER,
+    ) -> None:
+        """Add a device to the fleet."""
+        self._members[device.address] = _FleetMember(
+            device=device, adapter=adapter, authentication_code=authentication_code
+        )
+
+    def remove(self, address: str) -> None:
+        """Remove a device from the fleet."""
+        self._members.pop(address, None)
+        self.snapshots.pop(address, None)
+
+    async def refresh(self, addresses: Iterable[str] | None = None) -> FleetResult:
+        """Refresh every device in the fleet, or only those in addresses.
+
+        Devices on different adapters are interleaved, and the starting point
+        rotates between refreshes so no device is always polled last.
+        """
+        result = FleetResult()
+        start = time.monotonic()
+        schedule = self._schedule()
+        if addresses is not None:
+            wanted = set(addresses)
+            schedule = [m for m in schedule if m.device.address in wanted]
+        await asyncio.gather(
+            *(self._refresh_member(member, result) for member in schedule)
+        )
+        result.elapsed = time.monotonic() - start
+        self.last_result = result
+
+        logging.debug(
+            "Refreshed %d of %d devices in %.1fs (%.1f fans/min)",
+            len(result.snapshots),
+            len(schedule),
+            result.elapsed,
+            result.fans_per_minute,
+        )
+        return result
+
+    async def close(self) -> None:
+        """Disconnect every device in the fleet."""
+        await asyncio.gather(
+            *(m.device.disconnect() for m in self._members.values()),
+            return_exceptions=True,
+        )
+
+    def _schedule(self) -> list[_FleetMember]:
+        """Return the members in a fair, round-robin order across adapters."""
+        members = list(self._members.values())
+        if not members:
+            return []
+        self._rotation %= len(members)
+        members = members[self._rotation :] + members[: self._rotation]
+        self._rotation += 1
+
+        by_adapter: dict[str, list[_FleetMember]] = {}
+        for member in members:
+            by_adapter.setdefault(member.adapter, []).append(member)
+        queues = list(by_adapter.values())
+        return [
+            queue[i]
+            for i in range(max(len(queue) for queue in queues))
+            for queue in queues
+            if i < len(queue)
+        ]
+
+    async def _refresh_member(self, member: _FleetMember, result: FleetResult) -> None:
+        semaphore = self._semaphores.setdefault(
+            member.adapter, asyncio.Semaphore(self.concurrency)
+        )
+        address = member.device.address
+        async with semaphore:
+            try:
+                snapshot = await asyncio.wait_for(
+                    self._poll(member), timeout=self.timeout
+                )
+            except Exception as exc:  # pylint: disable=broad-exception-caught
+                logging.info("Failed to refresh %s: %s", address, exc)
+                result.errors[address] = exc
+                await self._disconnect(member)
+            else:
+                result.snapshots[address] = snapshot
+                self.snapshots[address] = snapshot
+                if not self.keep_connected:
+                    await self._disconnect(member)
+
+    async def _poll(self, member: _FleetMember) -> SkySnapshot:
+        device = member.device
+        if not device.is_connected:
+            await device.connect()
+            if member.authentication_code is not None:
+                await device.authenticate(member.authentication_code)
+        return await device.fetch_all()
+
+    async def _disconnect(self, member: _FleetMember) -> None:
+        try:
+            await member.device.disconnect()
+        except Exception:  # pylint: disable=broad-exception-caught
+            logging.debug("Failed to disconnect %s", member.device.address)
@@ -0,0 +1,146 @@
+"""Fixed-size sensor history with rolling statistics."""
+
+from __future__ import annotations
+
+import math
+import time
+from array import array
+from collections import deque
+from dataclasses import dataclass
+
+from .sensors import SkySensors
+
+FIELDS = ("humidity", "temperature", "rpm")
+
+
+@dataclass(frozen=True, slots=True)
+class WindowStats:
+    """Statistics over the most recent samples of a sensor value."""
+
+    samples: int
+    mean: float
+    min: float
+    max: float
+    rate: float
+
+
+class _RollingWindow:  # pylint: disable=too-few-public-methods
+    """Running sum and monotonic min/max queues over the last size samples."""
+
+    __slots__ = ("size", "total", "valid", "minimums", "maximums")
+
+    def __init__(self, size: int) -> None:
+        self.size = size
+        self.total = 0.0
+        self.valid = 0
+        self.minimums: deque[tuple[int, float]] = deque()
+        self.maximums: deque[tuple[int, float]] = deque()
+
+    def push(self, seq: int, value: float, dropped: float | None) -> None:
+        """Add a value, and remove the one that fell out of the window."""
+        if dropped is not None and not math.isnan(dropped):
+            self.total -= dropped
+            self.valid -= 1
+        oldest = seq - self.size
+        while self.minimums and self.minimums[0][0] <= oldest:
+            self.minimums.popleft()
+        while self.maximums and self.maximums[0][0] <= oldest:
+            self.maximums.popleft()
+        if math.isnan(value):
+            return
+
+        self.total += value
+        self.valid += 1
+        while self.minimums and self.minimums[-1][1] >= value:
+            self.minimums.pop()
+        self.minimums.append((seq, value))
+        while self.maximums and self.maximums[-1][1] <= value:
+            self.maximums.pop()
+        self.maximums.append((seq, value))
+
+
+class SensorHistory:
+    """Ring buffer of recent humidity, temperature and RPM samples.
+
+    Memory is fixed by capacity. Statistics are kept incrementally for each
+    window, given as a number of samples no larger than capacity, so reading
+    them never scans the buffer.
+    """
+
+    def __init__(self, capacity: int = 256, windows: tuple[int, ...] = (10, 60)):
+        if any(window < 1 or window > capacity for window in windows):
+            raise ValueError(f"Windows need to be between 1 and {capacity}.")
+
+        self.capacity = capacity
+        self.windows = windows
+        self._count = 0
+        self._timestamps = array("d", bytes(8 * capacity))
+        self._values = {name: array("d", bytes(8 * capacity)) for name in FIELDS}
+        self._rolling = {
+            name: {window: _RollingWindow(window) for window in windows}
+            for name in FIELDS
+        }
+
+    def __len__(self) -> int:
+        return min(self._count, self.capacity)
+
+    def append(self, sensors: SkySensors, timestamp: float | None = None) -> None:
+        """Append a sensor sample. Missing values are stored as NaN."""
+        seq = self._count
+        index = seq % self.capacity
+        self._timestamps[index] = time.monotonic() if timestamp is None else timestamp
+
+        for name in FIELDS:
+            raw = getattr(sensors, name)
+            value = math.nan if raw is None else float(raw)
+            values = self._values[name]
+            rollings = self._rolling[name]
+            for window, rolling in rollings.items():
+                dropped = values[(seq - window) % self.capacity]
+                rolling.push(seq, value, dropped if seq >= window else None)
+            values[index] = value
+
+            # Recompute the sums once per window length so floating point
+            # drift cannot build up, which keeps the cost amortized O(1).
+            for window, rolling in rollings.items():
+                if (seq + 1) % window == 0:
+                    recent = [
+                        values[i % self.capacity]
+                        for i in range(seq + 1 - window, seq + 1)
+                    ]
+                    rolling.total = math.fsum(v for v in recent if not math.isnan(v))
+
+        self._count += 1
+
+    def values(self, name: str) -> list[float]:
+        """Return the stored values of a field, oldest first."""
+        values = self._values[name]
+        if self._count <= self.capacity:
+            return list(values[: self._count])
+        index = self._count % self.capacity
+        return list(values[index:]) + list(values[:index])
+
+    def latest(self, name: str) -> float | None:
+        """Return the most recent value of a field."""
+        if not self._count:
+            return None
+        return self._values[name][(self._count - 1) % self.capacity]
+
+    def stats(self, name: str, window: int) -> WindowStats | None:
+        """Return rolling statistics of a field over a configured window."""
+        rolling = self._rolling[name][window]
+        if not rolling.valid:
+            return None
+
+        newest = (self._count - 1) % self.capacity
+        oldest = (self._count - min(window, self._count)) % self.capacity
+        values = self._values[name]
+        elapsed = self._timestamps[newest] - self._timestamps[oldest]
+        change = values[newest] - values[oldest]
+        return WindowStats(
+            samples=rolling.valid,
+            mean=rolling.total / rolling.valid,
+            min=rolling.minimums[0][1],
+            max=rolling.maximums[0][1],
+            rate=change / elapsed if elapsed > 0 and not math.isnan(change) else 0.0,
+        )
@@ -0,0 +1,100 @@
+"""Operation metrics for Fresh Intellivent Sky devices."""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+from typing import Any, Union
+from uuid import UUID
+
+# Upper bounds in seconds of the latency histogram buckets.
+BUCKETS = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class OperationStats:
+    """Counters and latency histogram for one kind of operation."""
+
+    __slots__ = ("count", "errors", "timeouts", "total", "maximum", "buckets")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.errors = 0
+        self.timeouts = 0
+        self.total = 0.0
+        self.maximum = 0.0
+        self.buckets = [0] * (len(BUCKETS) + 1)
+
+    def record(self, elapsed: float, error: BaseException | None) -> None:
+        """Count an operation that took elapsed seconds."""
+        self.count += 1
+        if error is not None:
+            if isinstance(error, TimeoutError):
+                self.timeouts += 1
+            else:
+                self.errors += 1
+        self.total += elapsed
+        self.maximum = max(self.maximum, elapsed)
+        self.buckets[bisect_left(BUCKETS, elapsed)] += 1
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the stats as a dictionary, with per bucket counts."""
+        histogram = {str(bound): count for bound, count in zip(BUCKETS, self.buckets)}
+        histogram["+Inf"] = self.buckets[-1]
+        return {
+            "count": self.count,
+            "errors": self.errors,
+            "timeouts": self.timeouts,
+            "total": self.total,
+            "mean": self.total / self.count if self.count else 0.0,
+            "max": self.maximum,
+            "histogram": histogram,
+        }
+
+
+class Metrics:
+    """Operation metrics of a device, per operation and per characteristic.
+
+    Operations are connect, authenticate, read and write. Reads and writes
+    are also counted per characteristic UUID. Failures raising TimeoutError
+    count as timeouts, any other exception as an error.
+    """
+
+    def __init__(self) -> None:
+        self.operations: dict[str, OperationStats] = {}
+        self.characteristics: dict[str, dict[str, OperationStats]] = {}
+
+    def record(
+        self,
+        operation: str,
+        elapsed: float,
+        uuid: Union[UUID, str, None] = None,
+        error: BaseException | None = None,
+    ) -> None:
+        """Record an operation that took elapsed seconds."""
+        stats = self.operations.get(operation)
+        if stats is None:
+            stats = self.operations[operation] = OperationStats()
+        stats.record(elapsed, error)
+
+        if uuid is not None:
+            per_uuid = self.characteristics.setdefault(str(uuid), {})
+            stats = per_uuid.get(operation)
+            if stats is None:
+                stats = per_uuid[operation] = OperationStats()
+            stats.record(elapsed, error)
+
+    def reset(self) -> None:
+        """Forget everything recorded so far."""
+        self.operations.clear()
+        self.characteristics.clear()
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a snapshot of the metrics as plain dictionaries."""
+        return {
+            "operations": {
+                name: stats.as_dict() for name, stats in self.operations.items()
+            },
+            "characteristics": {
+                uuid: {name: stats.as_dict() for name, stats in operations.items()}
+                for uuid, operations in self.characteristics.items()
+            },
+        }
@@ -0,0 +1,150 @@
+"""Typed mode settings for Fresh Intellivent Sky devices."""
+
+from __future__ import annotations
+
+from typing import Any, NamedTuple
+
+
+class ModeSettings(tuple[Any, ...]):
+    """Base class for immutable mode settings.
+
+    Mode settings are named tuples, which are cheap to create and hold no
+    per-instance dictionary. Supports item access by name, e.g.
+    ``mode["rpm"]``, for compatibility with the dictionaries that were
+    returned before. Settings of different types never compare equal.
+    """
+
+    __slots__ = ()
+
+    def __getitem__(self, key: Any) -> Any:
+        if not isinstance(key, str):
+            return tuple.__getitem__(self, key)
+        if key not in self.fields():
+            raise KeyError(key)
+        return getattr(self, key)
+
+    @classmethod
+    def fields(cls) -> tuple[str, ...]:
+        """Return the names of the settings, in order."""
+        fields: tuple[str, ...] = getattr(cls, "_fields")
+        return fields
+
+    def __eq__(self, other: object) -> bool:
+        return type(self) is type(other) and tuple.__eq__(self, other)
+
+    def __ne__(self, other: object) -> bool:
+        return not self == other
+
+    __hash__ = tuple.__hash__
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the settings as a dictionary."""
+        return {
+            key: value.as_dict() if isinstance(value, ModeSettings) else value
+            for key, value in zip(self.fields(), self)
+        }
+
+
+class _DetectionSettings(NamedTuple):
+    enabled: bool
+    detection: str
+    detection_raw: int
+
+
+class DetectionSettings(ModeSettings, _DetectionSettings):
+    """Sensor detection settings."""
+
+    __slots__ = ()
+
+
+class _HumidityMode(NamedTuple):
+    enabled: bool
+    detection: str
+    detection_raw: int
+    rpm: int
+
+
+class HumidityMode(ModeSettings, _HumidityMode):
+    """Humidity mode settings."""
+
+    __slots__ = ()
+
+
+class _LightAndVocMode(NamedTuple):
+    light: DetectionSettings
+    voc: DetectionSettings
+
+
+class LightAndVocMode(ModeSettings, _LightAndVocMode):
+    """Light and VOC mode settings."""
+
+    __slots__ = ()
+
+
+class _ConstantSpeedMode(NamedTuple):
+    enabled: bool
+    rpm: int
+
+
+class ConstantSpeedMode(ModeSettings, _ConstantSpeedMode):
+    """Constant speed mode settings."""
+
+    __slots__ = ()
+
+
+class _TimerDelay(NamedTuple):
+    enabled: bool
+    minutes: int
+
+
+class TimerDelay(ModeSettings, _TimerDelay):
+    """Timer delay settings."""
+
+    __slots__ = ()
+
+
+class _TimerMode(NamedTuple):
+    minutes: int
+    delay: TimerDelay
+    rpm: int
+
+
+class TimerMode(ModeSettings, _TimerMode):
+    """Timer mode settings."""
+
+    __slots__ = ()
+
+
+class _AiringMode(NamedTuple):
+    enabled: bool
+    minutes: int
+    rpm: int
+
+
+class AiringMode(ModeSettings, _AiringMode):
+    """Airing mode settings."""
+
+    __slots__ = ()
+
+
+class _PauseMode(NamedTuple):
+    enabled: bool
+    minutes: int
+
+
+class PauseMode(ModeSettings, _PauseMode):
+    """Pause mode settings."""
+
+    __slots__ = ()
+
+
+class _BoostMode(NamedTuple):
+    enabled: bool
+    rpm: int
+    seconds: int
+
+
+class BoostMode(ModeSettings, _BoostMode):
+    """Boost mode settings."""
+
+    __slots__ = ()
@@ -0,0 +1,113 @@
+"""GATT operation queue for Fresh Intellivent Sky devices."""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from typing import Any
+
+# Lower values are served first.
+PRIORITY_WRITE = 0
+PRIORITY_READ = 10
+
+
+class OperationQueue:  # pylint: disable=too-many-instance-attributes
+    """Serialize the GATT operations on one device, by priority.
+
+    At most concurrency operations run at once. Others wait in the queue and
+    are started lowest priority value first, in arrival order within the
+    same priority, so a write issued while reads are queued is sent as soon
+    as the running operation is done. Cancelling a waiting operation removes
+    it from the queue.
+    """
+
+    def __init__(self, concurrency: int = 1) -> None:
+        self.concurrency = concurrency
+        self.active = 0
+        self.max_depth = 0
+        self.completed = 0
+        self.cancelled = 0
+        self.wait_time = 0.0
+        self._waiters: list[tuple[int, int, asyncio.Future[None]]] = []
+        self._sequence = itertools.count()
+
+    @property
+    def depth(self) -> int:
+        """Return the number of operations waiting in the queue."""
+        return sum(1 for _, _, future in self._waiters if not future.done())
+
+    @asynccontextmanager
+    async def slot(self, priority: int = PRIORITY_READ) -> AsyncIterator[None]:
+        """Wait for a turn to run an operation, and hold it while in the block."""
+        await self._acquire(priority)
+        try:
+            yield
+        finally:
+            self.active -= 1
+            self.completed += 1
+            self._wake()
+
+    def cancel(
+        self, priority: int | None = None, exc: BaseException | None = None
+    ) -> int:
+        """Fail the waiting operations, or those with the given priority.
+
+        Waiters are cancelled, or get exc raised if it is given. Returns the
+        number of operations that were waiting.
+        """
+        count = 0
+        for waiter_priority, _, future in self._waiters:
+            if future.done() or priority not in (None, waiter_priority):
+                continue
+            if exc is None:
+                future.cancel()
+            else:
+                future.set_exception(exc)
+            count += 1
+        return count
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the queue metrics as a dictionary."""
+        return {
+            "concurrency": self.concurrency,
+            "active": self.active,
+            "depth": self.depth,
+            "max_depth": self.max_depth,
+            "completed": self.completed,
+            "cancelled": self.cancelled,
+            "wait_time": self.wait_time,
+        }
+
+    async def _acquire(self, priority: int) -> None:
+        if self.active < self.concurrency and not self.depth:
+            self.active += 1
+            return
+
+        future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (priority, next(self._sequence), future))
+        self.max_depth = max(self.max_depth, self.depth)
+        start = time.monotonic()
+        try:
+            await future
+        except BaseException:
+            if future.done() and not future.cancelled() and not future.exception():
+                # The turn was handed over just as the waiter was cancelled.
+                self.active -= 1
+                self._wake()
+            self.cancelled += 1
+            raise
+        finally:
+            self.wait_time += time.monotonic() - start
+
+    def _wake(self) -> None:
+        """Hand free slots to the first waiters in the queue."""
+        while self.active < self.concurrency and self._waiters:
+            _, _, future = heapq.heappop(self._waiters)
+            if future.done():
+                continue
+            future.set_result(None)
+            self.active += 1
@@ -0,0 +1,161 @@
+"""Adaptive polling for Fresh Intellivent Sky devices."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from typing import Any
+
+from .fleet import FreshIntelliventFleet
+from .sensors import SkySensors
+from .snapshot import SkySnapshot
+
+# How calm each mode is, from 0 (poll at the floor) to 1 (at the ceiling).
+MODE_CALMNESS = {
+    "Off": 1.0,
+    "Constant speed": 1.0,
+    "Pause": 0.5,
+    "Light": 0.25,
+    "VOC": 0.25,
+    "Timer": 0.25,
+    "Humidity": 0.0,
+    "Boost": 0.0,
+}
+DEFAULT_CALMNESS = 0.5
+
+
+@dataclass
+class _Sample:
+    sensors: SkySensors
+    timestamp: float
+
+
+class AdaptivePollScheduler:
+    """Pick the next poll time of each device from its state.
+
+    Calm devices, e.g. off or at constant speed, are polled every ceiling
+    seconds and busy ones, e.g. boosting or in humidity mode, every floor
+    seconds. Humidity or temperature changing by humidity_rate percent or
+    temperature_rate degrees per minute also brings polling down to the
+    floor. Polls are moved forward to when an active boost, pause or
+    timer ends, so the mode change is seen right away.
+    """
+
+    def __init__(
+        self,
+        floor: float = 10.0,
+        ceiling: float = 300.0,
+        humidity_rate: float = 1.0,
+        temperature_rate: float = 0.2,
+    ) -> None:
+        if not 0 < floor <= ceiling:
+            raise ValueError("floor must be positive and at most ceiling")
+        self.floor = floor
+        self.ceiling = ceiling
+        self.humidity_rate = humidity_rate
+        self.temperature_rate = temperature_rate
+        self.next_poll: dict[str, float] = {}
+        self._samples: dict[str, _Sample] = {}
+
+    def interval(
+        self,
+        sensors: SkySensors,
+        modes: dict[str, Any] | None = None,
+        previous: SkySensors | None = None,
+        elapsed: float = 0.0,
+    ) -> float:
+        """Return the seconds until the next poll of a device.
+
+        previous is the sample taken elapsed seconds before sensors.
+        """
+        calmness = MODE_CALMNESS.get(sensors.mode or "", DEFAULT_CALMNESS)
+        if previous is not None and elapsed > 0:
+            calmness *= 1 - self._volatility(sensors, previous, elapsed)
+        interval = self.floor + (self.ceiling - self.floor) * calmness
+
+        for remaining in self._remaining(sensors, modes or {}):
+            interval = min(interval, remaining)
+        return max(self.floor, min(interval, self.ceiling))
+
+    def update(
+        self,
+        address: str,
+        sensors: SkySensors,
+        modes: dict[str, Any] | None = None,
+        now: float | None = None,
+    ) -> float:
+        """Record a sample of a device and return when to poll it next."""
+        if now is None:
+            now = time.monotonic()
+        sample = self._samples.get(address)
+        interval = self.interval(
+            sensors,
+            modes,
+            previous=sample.sensors if sample else None,
+            elapsed=now - sample.timestamp if sample else 0.0,
+        )
+        self._samples[address] = _Sample(sensors=sensors, timestamp=now)
+        self.next_poll[address] = now + interval
+        return self.next_poll[address]
+
+    def due(self, addresses: list[str], now: float | None = None) -> list[str]:
+        """Return the addresses that should be polled now, most overdue first."""
+        if now is None:
+            now = time.monotonic()
+        due = [a for a in addresses if self.next_poll.get(a, now) <= now]
+        return sorted(due, key=lambda address: self.next_poll.get(address, now))
+
+    def forget(self, address: str) -> None:
+        """Forget a device, so it is due right away."""
+        self.next_poll.pop(address, None)
+        self._samples.pop(address, None)
+
+    async def run(self, fleet: FreshIntelliventFleet) -> None:
+        """Keep refreshing the devices of a fleet when they are due."""
+        while True:
+            addresses = list(fleet.devices)
+            if due := self.due(addresses):
+                result = await fleet.refresh(due)
+                now = time.monotonic()
+                for address in due:
+                    snapshot: SkySnapshot | None = result.snapshots.get(address)
+                    if snapshot is not None:
+                        self.update(address, snapshot.sensors, snapshot.modes, now)
+                    else:
+                        self.next_poll[address] = now + self.floor
+                logging.debug("Polled %d of %d devices", len(due), len(addresses))
+
+            upcoming = [self.next_poll.get(a, 0.0) for a in fleet.devices]
+            wake = min(upcoming, default=time.monotonic() + self.floor)
+            await asyncio.sleep(max(0.0, wake - time.monotonic()))
+
+    def _volatility(
+        self, sensors: SkySensors, previous: SkySensors, elapsed: float
+    ) -> float:
+        """Return how fast the climate changes, from 0 (stable) to 1."""
+        volatility = 0.0
+        for current, before, rate in (
+            (sensors.humidity, previous.humidity, self.humidity_rate),
+            (sensors.temperature, previous.temperature, self.temperature_rate),
+        ):
+            if current is not None and before is not None:
+                per_minute = abs(current - before) / elapsed * 60
+                volatility = max(volatility, per_minute / rate)
+        return min(volatility, 1.0)
+
+    @staticmethod
+    def _remaining(sensors: SkySensors, modes: dict[str, Any]) -> list[float]:
+        """Return the durations of the active boost, pause or timer.
+
+        These bound the time the mode has left, as when it started is unknown.
+        """
+        remaining = []
+        if sensors.mode == "Boost" and (boost := modes.get("boost")) is not None:
+            remaining.append(float(boost.seconds))
+        if sensors.mode == "Pause" and (pause := modes.get("pause")) is not None:
+            remaining.append(pause.minutes * 60.0)
+        if sensors.mode == "Timer" and (timer := modes.get("timer")) is not None:
+            remaining.append(timer.minutes * 60.0)
+        return remaining
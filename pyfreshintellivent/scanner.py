@@ -1,5 +1,17 @@
 """BLE device scanner for Fresh Intellivent Sky devices."""
 
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import functools
+import logging
+import time
+from collections.abc import AsyncIterator, Iterable
+from dataclasses import dataclass, field
+from types import TracebackType
+from typing import Callable
+
 from bleak import BleakScanner
 from bleak.backends.device import BLEDevice
 from bleak.backends.scanner import AdvertisementData
@@ -7,11 +19,148 @@ from bleak.backends.scanner import AdvertisementData
 from . import characteristics, consts
 
 
+@dataclass
+class SkyAdvertisement:
+    """Latest advertisement seen from a Fresh Intellivent Sky device."""
+
+    device: BLEDevice
+    rssi: int
+    last_seen: float
+    manufacturer_data: dict[int, bytes] = field(default_factory=dict)
+    service_data: dict[str, bytes] = field(default_factory=dict)
+
+    @property
+    def address(self) -> str:
+        """Return the address of the device."""
+        return self.device.address
+
+
+class SkyMonitor:
+    """Passively monitor advertisements from Fresh Intellivent Sky devices.
+
+    Keeps the latest advertisement per address without connecting, updating
+    the entry of a device in place so references to it stay current. The
+    broadcast payload is not documented, so manufacturer and service data
+    are kept raw next to the RSSI and the time the device was last seen.
+    """
+
+    def __init__(
+        self,
+        callback: Callable[[SkyAdvertisement], None] | None = None,
+    ) -> None:
+        self.devices: dict[str, SkyAdvertisement] = {}
+        self._callbacks: list[Callable[[SkyAdvertisement], None]] = []
+        if callback is not None:
+            self._callbacks.append(callback)
+        self._scanner = BleakScanner(detection_callback=self._on_advertisement)
+
+    def add_callback(
+        self, callback: Callable[[SkyAdvertisement], None]
+    ) -> Callable[[], None]:
+        """Call callback on every advertisement, returning a function to remove it."""
+        self._callbacks.append(callback)
+        return functools.partial(self._callbacks.remove, callback)
+
+    async def start(self) -> None:
+        """Start monitoring."""
+        await self._scanner.start()
+        logging.debug("Started monitoring advertisements")
+
+    async def stop(self) -> None:
+        """Stop monitoring."""
+        await self._scanner.stop()
+        logging.debug("Stopped monitoring advertisements")
+
+    async def __aenter__(self) -> SkyMonitor:
+        await self.start()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        await self.stop()
+
+    def _on_advertisement(
+        self, device: BLEDevice, advertisement_data: AdvertisementData
+    ) -> None:
+        if not device_filter(device, advertisement_data):
+            return
+
+        advertisement = self.devices.get(device.address)
+        if advertisement is None:
+            advertisement = SkyAdvertisement(
+                device=device,
+                rssi=advertisement_data.rssi,
+                last_seen=time.monotonic(),
+                manufacturer_data=dict(advertisement_data.manufacturer_data),
+                service_data=dict(advertisement_data.service_data),
+            )
+            self.devices[device.address] = advertisement
+        else:
+            advertisement.device = device
+            advertisement.rssi = advertisement_data.rssi
+            advertisement.last_seen = time.monotonic()
+            advertisement.manufacturer_data = dict(advertisement_data.manufacturer_data)
+            advertisement.service_data = dict(advertisement_data.service_data)
+        for callback in list(self._callbacks):
+            callback(advertisement)
+
+
 async def scan(timeout: float = 20.0) -> BLEDevice | None:
     """Scan for Fresh Intellivent Sky devices."""
     return await BleakScanner.find_device_by_filter(device_filter, timeout=timeout)
 
 
+async def discover(
+    timeout: float = 20.0,
+    addresses: Iterable[str] | None = None,
+    monitor: SkyMonitor | None = None,
+) -> AsyncIterator[SkyAdvertisement]:
+    """Discover Fresh Intellivent Sky devices as they are found.
+
+    Yields each device once, the first time it is seen, and stops after
+    timeout seconds or as soon as every address in addresses has been found.
+    The yielded entries are those of the monitor's devices, which keep
+    tracking RSSI and last seen while it runs. A monitor passed in is started
+    and stopped by the caller, so tracking can outlive the discovery, and its
+    known devices are yielded first. Without one, a monitor runs only for the
+    duration of the discovery.
+    """
+    expected = {address.upper() for address in addresses} if addresses else None
+    found: asyncio.Queue[SkyAdvertisement] = asyncio.Queue()
+    seen: set[str] = set()
+
+    def on_advertisement(advertisement: SkyAdvertisement) -> None:
+        if advertisement.address not in seen:
+            seen.add(advertisement.address)
+            found.put_nowait(advertisement)
+
+    deadline = time.monotonic() + timeout
+    async with contextlib.AsyncExitStack() as stack:
+        if monitor is None:
+            await stack.enter_async_context(SkyMonitor(callback=on_advertisement))
+        else:
+            stack.callback(monitor.add_callback(on_advertisement))
+            for advertisement in list(monitor.devices.values()):
+                on_advertisement(advertisement)
+
+        while expected is None or expected:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return
+            try:
+                advertisement = await asyncio.wait_for(found.get(), remaining)
+            except asyncio.TimeoutError:
+                return
+
+            if expected is not None:
+                expected.discard(advertisement.address.upper())
+            yield advertisement
+
+
 def device_filter(device: BLEDevice, advertisement_data: AdvertisementData) -> bool:
     """Filter BLE devices to identify Fresh Intellivent Sky devices."""
     uuids = advertisement_data.service_uuids
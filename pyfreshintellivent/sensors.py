@@ -1,11 +1,15 @@
 """Sensor data parsing for Fresh Intellivent Sky devices."""
 
+from __future__ import annotations
+
 from math import log
-from struct import unpack
-from typing import Any, Union
+from struct import Struct
+from typing import Any, NamedTuple, Union
 
 MODE_UNKNOWN = "Unknown"
 
+_FORMAT = Struct("<2B2H2B2H3B")
+
 _MODES = {
     0: "Off",
     6: "Pause",
@@ -18,41 +22,49 @@ _MODES = {
 }
 
 
-class SkySensors:  # pylint: disable=too-many-instance-attributes
-    """Sensor data container for Fresh Intellivent Sky devices."""
+class SkySensors(NamedTuple):
+    """Sensor data container for Fresh Intellivent Sky devices.
 
-    mode: Union[str, None]
-    mode_raw: Union[int, None]
-    status: Union[bool, None]
-    humidity: Union[float, None]
-    temperature: Union[float, None]
-    temperature_avg: Union[float, None]
-    unknowns: Union[list[int], None]
-    authenticated: Union[bool, None]
-    rpm: Union[int, None]
+    Sensor data is an immutable named tuple, use from_bytes() to parse a
+    frame from the device into a new instance.
+    """
 
-    def parse_data(self, data: Union[bytes, bytearray]) -> None:
+    mode: Union[str, None] = None
+    mode_raw: Union[int, None] = None
+    status: Union[bool, None] = None
+    humidity: Union[float, None] = None
+    temperature: Union[float, None] = None
+    temperature_avg: Union[float, None] = None
+    unknowns: Union[tuple[int, int, int, int], None] = None
+    authenticated: Union[bool, None] = None
+    rpm: Union[int, None] = None
+
+    @classmethod
+    def from_bytes(cls, data: Union[bytes, bytearray, memoryview]) -> SkySensors:
         """Parse raw sensor data from the device."""
         if data is None or len(data) != 15:
             raise ValueError(f"Length need to be exactly 15, was {len(data)}.")
 
-        values = unpack("<2B2H2B2H3B", data)
-
-        self.status = bool(values[0])
-        self.mode_raw = int(values[1])
-        if mode := _MODES.get(self.mode_raw):
-            self.mode = mode
-        else:
-            self.mode = MODE_UNKNOWN
+        values = _FORMAT.unpack_from(data)
 
+        humidity = None
         if values[2] != 0:
-            self.humidity = round((log(values[2] / 10) * 10), 1)
-        self.temperature = values[3] / 100
-        self.temperature_avg = values[7] / 100
-        self.unknowns = [values[4], values[8], values[9], values[10]]
-        self.authenticated = bool(values[5])
+            humidity = round((log(values[2] / 10) * 10), 1)
 
-        self.rpm = values[6]
+        return tuple.__new__(
+            cls,
+            (
+                _MODES.get(values[1], MODE_UNKNOWN),
+                values[1],
+                bool(values[0]),
+                humidity,
+                values[3] / 100,
+                values[7] / 100,
+                (values[4], values[8], values[9], values[10]),
+                bool(values[5]),
+                values[6],
+            ),
+        )
 
     def as_dict(self) -> dict[str, Any]:
         """Return sensor data as a dictionary."""
@@ -64,6 +76,6 @@ class SkySensors:  # pylint: disable=too-many-instance-attributes
             "temperature_avg": self.temperature_avg,
             "rpm": self.rpm,
             "humidity": self.humidity,
-            "unknowns": self.unknowns,
+            "unknowns": list(self.unknowns) if self.unknowns is not None else None,
             "authenticated": self.authenticated,
         }
@@ -0,0 +1,106 @@
+"""GATT service cache state of Fresh Intellivent Sky devices."""
+
+from __future__ import annotations
+
+import json
+import logging
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Union
+
+
+@dataclass
+class ServiceCacheEntry:
+    """Firmware version of a device, and whether its cached services are good."""
+
+    firmware: str | None
+    valid: bool = True
+
+
+class ServiceCache:
+    """Whether the BLE stack's cached GATT services can be used, by address.
+
+    connect() lets establish_connection use the services cached by bleak and
+    the BLE stack, unless the entry of the device was invalidated, because
+    its firmware version changed or a GATT operation failed in a way that
+    points to a stale service database. The next connect then does a full
+    service discovery, after which the entry is valid again. If a path is
+    given, the entries are persisted there as JSON.
+    """
+
+    def __init__(self, path: Union[str, Path, None] = None) -> None:
+        self.path = Path(path) if path is not None else None
+        self._entries: dict[str, ServiceCacheEntry] = {}
+        if self.path is not None and self.path.exists():
+            self.load()
+
+    def get(
+        self, address: str, firmware: str | None = None
+    ) -> ServiceCacheEntry | None:
+        """Return the entry for an address, if it matches firmware when given."""
+        entry = self._entries.get(address.upper())
+        if entry is None or firmware not in (None, entry.firmware):
+            return None
+        return entry
+
+    def use_cache(self, address: str) -> bool:
+        """Return False if the cached services of an address are stale."""
+        entry = self._entries.get(address.upper())
+        return entry is None or entry.valid
+
+    def add(self, address: str, firmware: str | None = None) -> None:
+        """Mark the services of an address as freshly discovered."""
+        self._entries[address.upper()] = ServiceCacheEntry(firmware=firmware)
+        self.save()
+
+    def invalidate(self, address: str) -> None:
+        """Mark the cached services of an address as stale."""
+        entry = self._entries.get(address.upper())
+        if entry is not None and entry.valid:
+            logging.debug("Invalidated cached services of %s", address)
+            entry.valid = False
+            self.save()
+
+    def check_firmware(self, address: str, firmware: str) -> None:
+        """Invalidate the services of an address if its firmware changed."""
+        entry = self._entries.get(address.upper())
+        if entry is None:
+            return
+        if entry.firmware is None:
+            entry.firmware = firmware
+            self.save()
+        elif entry.firmware != firmware:
+            logging.info(
+                "Firmware of %s changed from %s to %s",
+                address,
+                entry.firmware,
+                firmware,
+            )
+            entry.firmware = firmware
+            entry.valid = False
+            self.save()
+
+    def load(self) -> None:
+        """Load persisted entries."""
+        if self.path is None:
+            return
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+            entries = {
+                address: ServiceCacheEntry(**item) for address, item in data.items()
+            }
+        except (OSError, ValueError, TypeError, AttributeError) as exc:
+            logging.info("Failed to load service cache %s: %s", self.path, exc)
+            return
+        for address, entry in entries.items():
+            self._entries.setdefault(address, entry)
+
+    def save(self) -> None:
+        """Persist the entries."""
+        if self.path is None:
+            return
+        data = {address: asdict(entry) for address, entry in self._entries.items()}
+        try:
+            self.path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+        except OSError as exc:
+            logging.info("Failed to save service cache %s: %s", self.path, exc)
@@ -0,0 +1,388 @@
+"""In-process simulated Fresh Intellivent Sky device.
+
+SimulatedSkyDevice holds the state of a fan and SimulatedBleakClient talks to
+it through the same interface as BleakClient, so a FreshIntelliVent can be
+exercised end to end without a radio::
+
+    device = SimulatedSkyDevice(latency=0.02, jitter=0.01)
+    sky = FreshIntelliVent(device.ble_device, client_class=SimulatedBleakClient)
+    await sky.connect()
+    await sky.authenticate(device.authentication_code)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import random
+import time
+from math import exp
+from typing import Any, Callable, Union
+from uuid import UUID
+
+from bleak.backends.characteristic import BleakGATTCharacteristic
+from bleak.backends.device import BLEDevice
+from bleak.backends.service import BleakGATTServiceCollection
+from bleak.exc import BleakCharacteristicNotFoundError, BleakError
+
+from . import characteristics
+from .codec import CODECS
+from .consts import DEVICE_NAME
+from .sensors import _FORMAT
+
+MODE_OFF = 0
+MODE_PAUSE = 6
+MODE_CONSTANT_SPEED = 16
+MODE_TIMER = 35
+MODE_HUMIDITY = 49
+MODE_BOOST = 103
+
+# Relative humidity at which humidity mode starts, per detection level.
+HUMIDITY_THRESHOLDS = {0: 80.0, 1: 80.0, 2: 70.0, 3: 60.0}
+
+_DEFAULT_MODES = {
+    characteristics.HUMIDITY: bytes.fromhex("01022003"),
+    characteristics.LIGHT_VOC: bytes.fromhex("01010101"),
+    characteristics.CONSTANT_SPEED: bytes.fromhex("00b004"),
+    characteristics.TIMER: bytes.fromhex("050002e803"),
+    characteristics.AIRING: bytes.fromhex("01001a2003"),
+    characteristics.PAUSE: bytes.fromhex("000a"),
+    characteristics.BOOST: bytes.fromhex("0060095802"),
+    characteristics.TEMPORARY_SPEED: bytes.fromhex("000000"),
+}
+
+NotifyCallback = Callable[[BleakGATTCharacteristic, bytearray], Any]
+
+
+# pylint: disable=too-many-instance-attributes,too-many-return-statements
+class SimulatedSkyDevice:
+    """State of a simulated Intellivent Sky fan.
+
+    Mode characteristics are stored as raw bytes and the device status frame
+    is computed from them: boost beats pause, pause beats a running timer,
+    the timer beats humidity, and humidity beats constant speed. Boost,
+    pause and timer run out after their configured time on the given clock.
+
+    latency and jitter delay every operation, drop_rate makes operations
+    time out and disconnect_rate drops the link mid operation, all drawn
+    from a random generator seeded with seed.
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        address: str = "00:11:22:33:44:55",
+        authentication_code: bytes = b"\x01\x02\x03\x04",
+        *,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        drop_rate: float = 0.0,
+        disconnect_rate: float = 0.0,
+        notify: bool = True,
+        seed: int | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.address = address
+        self.authentication_code = bytes(authentication_code)
+        self.latency = latency
+        self.jitter = jitter
+        self.drop_rate = drop_rate
+        self.disconnect_rate = disconnect_rate
+        self.notify = notify
+        self.random = random.Random(seed)
+        self.clock = clock
+
+        self.pairing_mode = False
+        self.humidity = 45.0
+        self.temperature = 21.5
+        self.info = {
+            characteristics.DEVICE_NAME: (DEVICE_NAME + "\0\0").encode(),
+            characteristics.MODEL_NUMBER: b"SKY",
+            characteristics.FIRMWARE_VERSION: b"1.1.1",
+            characteristics.HARDWARE_VERSION: b"1.0",
+            characteristics.SOFTWARE_VERSION: b"1.1",
+            characteristics.MANUFACTURER_NAME: b"Fresh AB",
+        }
+        self.values: dict[UUID, bytes] = dict(_DEFAULT_MODES)
+        self.reads = 0
+        self.writes = 0
+        self.dropped = 0
+        self.disconnects = 0
+
+        self._until: dict[UUID, float] = {}
+        self._light_until: float | None = None
+        self._client: SimulatedBleakClient | None = None
+
+    @property
+    def ble_device(self) -> BLEDevice:
+        """Return a BLEDevice that SimulatedBleakClient connects to."""
+        return BLEDevice(self.address, DEVICE_NAME, details=self)
+
+    @property
+    def authenticated(self) -> bool:
+        """Return True if the connected client has authenticated."""
+        return self._client is not None and self._client.authenticated
+
+    def set_environment(
+        self, humidity: float | None = None, temperature: float | None = None
+    ) -> None:
+        """Change the measured humidity or temperature."""
+        if humidity is not None:
+            self.humidity = humidity
+        if temperature is not None:
+            self.temperature = temperature
+        self._notify()
+
+    def trigger_light(self) -> None:
+        """Turn on the light, which starts the timer if it is enabled."""
+        light_enabled = self.values[characteristics.LIGHT_VOC][0]
+        if light_enabled:
+            minutes = self.values[characteristics.TIMER][0]
+            self._light_until = self.clock() + minutes * 60
+            self._notify()
+
+    def drop_connection(self) -> None:
+        """Drop the link to the connected client, as if it went out of range."""
+        if self._client is not None:
+            self._client.lost()
+
+    def status(self) -> tuple[int, int]:
+        """Return the current mode and fan speed."""
+        now = self.clock()
+        for uuid, until in list(self._until.items()):
+            if until <= now:
+                del self._until[uuid]
+                self.values[uuid] = b"\x00" + self.values[uuid][1:]
+        if self._light_until is not None and self._light_until <= now:
+            self._light_until = None
+
+        boost = CODECS[characteristics.BOOST].decode(self.values[characteristics.BOOST])
+        if boost.enabled:
+            return MODE_BOOST, boost.rpm
+        if self.values[characteristics.PAUSE][0]:
+            return MODE_PAUSE, 0
+        if self._light_until is not None:
+            return (
+                MODE_TIMER,
+                CODECS[characteristics.TIMER]
+                .decode(self.values[characteristics.TIMER])
+                .rpm,
+            )
+        temporary = CODECS[characteristics.TEMPORARY_SPEED].decode(
+            self.values[characteristics.TEMPORARY_SPEED]
+        )
+        if temporary["enabled"]:
+            return MODE_CONSTANT_SPEED, temporary["rpm"]
+        humidity = CODECS[characteristics.HUMIDITY].decode(
+            self.values[characteristics.HUMIDITY]
+        )
+        threshold = HUMIDITY_THRESHOLDS[humidity.detection_raw]
+        if humidity.enabled and self.humidity >= threshold:
+            return MODE_HUMIDITY, humidity.rpm
+        constant = CODECS[characteristics.CONSTANT_SPEED].decode(
+            self.values[characteristics.CONSTANT_SPEED]
+        )
+        if constant.enabled:
+            return MODE_CONSTANT_SPEED, constant.rpm
+        return MODE_OFF, 0
+
+    def status_frame(self) -> bytearray:
+        """Return the device status characteristic value."""
+        mode, rpm = self.status()
+        temperature = round(self.temperature * 100)
+        return bytearray(
+            _FORMAT.pack(
+                mode != MODE_OFF,
+                mode,
+                min(round(10 * exp(self.humidity / 10)), 0xFFFF),
+                temperature,
+                4,
+                self.authenticated,
+                rpm,
+                temperature,
+                0,
+                0,
+                0,
+            )
+        )
+
+    def read(self, uuid: UUID) -> bytearray:
+        """Read a characteristic."""
+        self.reads += 1
+        if uuid == characteristics.DEVICE_STATUS:
+            return self.status_frame()
+        if uuid == characteristics.AUTH:
+            if self.pairing_mode:
+                return bytearray(self.authentication_code)
+            return bytearray(4)
+        if uuid in self.info:
+            return bytearray(self.info[uuid])
+        if uuid in self.values:
+            self.status()
+            return bytearray(self.values[uuid])
+        raise BleakCharacteristicNotFoundError(uuid)
+
+    def write(self, client: SimulatedBleakClient, uuid: UUID, data: bytes) -> None:
+        """Write a characteristic."""
+        self.writes += 1
+        if uuid == characteristics.AUTH:
+            if bytes(data) == self.authentication_code:
+                client.authenticated = True
+                self._notify()
+            return
+        codec = CODECS.get(uuid)
+        if codec is None:
+            raise BleakError(f"Characteristic {uuid} is not writable")
+        if len(data) != codec.struct.size:
+            raise BleakError(
+                f"Invalid length for {codec.name}: {len(data)} != {codec.struct.size}"
+            )
+        if not client.authenticated:
+            raise BleakError("Not authenticated")
+
+        self.values[uuid] = bytes(data)
+        self._until.pop(uuid, None)
+        if uuid == characteristics.BOOST and data[0]:
+            self._until[uuid] = self.clock() + codec.decode(data).seconds
+        elif uuid == characteristics.PAUSE and data[0]:
+            self._until[uuid] = self.clock() + data[1] * 60
+        self._notify()
+
+    def _notify(self) -> None:
+        """Send the device status to a subscribed client."""
+        if self._client is not None:
+            self._client.notify(characteristics.DEVICE_STATUS, self.status_frame())
+
+
+class SimulatedBleakClient:
+    """BleakClient replacement that talks to a SimulatedSkyDevice.
+
+    The device is taken from BLEDevice.details, so the class can be handed
+    to establish_connection and FreshIntelliVent like BleakClient.
+    """
+
+    def __init__(
+        self,
+        address_or_ble_device: Union[BLEDevice, SimulatedSkyDevice],
+        disconnected_callback: Callable[[Any], None] | None = None,
+        **_kwargs: Any,
+    ) -> None:
+        if isinstance(address_or_ble_device, BLEDevice):
+            address_or_ble_device = address_or_ble_device.details
+        if not isinstance(address_or_ble_device, SimulatedSkyDevice):
+            raise BleakError("SimulatedBleakClient needs a SimulatedSkyDevice")
+        self.device = address_or_ble_device
+        self.authenticated = False
+        self._disconnected_callback = disconnected_callback
+        self._connected = False
+        self._notify_callbacks: dict[UUID, NotifyCallback] = {}
+        self._services = BleakGATTServiceCollection()
+
+    @property
+    def address(self) -> str:
+        """Return the address of the device."""
+        return self.device.address
+
+    @property
+    def services(self) -> BleakGATTServiceCollection:
+        """Return the GATT services, which the simulator does not model."""
+        return self._services
+
+    @property
+    def is_connected(self) -> bool:
+        """Return True if the client is connected."""
+        return self._connected
+
+    async def connect(self, **_kwargs: Any) -> bool:
+        """Connect to the device, dropping any other connected client."""
+        await self._delay()
+        if self.device._client is not None:  # pylint: disable=protected-access
+            self.device._client.lost()  # pylint: disable=protected-access
+        self.device._client = self  # pylint: disable=protected-access
+        self._connected = True
+        self.authenticated = False
+        return True
+
+    async def disconnect(self) -> bool:
+        """Disconnect from the device."""
+        self._close()
+        return True
+
+    async def clear_cache(self) -> bool:
+        """Clear the GATT cache, which the simulator does not have."""
+        return True
+
+    async def read_gatt_char(
+        self, char_specifier: Union[str, UUID], **_kwargs: Any
+    ) -> bytearray:
+        """Read a characteristic."""
+        uuid = await self._operation(char_specifier)
+        return self.device.read(uuid)
+
+    async def write_gatt_char(
+        self,
+        char_specifier: Union[str, UUID],
+        data: Union[bytes, bytearray, memoryview],
+        response: bool | None = None,  # pylint: disable=unused-argument
+    ) -> None:
+        """Write a characteristic."""
+        uuid = await self._operation(char_specifier)
+        self.device.write(self, uuid, bytes(data))
+
+    async def start_notify(
+        self,
+        char_specifier: Union[str, UUID],
+        callback: NotifyCallback,
+        **_kwargs: Any,
+    ) -> None:
+        """Subscribe to notifications from a characteristic."""
+        uuid = await self._operation(char_specifier)
+        if not self.device.notify or uuid != characteristics.DEVICE_STATUS:
+            raise BleakError(f"Characteristic {uuid} does not support notify")
+        self._notify_callbacks[uuid] = callback
+
+    async def stop_notify(self, char_specifier: Union[str, UUID]) -> None:
+        """Unsubscribe from notifications from a characteristic."""
+        self._notify_callbacks.pop(UUID(str(char_specifier)), None)
+
+    def notify(self, uuid: UUID, data: bytearray) -> None:
+        """Deliver a notification from the device."""
+        if callback := self._notify_callbacks.get(uuid):
+            callback(None, data)  # type: ignore[arg-type]
+
+    def lost(self) -> None:
+        """Handle the link being dropped by the device."""
+        if not self._connected:
+            return
+        self.device.disconnects += 1
+        self._close()
+        if self._disconnected_callback is not None:
+            self._disconnected_callback(self)
+
+    def _close(self) -> None:
+        self._connected = False
+        self._notify_callbacks.clear()
+        if self.device._client is self:  # pylint: disable=protected-access
+            self.device._client = None  # pylint: disable=protected-access
+
+    async def _operation(self, char_specifier: Union[str, UUID]) -> UUID:
+        """Wait out the link latency and inject the configured faults."""
+        if not self._connected:
+            raise BleakError("Not connected")
+        await self._delay()
+        if not self._connected:
+            raise BleakError("Disconnected")
+
+        device = self.device
+        if device.disconnect_rate and device.random.random() < device.disconnect_rate:
+            self.lost()
+            raise BleakError("Disconnected")
+        if device.drop_rate and device.random.random() < device.drop_rate:
+            device.dropped += 1
+            raise asyncio.TimeoutError
+        return UUID(str(char_specifier))
+
+    async def _delay(self) -> None:
+        device = self.device
+        delay = device.latency
+        if device.jitter:
+            delay += device.random.uniform(0, device.jitter)
+        await asyncio.sleep(delay)
@@ -0,0 +1,34 @@
+"""Full state snapshot for Fresh Intellivent Sky devices."""
+
+from dataclasses import dataclass, field
+from typing import Any
+
+from .sensors import SkySensors
+
+
+@dataclass
+class SkySnapshot:
+    """Mode settings and sensor data read from the device in one batch."""
+
+    sensors: SkySensors
+    modes: dict[str, Any]
+    timings: dict[str, float] = field(default_factory=dict)
+    elapsed: float = 0.0
+
+    @property
+    def sequential_time(self) -> float:
+        """Return the summed latency of the reads.
+
+        The timings exclude time spent waiting for a turn, so this is about
+        the time reading the characteristics one by one takes.
+        """
+        return sum(self.timings.values())
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the snapshot as a dictionary."""
+        return {
+            "sensors": self.sensors.as_dict(),
+            "modes": {name: mode.as_dict() for name, mode in self.modes.items()},
+            "timings": dict(self.timings),
+            "elapsed": self.elapsed,
+        }
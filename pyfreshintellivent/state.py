@@ -0,0 +1,55 @@
+"""Per-device state store for Fresh Intellivent Sky devices."""
+
+import time
+from dataclasses import dataclass
+from typing import Any
+
+
+@dataclass
+class StateEntry:
+    """Last known value of a mode, and when it was stored."""
+
+    value: Any
+    updated: float
+
+
+class StateStore:
+    """Last known mode settings of a device.
+
+    Values younger than ttl seconds are considered fresh and can be served
+    without reading the device. A ttl of 0 disables caching, but the last
+    known values are still kept.
+    """
+
+    def __init__(self, ttl: float = 0.0) -> None:
+        self.ttl = ttl
+        self._entries: dict[str, StateEntry] = {}
+
+    def get(self, key: str) -> Any:
+        """Return the value for key if it is still fresh, otherwise None."""
+        entry = self._entries.get(key)
+        if entry is None or time.monotonic() - entry.updated >= self.ttl:
+            return None
+        return entry.value
+
+    def set(self, key: str, value: Any) -> None:
+        """Store a value for key."""
+        self._entries[key] = StateEntry(value=value, updated=time.monotonic())
+
+    def invalidate(self, key: str | None = None) -> None:
+        """Forget the value for key, or every value if key is None."""
+        if key is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(key, None)
+
+    def age(self, key: str) -> float | None:
+        """Return the age in seconds of the value for key."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        return time.monotonic() - entry.updated
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the last known value for every key, fresh or not."""
+        return {key: entry.value for key, entry in self._entries.items()}
@@ -0,0 +1,30 @@
+import pytest
+
+from pyfreshintellivent import FreshIntelliVent
+from pyfreshintellivent.simulator import SimulatedBleakClient
+
+
+@pytest.fixture
+def simulated():
+    """Return a function creating a device handler for a simulated device."""
+
+    def create(device, **kwargs):
+        return FreshIntelliVent(
+            device.ble_device, client_class=SimulatedBleakClient, **kwargs
+        )
+
+    return create
+
+
+@pytest.fixture
+def connected(simulated):
+    """Return a function connecting, and authenticating, to a simulated device."""
+
+    async def connect(device, authenticate=True, **kwargs):
+        sky = simulated(device, **kwargs)
+        await sky.connect()
+        if authenticate:
+            await sky.authenticate(device.authentication_code)
+        return sky
+
+    return connect
@@ -0,0 +1,47 @@
+import math
+
+import pytest
+
+from pyfreshintellivent.batch import (
+    decode_device_status,
+    decode_device_status_columns,
+)
+from pyfreshintellivent.sensors import SkySensors
+
+np = pytest.importorskip("numpy")
+
+FRAMES = [
+    "00009001CE090000E8033C0A000000",
+    "01003702E60Abd01D204040B001c00",
+    "006790010000000000000000000000",
+    "00FF00000000000000000000000000",
+]
+
+
+def test_batch_matches_from_bytes():
+    buffer = bytes.fromhex("".join(FRAMES))
+    columns = decode_device_status_columns(buffer)
+
+    for i, frame in enumerate(FRAMES[:3]):
+        sensors = SkySensors.from_bytes(bytes.fromhex(frame))
+        assert columns["status"][i] == sensors.status
+        assert columns["mode"][i] == sensors.mode
+        assert columns["mode_raw"][i] == sensors.mode_raw
+        assert columns["humidity"][i] == sensors.humidity
+        assert columns["temperature"][i] == sensors.temperature
+        assert columns["temperature_avg"][i] == sensors.temperature_avg
+        assert columns["authenticated"][i] == sensors.authenticated
+        assert columns["rpm"][i] == sensors.rpm
+        assert tuple(columns["unknowns"][i]) == sensors.unknowns
+
+
+def test_batch_unknown_mode_and_missing_humidity():
+    array = decode_device_status(bytes.fromhex(FRAMES[3]))
+    assert array.shape == (1,)
+    assert array["mode"][0] == "Unknown"
+    assert math.isnan(array["humidity"][0])
+
+
+def test_batch_invalid_length():
+    with pytest.raises(ValueError, match=r"Length need to be a multiple of 15*"):
+        decode_device_status_columns(bytes(16))
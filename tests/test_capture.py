@@ -0,0 +1,99 @@
+import pytest
+
+from pyfreshintellivent import FreshIntelliventError, characteristics
+from pyfreshintellivent.capture import CaptureReader, CaptureWriter
+from pyfreshintellivent.simulator import SimulatedSkyDevice
+
+
+def test_capture_roundtrip(tmp_path):
+    path = tmp_path / "capture.bin"
+    with CaptureWriter(path) as writer:
+        writer.record(
+            "AA:BB:CC:DD:EE:FF",
+            "R",
+            characteristics.BOOST,
+            bytes.fromhex("0160095802"),
+            timestamp=1.5,
+        )
+        writer.record(
+            "some-uuid-address", "W", "0000ffff-0000-1000-8000-00805f9b34fb", b""
+        )
+
+    with CaptureWriter(path) as writer:
+        writer.record("AA:BB:CC:DD:EE:FF", "N", characteristics.DEVICE_STATUS, b"\x01")
+
+    reader = CaptureReader(path)
+    records = [
+        (r.timestamp, r.address, r.direction, r.uuid, bytes(r.payload)) for r in reader
+    ]
+    reader.close()
+
+    assert records[0] == (
+        1.5,
+        "AA:BB:CC:DD:EE:FF",
+        "R",
+        characteristics.BOOST,
+        bytes.fromhex("0160095802"),
+    )
+    assert records[1][1:] == ("some-uuid-address", "W", None, b"")
+    assert records[2][1:] == (
+        "AA:BB:CC:DD:EE:FF",
+        "N",
+        characteristics.DEVICE_STATUS,
+        b"\x01",
+    )
+
+
+def test_capture_ignores_truncated_record(tmp_path):
+    path = tmp_path / "capture.bin"
+    with CaptureWriter(path) as writer:
+        writer.record("AA:BB:CC:DD:EE:FF", "R", characteristics.PAUSE, b"\x01\x05")
+        writer.record("AA:BB:CC:DD:EE:FF", "R", characteristics.PAUSE, b"\x00\x00")
+    with open(path, "r+b") as file:
+        file.truncate(file.seek(0, 2) - 1)
+
+    with CaptureReader(path) as reader:
+        assert [bytes(r.payload) for r in reader] == [b"\x01\x05"]
+
+
+def test_capture_rejects_other_files(tmp_path):
+    path = tmp_path / "other.bin"
+    path.write_bytes(b"hello world")
+    with pytest.raises(ValueError):
+        CaptureReader(path)
+
+
+def test_capture_flush_interval(tmp_path):
+    path = tmp_path / "capture.bin"
+    with CaptureWriter(path) as writer:
+        writer.record("AA:BB:CC:DD:EE:FF", "R", characteristics.PAUSE, b"\x01\x05")
+        with CaptureReader(path) as reader:
+            assert len(list(reader)) == 1
+
+    with CaptureWriter(path, flush_interval=60.0) as writer:
+        writer.record("AA:BB:CC:DD:EE:FF", "R", characteristics.PAUSE, b"\x00\x00")
+        with CaptureReader(path) as reader:
+            assert len(list(reader)) == 1
+        writer.flush()
+        with CaptureReader(path) as reader:
+            assert len(list(reader)) == 2
+
+
+@pytest.mark.asyncio
+async def test_capture_skips_failed_writes(tmp_path, connected):
+    path = tmp_path / "capture.bin"
+    device = SimulatedSkyDevice()
+    with CaptureWriter(path) as writer:
+        sky = await connected(device, authenticate=False, capture=writer)
+        with pytest.raises(FreshIntelliventError):
+            await sky.update_constant_speed(enabled=True, rpm=1200)
+        await sky.authenticate(device.authentication_code)
+        await sky.update_constant_speed(enabled=True, rpm=1200)
+        await sky.disconnect()
+
+    with CaptureReader(path) as reader:
+        writes = [(r.uuid, bytes(r.payload)) for r in reader if r.direction == "W"]
+    assert writes == [
+        (characteristics.AUTH, bytes(device.authentication_code)),
+        (characteristics.CONSTANT_SPEED, bytes.fromhex("01b004")),
+    ]
@@ -0,0 +1,73 @@
+import asyncio
+from uuid import UUID
+
+import pytest
+
+from pyfreshintellivent.coalescer import WriteCoalescer
+from pyfreshintellivent.simulator import SimulatedSkyDevice
+
+BOOST = UUID("{7c4adc07-2f33-11e7-93ae-92361f002671}")
+TIMER = UUID("{7c4adc04-2f33-11e7-93ae-92361f002671}")
+
+
+@pytest.mark.asyncio
+async def test_coalesce_keeps_latest_write():
+    written = []
+
+    async def write(uuid, data):
+        written.append((uuid, data))
+
+    coalescer = WriteCoalescer(write, window=0.01)
+    results = await asyncio.gather(
+        coalescer.write(BOOST, b"\x01"),
+        coalescer.write(TIMER, b"\x05"),
+        coalescer.write(BOOST, b"\x02"),
+        coalescer.write(BOOST, b"\x03"),
+    )
+
+    assert results == [False, True, False, True]
+    assert sorted(written) == sorted([(BOOST, b"\x03"), (TIMER, b"\x05")])
+    assert coalescer.written == 2
+    assert coalescer.coalesced == 2
+
+
+@pytest.mark.asyncio
+async def test_coalesce_keeps_order_while_writing():
+    written = []
+
+    async def write(uuid, data):
+        await asyncio.sleep(0.02)
+        written.append(data)
+
+    coalescer = WriteCoalescer(write, window=0.0)
+    first = asyncio.create_task(coalescer.write(BOOST, b"\x01"))
+    await asyncio.sleep(0.005)
+    second = asyncio.create_task(coalescer.write(BOOST, b"\x02"))
+
+    assert await first is True
+    assert await second is True
+    assert written == [b"\x01", b"\x02"]
+
+
+@pytest.mark.asyncio
+async def test_coalesce_propagates_errors():
+    async def write(uuid, data):
+        raise RuntimeError("Failed to write")
+
+    coalescer = WriteCoalescer(write, window=0.0)
+    with pytest.raises(RuntimeError):
+        await coalescer.write(BOOST, b"\x01")
+
+
+@pytest.mark.asyncio
+async def test_updates_report_superseded_writes(connected):
+    device = SimulatedSkyDevice()
+    sky = await connected(device, coalesce_window=0.01)
+
+    first, second, speed = await asyncio.gather(
+        sky.update_boost(enabled=True, rpm=1200, seconds=60),
+        sky.update_boost(enabled=True, rpm=1500, seconds=60),
+        sky.update_temporary_speed(enabled=True, rpm=1000),
+    )
+    assert (first, second, speed) == (False, True, True)
+    assert sky.modes["boost"].rpm == 1500
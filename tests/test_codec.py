@@ -0,0 +1,81 @@
+import pytest
+
+from pyfreshintellivent import characteristics, codec
+from pyfreshintellivent.modes import AiringMode
+
+
+def test_registry_covers_mode_characteristics():
+    assert set(codec.CODECS) == {
+        characteristics.HUMIDITY,
+        characteristics.LIGHT_VOC,
+        characteristics.CONSTANT_SPEED,
+        characteristics.TIMER,
+        characteristics.AIRING,
+        characteristics.PAUSE,
+        characteristics.BOOST,
+        characteristics.TEMPORARY_SPEED,
+    }
+    assert codec.TEMPORARY_SPEED.readable is False
+
+
+def test_decode_memoryview():
+    value = memoryview(bytearray.fromhex("050102E803"))
+    assert codec.TIMER.decode(value).as_dict() == {
+        "minutes": 5,
+        "delay": {"enabled": True, "minutes": 2},
+        "rpm": 1000,
+    }
+
+
+def test_decode_invalid_length():
+    with pytest.raises(ValueError, match=r"Length need to be exactly 4, was 3."):
+        codec.HUMIDITY.decode(bytearray.fromhex("010101"))
+
+
+def test_encode_constant_and_validators():
+    value = codec.AIRING.encode(enabled=True, minutes=-5, rpm=100)
+    assert value == bytearray.fromhex("011a002003")
+    assert codec.AIRING.decode(value) == AiringMode(enabled=True, minutes=0, rpm=800)
+
+
+def test_encode_requires_keywords():
+    with pytest.raises(TypeError):
+        codec.BOOST.encode(True, 1000, 60)
+    with pytest.raises(TypeError, match="missing arguments \\['seconds'\\]"):
+        codec.BOOST.encode(enabled=True, rpm=1000)
+    with pytest.raises(TypeError, match="unexpected arguments \\['delay'\\]"):
+        codec.BOOST.encode(enabled=True, rpm=1000, seconds=60, delay=1)
+
+
+def test_arguments_roundtrip():
+    value = bytearray.fromhex("050102E803")
+    mode = codec.TIMER.decode(value)
+    assert codec.TIMER.arguments(mode) == {
+        "minutes": 5,
+        "delay_enabled": True,
+        "delay_minutes": 2,
+        "rpm": 1000,
+    }
+    assert codec.TIMER.encode(**codec.TIMER.arguments(mode)) == value
+
+
+def test_arguments_roundtrip_detection_quirks():
+    for hex_value in ("01010101", "01030103", "00020002"):
+        value = bytearray.fromhex(hex_value)
+        mode = codec.LIGHT_VOC.decode(value)
+        assert codec.LIGHT_VOC.encode(**codec.LIGHT_VOC.arguments(mode)) == value
+
+
+def test_decode_reuses_results_made_of_parts():
+    first = codec.TIMER.decode(bytearray.fromhex("050102E803"))
+    assert codec.TIMER.decode(bytes.fromhex("050102E803")) is first
+    other = codec.TIMER.decode(bytes.fromhex("050103E803"))
+    assert other.delay.minutes == 3
+    assert first.delay.minutes == 2
+
+
+def test_encode_values_in_field_order():
+    assert codec.AIRING.encode_values(True, -5, 100) == codec.AIRING.encode(
+        enabled=True, minutes=-5, rpm=100
+    )
+    assert codec.TIMER.encode_values(5, True, 2, 1000) == bytes.fromhex("050102E803")
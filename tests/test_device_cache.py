@@ -0,0 +1,83 @@
+import pytest
+from bleak.backends.device import BLEDevice
+
+from pyfreshintellivent import FreshIntelliVent, device_cache
+from pyfreshintellivent.device_cache import DeviceCache
+
+ADDRESS = "AA:BB:CC:DD:EE:FF"
+
+
+def test_cache_get_and_evict(monkeypatch):
+    now = 1000.0
+    monkeypatch.setattr(device_cache.time, "time", lambda: now)
+    cache = DeviceCache(ttl=10.0)
+    cache.add(BLEDevice(ADDRESS, "Intellivent SKY", None), rssi=-60)
+
+    entry = cache.get(ADDRESS.lower())
+    assert entry is not None
+    assert entry.device is not None
+    assert entry.rssi == -60
+
+    now = 1011.0
+    entry = cache.get(ADDRESS)
+    assert entry is not None
+    assert entry.device is None
+    assert cache.addresses == [ADDRESS]
+
+
+def test_cache_persists_metadata(tmp_path):
+    path = tmp_path / "devices.json"
+    cache = DeviceCache(path=path)
+    cache.add(BLEDevice(ADDRESS, "Intellivent SKY", None), rssi=-60)
+    cache.save()
+
+    loaded = DeviceCache(path=path)
+    entry = loaded.get(ADDRESS)
+    assert entry is not None
+    assert entry.name == "Intellivent SKY"
+    assert entry.rssi == -60
+    assert entry.device is None
+
+
+@pytest.mark.asyncio
+async def test_cache_scans_only_on_miss(monkeypatch):
+    scans = []
+
+    async def get_device(address):
+        return None
+
+    async def find_device_by_address(address, timeout):
+        scans.append(address)
+        return BLEDevice(address, "Intellivent SKY", None)
+
+    monkeypatch.setattr(device_cache, "get_device", get_device)
+    monkeypatch.setattr(
+        device_cache.BleakScanner, "find_device_by_address", find_device_by_address
+    )
+    cache = DeviceCache()
+
+    first = await cache.async_get_device(ADDRESS)
+    second = await cache.async_get_device(ADDRESS)
+    assert first is second
+    assert scans == [ADDRESS]
+
+
+@pytest.mark.parametrize("content", ['{"address": "AA"}', '[{"name": "x"}]', "[1]"])
+def test_cache_ignores_malformed_file(tmp_path, content):
+    path = tmp_path / "devices.json"
+    path.write_text(content, encoding="utf-8")
+
+    cache = DeviceCache(path=path)
+    assert cache.addresses == []
+
+
+@pytest.mark.asyncio
+async def test_from_address_passes_arguments(monkeypatch):
+    async def get_device(address):
+        return BLEDevice(address, "Intellivent SKY", None)
+
+    monkeypatch.setattr(device_cache, "get_device", get_device)
+    sky = await FreshIntelliVent.from_address(ADDRESS, cache_ttl=5.0, concurrency=2)
+    assert sky.address == ADDRESS
+    assert sky.operations.concurrency == 2
+    assert sky.state.ttl == 5.0
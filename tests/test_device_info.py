@@ -0,0 +1,76 @@
+import pytest
+
+from pyfreshintellivent import FreshIntelliventError, characteristics, device_info
+from pyfreshintellivent.device_info import DeviceInfo, DeviceInfoCache
+from pyfreshintellivent.simulator import SimulatedSkyDevice
+
+ADDRESS = "AA:BB:CC:DD:EE:FF"
+INFO = DeviceInfo(
+    name="Intellivent SKY",
+    manufacturer="Fresh AB",
+    fw_version="1.1.1",
+    hw_version="1.0",
+    sw_version="1.1",
+    updated=1000.0,
+)
+
+
+def test_device_info_cache_ttl_and_firmware(monkeypatch):
+    now = 1000.0
+    monkeypatch.setattr(device_info.time, "time", lambda: now)
+    cache = DeviceInfoCache(ttl=60.0)
+    cache.add(ADDRESS.lower(), INFO)
+
+    assert cache.get(ADDRESS) == INFO
+    assert cache.get(ADDRESS, "1.1.1") == INFO
+    assert cache.get(ADDRESS, "1.2.0") is None
+    now = 1060.0
+    assert cache.get(ADDRESS) is None
+
+
+def test_device_info_cache_persists(tmp_path, monkeypatch):
+    monkeypatch.setattr(device_info.time, "time", lambda: 1000.0)
+    path = tmp_path / "info.json"
+    DeviceInfoCache(path=path).add(ADDRESS, INFO)
+    assert DeviceInfoCache(path=path).get(ADDRESS) == INFO
+
+    path.write_text("[]", encoding="utf-8")
+    assert DeviceInfoCache(path=path).get(ADDRESS) is None
+
+
+@pytest.mark.asyncio
+async def test_fetch_device_information_cached(connected):
+    device = SimulatedSkyDevice(address=ADDRESS)
+    cache = DeviceInfoCache()
+    sky = await connected(device, authenticate=False, device_info_cache=cache)
+
+    info = await sky.fetch_device_information()
+    assert (sky.name, sky.hw_version, sky.sw_version) == (
+        "Intellivent SKY",
+        "1.0",
+        "1.1",
+    )
+    assert device.reads == 5
+    assert cache.get(ADDRESS) == info
+
+    await sky.fetch_device_information()
+    assert device.reads == 6
+
+    device.info[characteristics.FIRMWARE_VERSION] = b"1.2.0"
+    device.info[characteristics.SOFTWARE_VERSION] = b"1.2"
+    await sky.fetch_device_information()
+    assert device.reads == 11
+    assert (sky.fw_version, sky.sw_version) == ("1.2.0", "1.2")
+
+
+@pytest.mark.asyncio
+async def test_fetch_device_information_errors(simulated):
+    device = SimulatedSkyDevice()
+    sky = simulated(device)
+    with pytest.raises(FreshIntelliventError, match="Not connected"):
+        await sky.fetch_device_information()
+
+    await sky.connect()
+    del device.info[characteristics.MANUFACTURER_NAME]
+    with pytest.raises(FreshIntelliventError, match="Failed to read"):
+        await sky.fetch_device_information()
@@ -0,0 +1,87 @@
+import asyncio
+
+import pytest
+
+from pyfreshintellivent.events import (
+    ChangeDetector,
+    HumidityThresholdCrossed,
+    MeasurementChanged,
+    ModeChanged,
+    RpmChanged,
+)
+from pyfreshintellivent.sensors import SkySensors
+from pyfreshintellivent.simulator import SimulatedSkyDevice
+
+
+def sample(mode="Off", rpm=0, humidity=50.0, temperature=21.0):
+    return SkySensors(mode=mode, rpm=rpm, humidity=humidity, temperature=temperature)
+
+
+def test_first_sample_and_suppression():
+    detector = ChangeDetector()
+    assert detector.process(sample(), timestamp=1.0) == [
+        ModeChanged(1.0, None, "Off"),
+        RpmChanged(1.0, None, 0),
+        MeasurementChanged(1.0, "humidity", None, 50.0),
+        MeasurementChanged(1.0, "temperature", None, 21.0),
+    ]
+    assert detector.process(sample(rpm=20, humidity=50.5), timestamp=2.0) == []
+    assert detector.suppressed == 1
+
+    detector.reset()
+    assert len(detector.process(sample(), timestamp=3.0)) == 4
+
+
+def test_deadbands_report_drift():
+    detector = ChangeDetector(deadbands={"temperature": 1.0})
+    detector.process(sample())
+    assert detector.process(sample(temperature=21.6), timestamp=2.0) == []
+    assert detector.process(sample(temperature=22.0), timestamp=3.0) == [
+        MeasurementChanged(3.0, "temperature", 21.0, 22.0)
+    ]
+    assert detector.process(
+        sample(mode="Boost", rpm=2400, temperature=22.0), timestamp=4.0
+    ) == [ModeChanged(4.0, "Off", "Boost"), RpmChanged(4.0, 0, 2400)]
+
+
+def test_humidity_threshold_hysteresis():
+    detector = ChangeDetector(
+        deadbands={"humidity": 100.0}, humidity_thresholds=[70.0], hysteresis=5.0
+    )
+    detector.process(sample(humidity=60.0))
+
+    events = [
+        detector.process(sample(humidity=humidity), timestamp=float(i))
+        for i, humidity in enumerate((71.0, 68.0, 72.0, 64.0, 66.0, 70.0))
+    ]
+    assert events == [
+        [HumidityThresholdCrossed(0.0, 70.0, 71.0, True)],
+        [],
+        [],
+        [HumidityThresholdCrossed(3.0, 70.0, 64.0, False)],
+        [],
+        [HumidityThresholdCrossed(5.0, 70.0, 70.0, True)],
+    ]
+
+
+@pytest.mark.asyncio
+async def test_stream_events(connected):
+    device = SimulatedSkyDevice()
+    sky = await connected(device)
+
+    device.set_environment(None, 21.6)
+    events = sky.stream_events()
+    loop = asyncio.get_running_loop()
+    loop.call_later(0.01, device.set_environment, 45.0, 21.6)
+    loop.call_later(0.02, device.set_environment, 45.0, 23.0)
+
+    received = [await asyncio.wait_for(anext(events), 1.0) for _ in range(5)]
+    await events.aclose()
+    assert [type(event) for event in received] == [
+        ModeChanged,
+        RpmChanged,
+        MeasurementChanged,
+        MeasurementChanged,
+        MeasurementChanged,
+    ]
+    assert received[-1].value == 23.0
@@ -0,0 +1,70 @@
+import asyncio
+
+import pytest
+
+from pyfreshintellivent.exporter import PrometheusExporter
+from pyfreshintellivent.fleet import FreshIntelliventFleet
+from pyfreshintellivent.metrics import Metrics
+from pyfreshintellivent.simulator import SimulatedSkyDevice
+
+
+async def scrape(port, path="/metrics"):
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    writer.write(f"GET {path} HTTP/1.1\r\nHost: localhost\r\n\r\n".encode())
+    response = await reader.read()
+    writer.close()
+    return response.decode()
+
+
+@pytest.mark.asyncio
+async def test_exporter_serves_cached_state(simulated):
+    device = SimulatedSkyDevice(address="AA:AA:AA:AA:AA:AA")
+    fleet = FreshIntelliventFleet()
+    fleet.add(
+        simulated(device, metrics=Metrics()),
+        authentication_code=device.authentication_code,
+    )
+
+    async with PrometheusExporter(fleet, port=0, interval=60.0) as exporter:
+        while not exporter.page:
+            await asyncio.sleep(0.01)
+        reads = device.reads
+
+        first, second = await asyncio.gather(
+            scrape(exporter.port), scrape(exporter.port)
+        )
+        assert device.reads == reads
+        assert first == second
+        assert first.startswith("HTTP/1.1 200 OK")
+
+        labels = 'address="AA:AA:AA:AA:AA:AA"'
+        assert f"fresh_intellivent_up{{{labels}}} 1" in first
+        assert f"fresh_intellivent_temperature_celsius{{{labels}}} 21.5" in first
+        assert f"fresh_intellivent_humidity_percent{{{labels}}} 45.0" in first
+        assert f'fresh_intellivent_mode_info{{{labels},mode="Off"}} 1' in first
+        assert (
+            f'fresh_intellivent_setting{{{labels},mode="boost",setting="rpm"}} 2400.0'
+            in first
+        )
+        assert (
+            f'fresh_intellivent_operations_total{{{labels},operation="connect"}} 1'
+            in first
+        )
+
+        assert f"fresh_intellivent_queue_max_depth{{{labels}}}" in first
+        assert f"fresh_intellivent_queue_wait_seconds_total{{{labels}}}" in first
+
+        assert (await scrape(exporter.port, "/")).startswith("HTTP/1.1 404")
+
+
+@pytest.mark.asyncio
+async def test_exporter_reports_failed_devices(simulated):
+    device = SimulatedSkyDevice(address="BB:BB:BB:BB:BB:BB", drop_rate=1.0)
+    fleet = FreshIntelliventFleet()
+    fleet.add(simulated(device))
+    exporter = PrometheusExporter(fleet)
+
+    await exporter.refresh()
+    page = exporter.page.decode()
+    assert 'fresh_intellivent_up{address="BB:BB:BB:BB:BB:BB"} 0' in page
+    assert "temperature" not in page
@@ -0,0 +1,58 @@
+import pytest
+from bleak.exc import BleakError
+
+from pyfreshintellivent import FreshIntelliventError, characteristics
+from pyfreshintellivent.modes import BoostMode, TimerDelay, TimerMode
+from pyfreshintellivent.simulator import SimulatedSkyDevice
+
+
+@pytest.mark.asyncio
+async def test_fetch_all_decodes_every_mode(connected):
+    device = SimulatedSkyDevice()
+    device.values[characteristics.BOOST] = bytes.fromhex("0160095802")
+    sky = await connected(device)
+
+    reads = device.reads
+    snapshot = await sky.fetch_all()
+    assert device.reads == reads + 8
+    assert set(snapshot.modes) == {
+        "humidity",
+        "light_and_voc",
+        "constant_speed",
+        "timer",
+        "airing",
+        "pause",
+        "boost",
+    }
+    assert snapshot.modes["boost"] == BoostMode(enabled=True, rpm=2400, seconds=600)
+    assert snapshot.modes["timer"] == TimerMode(
+        minutes=5, delay=TimerDelay(enabled=False, minutes=2), rpm=1000
+    )
+    assert snapshot.modes["light_and_voc"].light.detection == "Medium"
+    assert snapshot.sensors.mode == "Boost"
+    assert sky.sensors is snapshot.sensors
+    assert sky.modes == snapshot.modes
+
+    assert set(snapshot.timings) == {"sensors", *snapshot.modes}
+    assert snapshot.sequential_time == sum(snapshot.timings.values())
+    assert snapshot.as_dict()["modes"]["boost"]["rpm"] == 2400
+
+
+@pytest.mark.asyncio
+async def test_fetch_all_partial_failure(connected):
+    device = SimulatedSkyDevice(latency=0.01)
+    sky = await connected(device)
+    read = device.read
+
+    def fail_pause(uuid):
+        if uuid == characteristics.PAUSE:
+            raise BleakError("Read failed")
+        return read(uuid)
+
+    device.read = fail_pause
+
+    reads = device.reads
+    with pytest.raises(FreshIntelliventError, match="Failed to read"):
+        await sky.fetch_all()
+    assert device.reads == reads + 7
+    assert sky.modes == {}
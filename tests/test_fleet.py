@@ -0,0 +1,67 @@
+import asyncio
+
+import pytest
+
+from pyfreshintellivent.fleet import FreshIntelliventFleet
+
+
+class FakeDevice:
+    def __init__(self, address, delay=0.0, fail=False):
+        self.address = address
+        self.delay = delay
+        self.fail = fail
+        self.is_connected = False
+        self.authenticated = False
+
+    async def connect(self):
+        self.is_connected = True
+
+    async def authenticate(self, authentication_code):
+        self.authenticated = True
+
+    async def disconnect(self):
+        self.is_connected = False
+
+    async def fetch_all(self):
+        await asyncio.sleep(self.delay)
+        if self.fail:
+            raise RuntimeError("Failed to read")
+        return self.address
+
+
+@pytest.mark.asyncio
+async def test_fleet_refresh():
+    fleet = FreshIntelliventFleet(concurrency=2)
+    fleet.add(FakeDevice("AA"), authentication_code="01020304")
+    fleet.add(FakeDevice("BB"))
+    fleet.add(FakeDevice("CC", fail=True))
+
+    result = await fleet.refresh()
+    assert result.snapshots == {"AA": "AA", "BB": "BB"}
+    assert list(result.errors) == ["CC"]
+    assert fleet.devices["AA"].authenticated is True
+    assert fleet.devices["AA"].is_connected is False
+    assert result.fans_per_minute > 0
+
+
+@pytest.mark.asyncio
+async def test_fleet_slow_device_times_out():
+    fleet = FreshIntelliventFleet(timeout=0.05)
+    fleet.add(FakeDevice("AA", delay=1.0))
+    fleet.add(FakeDevice("BB"))
+
+    result = await fleet.refresh()
+    assert list(result.snapshots) == ["BB"]
+    assert isinstance(result.errors["AA"], asyncio.TimeoutError)
+
+
+def test_fleet_schedule_round_robin():
+    fleet = FreshIntelliventFleet()
+    fleet.add(FakeDevice("A1"), adapter="hci0")
+    fleet.add(FakeDevice("A2"), adapter="hci0")
+    fleet.add(FakeDevice("B1"), adapter="hci1")
+
+    order = [m.device.address for m in fleet._schedule()]
+    assert order == ["A1", "B1", "A2"]
+    order = [m.device.address for m in fleet._schedule()]
+    assert order == ["A2", "B1", "A1"]
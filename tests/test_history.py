@@ -0,0 +1,40 @@
+import pytest
+
+from pyfreshintellivent.history import SensorHistory
+from pyfreshintellivent.sensors import SkySensors
+
+
+def sample(humidity, temperature, rpm):
+    return SkySensors(humidity=humidity, temperature=temperature, rpm=rpm)
+
+
+def test_history_is_bounded():
+    history = SensorHistory(capacity=4, windows=(2, 4))
+    for i in range(10):
+        history.append(sample(40.0 + i, 20.0, 1000 + i), timestamp=float(i))
+
+    assert len(history) == 4
+    assert history.values("rpm") == [1006, 1007, 1008, 1009]
+    assert history.latest("humidity") == 49.0
+
+
+def test_history_rolling_stats():
+    history = SensorHistory(capacity=8, windows=(3,))
+    for i, rpm in enumerate([1000, 1600, 1200, 800, 2000]):
+        history.append(sample(None, 20.0 + i, rpm), timestamp=i * 10.0)
+
+    stats = history.stats("rpm", 3)
+    assert stats.samples == 3
+    assert stats.mean == pytest.approx(4000 / 3)
+    assert stats.min == 800
+    assert stats.max == 2000
+    assert stats.rate == pytest.approx(800 / 20)
+
+    temperature = history.stats("temperature", 3)
+    assert temperature.rate == pytest.approx(0.1)
+    assert history.stats("humidity", 3) is None
+
+
+def test_history_invalid_window():
+    with pytest.raises(ValueError):
+        SensorHistory(capacity=10, windows=(20,))
@@ -0,0 +1,57 @@
+import logging
+
+import pytest
+
+from pyfreshintellivent import FreshIntelliVent, FreshIntelliventError, characteristics
+from pyfreshintellivent.metrics import Metrics
+from pyfreshintellivent.simulator import SimulatedSkyDevice
+
+
+def test_metrics_record():
+    metrics = Metrics()
+    metrics.record("read", 0.02, characteristics.BOOST)
+    metrics.record("read", 0.3, characteristics.BOOST, TimeoutError())
+    metrics.record("connect", 20.0, error=FreshIntelliventError())
+
+    snapshot = metrics.as_dict()
+    read = snapshot["operations"]["read"]
+    assert (read["count"], read["errors"], read["timeouts"]) == (2, 0, 1)
+    assert read["max"] == 0.3
+    assert read["histogram"]["0.025"] == 1
+    assert read["histogram"]["0.5"] == 1
+    assert snapshot["operations"]["connect"]["errors"] == 1
+    assert snapshot["operations"]["connect"]["histogram"]["+Inf"] == 1
+    assert snapshot["characteristics"] == {str(characteristics.BOOST): {"read": read}}
+
+    metrics.reset()
+    assert metrics.as_dict() == {"operations": {}, "characteristics": {}}
+
+
+@pytest.mark.asyncio
+async def test_metrics_device_operations(connected):
+    device = SimulatedSkyDevice()
+    metrics = Metrics()
+    sky = await connected(device, metrics=metrics)
+    await sky.update_boost(enabled=True, rpm=2400, seconds=600)
+
+    device.drop_rate = 1.0
+    with pytest.raises(TimeoutError):
+        await sky.fetch_boost()
+
+    operations = metrics.as_dict()["operations"]
+    assert operations["connect"]["count"] == 1
+    assert operations["authenticate"]["count"] == 1
+    assert operations["write"]["count"] == 2
+    assert operations["read"]["timeouts"] == 1
+    boost = metrics.as_dict()["characteristics"][str(characteristics.BOOST)]
+    assert (boost["write"]["count"], boost["read"]["timeouts"]) == (1, 1)
+
+
+def test_log_data_is_lazy(caplog):
+    class Data(bytes):
+        def hex(self, *args):
+            raise AssertionError("hex() called with debug logging disabled")
+
+    sky = FreshIntelliVent(SimulatedSkyDevice().ble_device)
+    with caplog.at_level(logging.INFO):
+        sky._log_data("R", characteristics.BOOST, Data(b"\x01"))
@@ -0,0 +1,106 @@
+import asyncio
+
+import pytest
+
+from pyfreshintellivent import FreshIntelliventError, characteristics
+from pyfreshintellivent.operations import PRIORITY_READ, PRIORITY_WRITE, OperationQueue
+from pyfreshintellivent.simulator import SimulatedSkyDevice
+
+
+@pytest.mark.asyncio
+async def test_queue_runs_by_priority():
+    queue = OperationQueue()
+    order = []
+
+    async def operation(name, priority):
+        async with queue.slot(priority):
+            order.append(name)
+            await asyncio.sleep(0.01)
+
+    tasks = [
+        asyncio.create_task(operation(f"read{i}", PRIORITY_READ)) for i in range(3)
+    ]
+    await asyncio.sleep(0)
+    tasks.append(asyncio.create_task(operation("write", PRIORITY_WRITE)))
+    await asyncio.sleep(0)
+    assert queue.depth == 3
+
+    await asyncio.gather(*tasks)
+    assert order == ["read0", "write", "read1", "read2"]
+    assert queue.as_dict()["completed"] == 4
+    assert queue.max_depth == 3
+    assert queue.depth == 0
+
+
+@pytest.mark.asyncio
+async def test_queue_cancellation():
+    queue = OperationQueue()
+    async with queue.slot():
+        waiting = asyncio.create_task(queue.slot().__aenter__())
+        failed = asyncio.create_task(queue.slot().__aenter__())
+        await asyncio.sleep(0)
+        waiting.cancel()
+        assert queue.cancel(exc=RuntimeError("gone")) == 1
+        with pytest.raises(asyncio.CancelledError):
+            await waiting
+        with pytest.raises(RuntimeError):
+            await failed
+
+    assert queue.cancelled == 2
+    assert queue.active == 0
+    async with queue.slot():
+        assert queue.active == 1
+
+
+@pytest.mark.asyncio
+async def test_write_overtakes_polling_reads(connected):
+    device = SimulatedSkyDevice(latency=0.01)
+    sky = await connected(device)
+
+    order = []
+    write, read = device.write, device.read
+
+    def logged_write(client, uuid, data):
+        order.append("W")
+        write(client, uuid, data)
+
+    def logged_read(uuid):
+        order.append("R")
+        return read(uuid)
+
+    device.write, device.read = logged_write, logged_read
+
+    polling = asyncio.gather(*(sky.fetch_sensor_data() for _ in range(5)))
+    await asyncio.sleep(0)
+    await sky.update_boost(enabled=True, rpm=2400, seconds=600)
+    await polling
+    assert order.index("W") == 1
+
+
+@pytest.mark.asyncio
+async def test_disconnect_fails_queued_operations(connected):
+    device = SimulatedSkyDevice(latency=0.01)
+    sky = await connected(device, authenticate=False)
+
+    reads = asyncio.gather(
+        *(sky._read_characteristics(characteristics.BOOST) for _ in range(3)),
+        return_exceptions=True,
+    )
+    await asyncio.sleep(0)
+    await sky.disconnect()
+    results = await reads
+    assert sum(isinstance(r, FreshIntelliventError) for r in results) >= 2
+
+
+@pytest.mark.asyncio
+async def test_fetch_all_concurrency_and_timings(connected):
+    sky = await connected(SimulatedSkyDevice(latency=0.05))
+    snapshot = await sky.fetch_all()
+    assert max(snapshot.timings.values()) < 0.1
+    assert snapshot.sequential_time <= snapshot.elapsed
+
+    sky = await connected(SimulatedSkyDevice(latency=0.05), concurrency=8)
+    assert sky.operations.concurrency == 8
+    snapshot = await sky.fetch_all()
+    assert max(snapshot.timings.values()) < 0.1
+    assert snapshot.elapsed < snapshot.sequential_time / 2
@@ -0,0 +1,79 @@
+import asyncio
+
+import pytest
+
+from pyfreshintellivent.fleet import FreshIntelliventFleet
+from pyfreshintellivent.modes import BoostMode, PauseMode
+from pyfreshintellivent.polling import AdaptivePollScheduler
+from pyfreshintellivent.sensors import SkySensors
+from pyfreshintellivent.simulator import SimulatedSkyDevice
+
+
+def sensors(mode, humidity=50.0, temperature=21.0):
+    return SkySensors(mode=mode, humidity=humidity, temperature=temperature)
+
+
+def test_interval_by_mode():
+    scheduler = AdaptivePollScheduler(floor=10.0, ceiling=300.0)
+    assert scheduler.interval(sensors("Off")) == 300.0
+    assert scheduler.interval(sensors("Constant speed")) == 300.0
+    assert scheduler.interval(sensors("Humidity")) == 10.0
+    assert scheduler.interval(sensors("Boost")) == 10.0
+    assert scheduler.interval(sensors("Pause")) == 155.0
+    assert scheduler.interval(sensors("Unknown")) == 155.0
+
+
+def test_interval_follows_climate_changes():
+    scheduler = AdaptivePollScheduler(floor=10.0, ceiling=300.0)
+    before = sensors("Off", humidity=50.0)
+    assert scheduler.interval(sensors("Off", humidity=55.0), None, before, 60) == 10
+    assert scheduler.interval(
+        sensors("Off", humidity=50.5), None, before, 60
+    ) == pytest.approx(155)
+    assert scheduler.interval(
+        sensors("Off", temperature=21.1), None, sensors("Off"), 60
+    ) == pytest.approx(155)
+
+
+def test_interval_capped_by_active_modes():
+    scheduler = AdaptivePollScheduler(floor=10.0, ceiling=300.0)
+    pause = {"pause": PauseMode(enabled=True, minutes=1)}
+    assert scheduler.interval(sensors("Pause"), pause) == 60.0
+    boost = {"boost": BoostMode(enabled=True, rpm=2400, seconds=5)}
+    assert scheduler.interval(sensors("Boost"), boost) == 10.0
+
+
+def test_update_and_due():
+    scheduler = AdaptivePollScheduler(floor=10.0, ceiling=300.0)
+    assert scheduler.due(["AA", "BB"], now=0.0) == ["AA", "BB"]
+    scheduler.update("AA", sensors("Off"), now=0.0)
+    scheduler.update("BB", sensors("Boost"), now=0.0)
+    assert scheduler.due(["AA", "BB"], now=20.0) == ["BB"]
+    assert scheduler.due(["AA", "BB"], now=400.0) == ["BB", "AA"]
+    scheduler.forget("AA")
+    assert scheduler.due(["AA", "BB"], now=5.0) == ["AA"]
+
+
+def test_invalid_bounds():
+    with pytest.raises(ValueError):
+        AdaptivePollScheduler(floor=60.0, ceiling=10.0)
+
+
+@pytest.mark.asyncio
+async def test_run_polls_busy_devices_more_often(simulated):
+    fleet = FreshIntelliventFleet()
+    calm = SimulatedSkyDevice(address="AA:AA:AA:AA:AA:AA")
+    busy = SimulatedSkyDevice(address="BB:BB:BB:BB:BB:BB")
+    busy.set_environment(humidity=75.0)
+    for device in (calm, busy):
+        fleet.add(simulated(device), authentication_code=device.authentication_code)
+
+    scheduler = AdaptivePollScheduler(floor=0.02, ceiling=10.0)
+    task = asyncio.create_task(scheduler.run(fleet))
+    await asyncio.sleep(0.2)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    assert fleet.snapshots[busy.address].sensors.mode == "Humidity"
+    assert busy.reads > 3 * calm.reads
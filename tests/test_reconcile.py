@@ -0,0 +1,82 @@
+import pytest
+
+from pyfreshintellivent import FreshIntelliVent, FreshIntelliventError, characteristics
+from pyfreshintellivent.modes import BoostMode
+from pyfreshintellivent.simulator import SimulatedSkyDevice
+
+
+@pytest.mark.asyncio
+async def test_reconcile_writes_only_changes(connected):
+    device = SimulatedSkyDevice()
+    sky = await connected(device)
+
+    writes = device.writes
+    written = await sky.reconcile(
+        {
+            "boost": BoostMode(enabled=True, rpm=2400, seconds=900),
+            "pause": {"minutes": 10},
+            "humidity": {"rpm": 1200},
+            "constant_speed": {"enabled": False, "rpm": 1200},
+        }
+    )
+    assert written == ["humidity", "boost"]
+    assert device.writes == writes + 2
+    assert sky.modes["humidity"].rpm == 1200
+    assert sky.modes["humidity"].detection == "Medium"
+    assert sky.modes["boost"] == BoostMode(enabled=True, rpm=2400, seconds=900)
+
+    reads = device.reads
+    assert await sky.reconcile({"humidity": {"rpm": 1200}}) == []
+    assert device.reads == reads
+
+
+@pytest.mark.asyncio
+async def test_reconcile_refreshes_stale_state(connected):
+    device = SimulatedSkyDevice()
+    sky = await connected(device)
+    await sky.fetch_all()
+
+    device.values[characteristics.PAUSE] = bytes.fromhex("010a")
+    assert await sky.reconcile({"pause": {"enabled": False}}) == []
+    assert await sky.reconcile({"pause": {"enabled": False}}, max_age=0.0) == ["pause"]
+
+
+@pytest.mark.asyncio
+async def test_reconcile_verify(connected):
+    device = SimulatedSkyDevice()
+    sky = await connected(device)
+
+    await sky.reconcile({"airing": {"minutes": 30}}, verify=True)
+    assert sky.modes["airing"].minutes == 30
+
+    original = device.write
+
+    def ignore_airing(client, uuid, data):
+        if uuid != characteristics.AIRING:
+            original(client, uuid, data)
+
+    device.write = ignore_airing
+    with pytest.raises(FreshIntelliventError, match="Failed to verify airing"):
+        await sky.reconcile({"airing": {"minutes": 45}}, verify=True)
+
+
+@pytest.mark.asyncio
+async def test_reconcile_light_and_voc(connected):
+    device = SimulatedSkyDevice()
+    sky = await connected(device)
+
+    writes = device.writes
+    assert await sky.reconcile({"light_and_voc": {"voc_detection": "Low"}}) == []
+    assert device.writes == writes
+
+    assert await sky.reconcile(
+        {"light_and_voc": {"light_detection": "Medium"}}, verify=True
+    ) == ["light_and_voc"]
+    assert device.values[characteristics.LIGHT_VOC] == bytes.fromhex("01020101")
+
+
+@pytest.mark.asyncio
+async def test_reconcile_unknown_mode():
+    sky = FreshIntelliVent(SimulatedSkyDevice().ble_device)
+    with pytest.raises(ValueError, match="Cannot reconcile temporary_speed"):
+        await sky.reconcile({"temporary_speed": {"enabled": True}})
@@ -0,0 +1,111 @@
+import pytest
+from bleak.backends.device import BLEDevice
+from bleak.backends.scanner import AdvertisementData
+
+from pyfreshintellivent import characteristics
+from pyfreshintellivent.scanner import SkyMonitor, device_filter, discover
+
+
+def advertisement(name=None, uuids=None, rssi=-60, manufacturer_data=None):
+    return AdvertisementData(
+        local_name=name,
+        manufacturer_data=manufacturer_data or {},
+        service_data={},
+        service_uuids=uuids or [],
+        tx_power=None,
+        rssi=rssi,
+        platform_data=(),
+    )
+
+
+def test_device_filter():
+    device = BLEDevice("AA:BB:CC:DD:EE:FF", "Intellivent SKY", None)
+    assert device_filter(device, advertisement()) is True
+
+    device = BLEDevice("AA:BB:CC:DD:EE:FF", "Other", None)
+    assert device_filter(device, advertisement()) is False
+    uuids = [str(characteristics.UUID_SERVICE)]
+    assert device_filter(device, advertisement(uuids=uuids)) is True
+
+
+def test_monitor_keeps_latest_advertisement():
+    seen = []
+    monitor = SkyMonitor(callback=seen.append)
+    fan = BLEDevice("AA:BB:CC:DD:EE:FF", "Intellivent SKY", None)
+    other = BLEDevice("11:22:33:44:55:66", "Other", None)
+
+    monitor._on_advertisement(fan, advertisement(rssi=-70))
+    monitor._on_advertisement(other, advertisement(rssi=-40))
+    monitor._on_advertisement(
+        fan, advertisement(rssi=-50, manufacturer_data={0x0001: b"\x01"})
+    )
+
+    assert list(monitor.devices) == ["AA:BB:CC:DD:EE:FF"]
+    latest = monitor.devices["AA:BB:CC:DD:EE:FF"]
+    assert latest.rssi == -50
+    assert latest.manufacturer_data == {0x0001: b"\x01"}
+    assert len(seen) == 2
+
+
+@pytest.mark.asyncio
+async def test_discover_stops_when_expected_found(monkeypatch):
+    fans = [
+        BLEDevice("AA:BB:CC:DD:EE:01", "Intellivent SKY", None),
+        BLEDevice("AA:BB:CC:DD:EE:02", "Intellivent SKY", None),
+        BLEDevice("AA:BB:CC:DD:EE:03", "Intellivent SKY", None),
+    ]
+
+    async def start(self):
+        for fan in [fans[0], fans[0], fans[1], fans[2]]:
+            self._on_advertisement(fan, advertisement())
+
+    async def stop(self):
+        pass
+
+    monkeypatch.setattr(SkyMonitor, "start", start)
+    monkeypatch.setattr(SkyMonitor, "stop", stop)
+
+    found = [
+        adv.address
+        async for adv in discover(
+            timeout=1.0, addresses=["aa:bb:cc:dd:ee:01", "AA:BB:CC:DD:EE:02"]
+        )
+    ]
+    assert found == ["AA:BB:CC:DD:EE:01", "AA:BB:CC:DD:EE:02"]
+
+
+def test_monitor_updates_entries_in_place():
+    monitor = SkyMonitor()
+    fan = BLEDevice("AA:BB:CC:DD:EE:FF", "Intellivent SKY", None)
+
+    monitor._on_advertisement(fan, advertisement(rssi=-70))
+    entry = monitor.devices["AA:BB:CC:DD:EE:FF"]
+    first_seen = entry.last_seen
+    monitor._on_advertisement(fan, advertisement(rssi=-45))
+
+    assert monitor.devices["AA:BB:CC:DD:EE:FF"] is entry
+    assert entry.rssi == -45
+    assert entry.last_seen >= first_seen
+
+
+@pytest.mark.asyncio
+async def test_discover_with_monitor_keeps_tracking():
+    monitor = SkyMonitor()
+    known = BLEDevice("AA:BB:CC:DD:EE:01", "Intellivent SKY", None)
+    fan = BLEDevice("AA:BB:CC:DD:EE:02", "Intellivent SKY", None)
+    monitor._on_advertisement(known, advertisement(rssi=-80))
+
+    discovered = []
+    async for adv in discover(
+        timeout=1.0, addresses=[known.address, fan.address], monitor=monitor
+    ):
+        discovered.append(adv)
+        if len(discovered) == 1:
+            monitor._on_advertisement(fan, advertisement(rssi=-70))
+
+    assert [adv.address for adv in discovered] == [known.address, fan.address]
+    assert monitor._callbacks == []
+
+    monitor._on_advertisement(fan, advertisement(rssi=-40))
+    assert discovered[1].rssi == -40
+    assert discovered[1] is monitor.devices[fan.address]
@@ -0,0 +1,100 @@
+import pytest
+from bleak.exc import BleakError
+
+import pyfreshintellivent
+from pyfreshintellivent import FreshIntelliventError, characteristics
+from pyfreshintellivent.service_cache import ServiceCache
+from pyfreshintellivent.simulator import SimulatedSkyDevice
+
+ADDRESS = "AA:BB:CC:DD:EE:FF"
+
+
+def test_service_cache_firmware():
+    cache = ServiceCache()
+    assert cache.use_cache(ADDRESS)
+    cache.add(ADDRESS.lower(), firmware="1.0")
+
+    assert cache.get(ADDRESS, firmware="1.0") is not None
+    assert cache.get(ADDRESS, firmware="2.0") is None
+
+    cache.check_firmware(ADDRESS, "1.0")
+    assert cache.use_cache(ADDRESS)
+    cache.check_firmware(ADDRESS, "2.0")
+    assert not cache.use_cache(ADDRESS)
+    assert cache.get(ADDRESS, firmware="2.0") is not None
+
+
+def test_service_cache_persists(tmp_path):
+    path = tmp_path / "services.json"
+    cache = ServiceCache(path=path)
+    cache.add(ADDRESS, firmware="1.0")
+    cache.add("11:22:33:44:55:66")
+    cache.invalidate("11:22:33:44:55:66")
+
+    loaded = ServiceCache(path=path)
+    assert loaded.get(ADDRESS).firmware == "1.0"
+    assert loaded.use_cache(ADDRESS)
+    assert not loaded.use_cache("11:22:33:44:55:66")
+
+    path.write_text("garbage", encoding="utf-8")
+    assert ServiceCache(path=path).get(ADDRESS) is None
+
+
+@pytest.mark.asyncio
+async def test_connect_uses_service_cache(monkeypatch, simulated):
+    calls = []
+    establish_connection = pyfreshintellivent.establish_connection
+
+    async def spy(*args, **kwargs):
+        calls.append(kwargs["use_services_cache"])
+        return await establish_connection(*args, **kwargs)
+
+    monkeypatch.setattr(pyfreshintellivent, "establish_connection", spy)
+    device = SimulatedSkyDevice(address=ADDRESS)
+    cache = ServiceCache()
+    sky = simulated(device, service_cache=cache)
+
+    await sky.connect()
+    await sky.fetch_device_information()
+    assert cache.get(ADDRESS, firmware="1.1.1") is not None
+    await sky.disconnect()
+
+    await sky.connect()
+    with pytest.raises(FreshIntelliventError):
+        await sky._read_characteristics(characteristics.UUID_SERVICE)
+    assert not cache.use_cache(ADDRESS)
+    await sky.disconnect()
+
+    await sky.connect()
+    assert cache.use_cache(ADDRESS)
+    assert calls == [True, True, False]
+
+
+@pytest.mark.asyncio
+async def test_transient_errors_keep_service_cache(connected):
+    device = SimulatedSkyDevice(address=ADDRESS)
+    cache = ServiceCache()
+    sky = await connected(device, authenticate=False, service_cache=cache)
+
+    cleared = []
+
+    async def clear_cache():
+        cleared.append(True)
+
+    sky._client.clear_cache = clear_cache
+    read = device.read
+
+    def failing_read(uuid):
+        raise BleakError("Operation failed")
+
+    device.read = failing_read
+    with pytest.raises(FreshIntelliventError):
+        await sky.fetch_sensor_data()
+    assert cache.use_cache(ADDRESS)
+    assert cleared == []
+
+    device.read = read
+    with pytest.raises(FreshIntelliventError):
+        await sky._read_characteristics(characteristics.UUID_SERVICE)
+    assert not cache.use_cache(ADDRESS)
+    assert cleared == [True]
@@ -0,0 +1,131 @@
+import asyncio
+
+import pytest
+
+import pyfreshintellivent
+from pyfreshintellivent import FreshIntelliventError, characteristics
+from pyfreshintellivent.simulator import SimulatedSkyDevice
+
+
+async def wait_until(condition, timeout=1.0):
+    async with asyncio.timeout(timeout):
+        while not condition():
+            await asyncio.sleep(0.005)
+
+
+@pytest.mark.asyncio
+async def test_stream_resubscribes_after_reconnect(simulated):
+    device = SimulatedSkyDevice()
+    sky = simulated(device)
+    await sky.start_session(device.authentication_code, keepalive_interval=None)
+
+    stream = sky.stream_sensors()
+    await asyncio.wait_for(anext(stream), 1.0)
+    asyncio.get_running_loop().call_later(0.01, device.set_environment, None, 22.0)
+    assert (await asyncio.wait_for(anext(stream), 1.0)).temperature == 22.0
+
+    device.drop_connection()
+    sensors = await asyncio.wait_for(anext(stream), 1.0)
+    assert sensors.authenticated is True
+
+    asyncio.get_running_loop().call_later(0.01, device.set_environment, None, 23.0)
+    assert (await asyncio.wait_for(anext(stream), 1.0)).temperature == 23.0
+    await stream.aclose()
+    await sky.disconnect()
+
+
+@pytest.mark.asyncio
+async def test_operations_wait_for_reauthentication(simulated):
+    device = SimulatedSkyDevice(latency=0.01)
+    sky = simulated(device)
+    await sky.start_session(device.authentication_code, keepalive_interval=None)
+
+    authenticate = sky.authenticate
+    updates = []
+
+    async def authenticate_with_update(authentication_code, timeout=5.0):
+        updates.append(
+            asyncio.create_task(sky.update_constant_speed(enabled=True, rpm=1200))
+        )
+        await asyncio.sleep(0.02)
+        await authenticate(authentication_code, timeout)
+
+    sky.authenticate = authenticate_with_update
+    device.drop_connection()
+    await wait_until(lambda: updates)
+    await updates[0]
+    assert (await sky.fetch_sensor_data()).rpm == 1200
+    await sky.disconnect()
+
+
+@pytest.mark.asyncio
+async def test_reconnect_survives_unexpected_errors(simulated, monkeypatch, caplog):
+    monkeypatch.setattr(pyfreshintellivent, "_RECONNECT_DELAY", 0.01)
+    device = SimulatedSkyDevice()
+    sky = simulated(device)
+    await sky.start_session(device.authentication_code, keepalive_interval=None)
+
+    connect = sky.connect
+    attempts = []
+
+    async def flaky_connect(timeout=30.0):
+        attempts.append(timeout)
+        if len(attempts) == 1:
+            raise RuntimeError("adapter went away")
+        await connect(timeout)
+
+    sky.connect = flaky_connect
+    device.drop_connection()
+    assert (await sky.fetch_sensor_data()).authenticated is True
+    assert len(attempts) == 2
+    assert "Unexpected error reconnecting" in caplog.text
+    await sky.disconnect()
+
+
+@pytest.mark.asyncio
+async def test_keepalive_reconnects_silent_link(simulated):
+    device = SimulatedSkyDevice()
+    sky = simulated(device)
+    await sky.start_session(device.authentication_code, keepalive_interval=0.01)
+    first = sky._client
+
+    read = device.read
+    failed = []
+
+    def silent_once(uuid):
+        if uuid == characteristics.DEVICE_STATUS and not failed:
+            failed.append(uuid)
+            raise asyncio.TimeoutError
+        return read(uuid)
+
+    device.read = silent_once
+    await wait_until(lambda: failed and sky.is_connected and sky._client is not first)
+    assert (await sky.fetch_sensor_data()).authenticated is True
+    await sky.disconnect()
+    assert sky._keepalive_task is None
+
+
+@pytest.mark.asyncio
+async def test_session_not_connected_after_disconnect(simulated):
+    device = SimulatedSkyDevice()
+    sky = simulated(device)
+    await sky.start_session(device.authentication_code, keepalive_interval=None)
+    await sky.disconnect()
+    with pytest.raises(FreshIntelliventError, match="Not connected"):
+        await sky.fetch_sensor_data()
+
+
+@pytest.mark.asyncio
+async def test_queued_operations_wait_for_reconnect(simulated):
+    device = SimulatedSkyDevice(latency=0.01)
+    sky = simulated(device)
+    await sky.start_session(device.authentication_code, keepalive_interval=None)
+
+    asyncio.get_running_loop().call_later(0.005, device.drop_connection)
+    results = await asyncio.gather(
+        *(sky.fetch_sensor_data() for _ in range(6)), return_exceptions=True
+    )
+    failed = [result for result in results if isinstance(result, Exception)]
+    assert len(failed) <= 1
+    assert device.disconnects == 1
+    await sky.disconnect()
@@ -0,0 +1,178 @@
+import asyncio
+import time
+
+import pytest
+
+from pyfreshintellivent import (
+    FreshIntelliventAuthenticationError,
+    FreshIntelliventError,
+)
+from pyfreshintellivent.simulator import SimulatedSkyDevice
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.mark.asyncio
+async def test_simulator_fetch_all(connected):
+    device = SimulatedSkyDevice(latency=0.01)
+    sky = await connected(device)
+
+    snapshot = await sky.fetch_all()
+    assert snapshot.sensors.authenticated is True
+    assert snapshot.sensors.mode == "Off"
+    assert snapshot.sensors.humidity == 45.0
+    assert snapshot.sensors.temperature == 21.5
+    assert snapshot.modes["humidity"].rpm == 800
+    assert snapshot.sequential_time <= snapshot.elapsed
+
+    await sky.fetch_device_information()
+    assert sky.name == "Intellivent SKY"
+    await sky.disconnect()
+    assert not sky.is_connected
+
+
+@pytest.mark.asyncio
+async def test_simulator_authentication(connected):
+    device = SimulatedSkyDevice()
+    sky = await connected(device, authenticate=False)
+
+    completed = sky.operations.completed
+    assert await sky.fetch_authentication_code() == bytearray(4)
+    device.pairing_mode = True
+    assert await sky.fetch_authentication_code() == device.authentication_code
+    assert sky.operations.completed == completed + 2
+
+    with pytest.raises(FreshIntelliventError):
+        await sky.update_constant_speed(enabled=True, rpm=1200)
+    await sky.authenticate(device.authentication_code)
+    await sky.update_constant_speed(enabled=True, rpm=1200)
+
+
+@pytest.mark.asyncio
+async def test_simulator_authentication_wrong_code(connected):
+    device = SimulatedSkyDevice(latency=0.005)
+    sky = await connected(device, authenticate=False)
+
+    start = time.monotonic()
+    with pytest.raises(FreshIntelliventAuthenticationError, match="within 0.2s"):
+        await sky.authenticate(b"\x09\x09\x09\x09", timeout=0.2)
+    elapsed = time.monotonic() - start
+    assert 0.2 <= elapsed < 0.4
+    assert device.authenticated is False
+
+
+@pytest.mark.asyncio
+async def test_simulator_state_transitions(connected):
+    clock = Clock()
+    device = SimulatedSkyDevice(clock=clock)
+    sky = await connected(device)
+
+    await sky.update_constant_speed(enabled=True, rpm=1200)
+    sensors = await sky.fetch_sensor_data()
+    assert (sensors.mode, sensors.rpm) == ("Constant speed", 1200)
+
+    device.set_environment(humidity=75.0)
+    sensors = await sky.fetch_sensor_data()
+    assert (sensors.mode, sensors.rpm) == ("Humidity", 800)
+
+    device.trigger_light()
+    assert (await sky.fetch_sensor_data()).mode == "Timer"
+
+    await sky.update_boost(enabled=True, rpm=2400, seconds=600)
+    sensors = await sky.fetch_sensor_data()
+    assert (sensors.mode, sensors.rpm) == ("Boost", 2400)
+
+    clock.now += 601
+    sensors = await sky.fetch_sensor_data()
+    assert sensors.mode == "Humidity"
+    assert (await sky.fetch_boost()).enabled is False
+
+
+@pytest.mark.asyncio
+async def test_simulator_stream_notifications(connected):
+    device = SimulatedSkyDevice()
+    sky = await connected(device)
+
+    stream = sky.stream_sensors()
+    assert (await asyncio.wait_for(anext(stream), 1.0)).temperature == 21.5
+    asyncio.get_running_loop().call_later(0.01, device.set_environment, None, 23.0)
+    sensors = await asyncio.wait_for(anext(stream), 1.0)
+    assert sensors.temperature == 23.0
+    await stream.aclose()
+
+
+@pytest.mark.asyncio
+async def test_simulator_stream_stable_device(connected):
+    device = SimulatedSkyDevice()
+    sky = await connected(device)
+
+    stream = sky.stream_sensors(max_interval=0.05)
+    first = await asyncio.wait_for(anext(stream), 1.0)
+    reads = device.reads
+    assert (await asyncio.wait_for(anext(stream), 1.0)) == first
+    assert device.reads == reads + 1
+
+    asyncio.get_running_loop().call_soon(device.set_environment, None, 23.0)
+    assert (await asyncio.wait_for(anext(stream), 1.0)).temperature == 23.0
+    assert device.reads == reads + 1
+    await stream.aclose()
+
+
+@pytest.mark.asyncio
+async def test_simulator_stream_polling_fallback(connected):
+    device = SimulatedSkyDevice(notify=False)
+    sky = await connected(device)
+
+    stream = sky.stream_sensors(min_interval=0.01, max_interval=0.01)
+    for _ in range(3):
+        await anext(stream)
+    await stream.aclose()
+    assert device.reads >= 4
+
+
+@pytest.mark.asyncio
+async def test_simulator_session_reconnects(simulated):
+    device = SimulatedSkyDevice()
+    sky = simulated(device)
+    await sky.start_session(device.authentication_code, keepalive_interval=None)
+
+    device.drop_connection()
+    assert not sky.is_connected
+    sensors = await sky.fetch_sensor_data()
+    assert sensors.authenticated is True
+    assert device.disconnects == 1
+    await sky.disconnect()
+
+
+@pytest.mark.asyncio
+async def test_simulator_fault_injection(connected):
+    device = SimulatedSkyDevice(drop_rate=1.0)
+    sky = await connected(device, authenticate=False)
+    with pytest.raises(TimeoutError):
+        await sky.fetch_sensor_data()
+    assert device.dropped == 1
+
+    device.drop_rate = 0.0
+    device.disconnect_rate = 1.0
+    with pytest.raises(FreshIntelliventError):
+        await sky.fetch_sensor_data()
+    assert not sky.is_connected
+
+
+@pytest.mark.asyncio
+async def test_simulator_coalesces_writes(connected):
+    device = SimulatedSkyDevice(latency=0.01)
+    sky = await connected(device, coalesce_window=0.02)
+
+    writes = device.writes
+    await asyncio.gather(
+        *(sky.update_temporary_speed(enabled=True, rpm=rpm) for rpm in (900, 1000))
+    )
+    assert device.writes == writes + 1
+    assert (await sky.fetch_sensor_data()).rpm == 1000
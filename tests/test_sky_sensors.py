@@ -2,12 +2,10 @@ import pytest
 
 from pyfreshintellivent.sensors import SkySensors
 
-sensors = SkySensors()
-
 
 def test_skysensors_valid():
     # TODO: Add humidity tests
-    sensors.parse_data(bytearray.fromhex("00009001CE090000E8033C0A000000"))
+    sensors = SkySensors.from_bytes(bytearray.fromhex("00009001CE090000E8033C0A000000"))
     assert sensors.status is False
     assert sensors.temperature == 25.1
     assert sensors.rpm == 1000
@@ -15,7 +13,7 @@ def test_skysensors_valid():
     assert sensors.mode == "Off"
     assert sensors.mode_raw == 0
 
-    sensors.parse_data(bytearray.fromhex("01003702E60Abd01D204040B001c00"))
+    sensors = SkySensors.from_bytes(bytearray.fromhex("01003702E60Abd01D204040B001c00"))
     assert sensors.status is True
     assert sensors.temperature == 27.9
     assert sensors.rpm == 1234
@@ -25,7 +23,7 @@ def test_skysensors_valid():
 
 
 def test_skysensors_dict():
-    sensors.parse_data(bytearray.fromhex("00009001CE090000E8033C0A000000"))
+    sensors = SkySensors.from_bytes(bytearray.fromhex("00009001CE090000E8033C0A000000"))
     dict = sensors.as_dict()
     assert dict["status"] is False
     assert dict["temperature"] == 25.1
@@ -37,51 +35,57 @@ def test_skysensors_dict():
 
 def test_skysensors_modes_known():
     # Off - 00
-    sensors.parse_data(bytearray.fromhex("000090010000000000000000000000"))
+    sensors = SkySensors.from_bytes(bytearray.fromhex("000090010000000000000000000000"))
     assert sensors.mode_raw == 0
     assert sensors.mode == "Off"
 
     # Pause - 06
-    sensors.parse_data(bytearray.fromhex("000690010000000000000000000000"))
+    sensors = SkySensors.from_bytes(bytearray.fromhex("000690010000000000000000000000"))
     assert sensors.mode_raw == 6
     assert sensors.mode == "Pause"
 
     # Constant speed - 16
-    sensors.parse_data(bytearray.fromhex("001090010000000000000000000000"))
+    sensors = SkySensors.from_bytes(bytearray.fromhex("001090010000000000000000000000"))
     assert sensors.mode_raw == 16
     assert sensors.mode == "Constant speed"
 
     # Light - 34
-    sensors.parse_data(bytearray.fromhex("002290010000000000000000000000"))
+    sensors = SkySensors.from_bytes(bytearray.fromhex("002290010000000000000000000000"))
     assert sensors.mode_raw == 34
     assert sensors.mode == "Light"
 
     # Light - 35
-    sensors.parse_data(bytearray.fromhex("002390010000000000000000000000"))
+    sensors = SkySensors.from_bytes(bytearray.fromhex("002390010000000000000000000000"))
     assert sensors.mode_raw == 35
     assert sensors.mode == "Timer"
 
     # Humidity - 49
-    sensors.parse_data(bytearray.fromhex("003190010000000000000000000000"))
+    sensors = SkySensors.from_bytes(bytearray.fromhex("003190010000000000000000000000"))
     assert sensors.mode_raw == 49
     assert sensors.mode == "Humidity"
 
     # VOC - 52
-    sensors.parse_data(bytearray.fromhex("003490010000000000000000000000"))
+    sensors = SkySensors.from_bytes(bytearray.fromhex("003490010000000000000000000000"))
     assert sensors.mode_raw == 52
     assert sensors.mode == "VOC"
 
     # Boost - 103
-    sensors.parse_data(bytearray.fromhex("006790010000000000000000000000"))
+    sensors = SkySensors.from_bytes(bytearray.fromhex("006790010000000000000000000000"))
     assert sensors.mode_raw == 103
     assert sensors.mode == "Boost"
 
 
 def test_skysensors_invalid_too_short():
     with pytest.raises(ValueError, match=r"Length need to be exactly*"):
-        sensors.parse_data(bytearray.fromhex("0000900100000000000000000000"))
+        SkySensors.from_bytes(bytearray.fromhex("0000900100000000000000000000"))
 
 
 def test_skysensors_invalid_too_long():
     with pytest.raises(ValueError, match=r"Length need to be exactly*"):
-        sensors.parse_data(bytearray.fromhex("00009001000000000000000000000000"))
+        SkySensors.from_bytes(bytearray.fromhex("00009001000000000000000000000000"))
+
+
+def test_skysensors_immutable():
+    sensors = SkySensors.from_bytes(bytearray.fromhex("00009001CE090000E8033C0A000000"))
+    with pytest.raises(AttributeError):
+        sensors.rpm = 1200
@@ -0,0 +1,68 @@
+import pytest
+
+from pyfreshintellivent import state
+from pyfreshintellivent.simulator import SimulatedSkyDevice
+from pyfreshintellivent.state import StateStore
+
+
+def test_state_ttl(monkeypatch):
+    now = 100.0
+    monkeypatch.setattr(state.time, "monotonic", lambda: now)
+    store = StateStore(ttl=5.0)
+    store.set("boost", {"enabled": True})
+    assert store.get("boost") == {"enabled": True}
+    assert store.age("boost") == 0.0
+
+    now = 105.0
+    assert store.get("boost") is None
+    assert store.as_dict() == {"boost": {"enabled": True}}
+
+
+def test_state_disabled_by_default():
+    store = StateStore()
+    store.set("pause", {"enabled": False, "minutes": 0})
+    assert store.get("pause") is None
+    assert store.as_dict() == {"pause": {"enabled": False, "minutes": 0}}
+
+
+def test_state_invalidate():
+    store = StateStore(ttl=60.0)
+    store.set("timer", 1)
+    store.set("pause", 2)
+    store.invalidate("timer")
+    assert store.get("timer") is None
+    assert store.get("pause") == 2
+    store.invalidate()
+    assert store.as_dict() == {}
+
+
+@pytest.mark.asyncio
+async def test_write_through_matches_device(connected):
+    device = SimulatedSkyDevice()
+    sky = await connected(device, cache_ttl=60.0)
+
+    await sky.update_constant_speed(enabled=True, rpm=100)
+    await sky.update_airing(enabled=True, minutes=-5, rpm=5000)
+    await sky.update_light_and_voc(
+        light_enabled=True,
+        light_detection="Low",
+        voc_enabled=True,
+        voc_detection="High",
+    )
+
+    reads = device.reads
+    cached = [
+        await sky.fetch_constant_speed(),
+        await sky.fetch_airing(),
+        await sky.fetch_light_and_voc(),
+    ]
+    assert device.reads == reads
+    assert cached[0].rpm == 800
+    assert (cached[1].minutes, cached[1].rpm) == (0, 2400)
+
+    sky.state.invalidate()
+    assert cached == [
+        await sky.fetch_constant_speed(),
+        await sky.fetch_airing(),
+        await sky.fetch_light_and_voc(),
+    ]